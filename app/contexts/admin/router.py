@@ -1,8 +1,10 @@
+from datetime import datetime
 from fastapi import APIRouter, Depends, status, Query
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing import Optional
 
-from app.core.database import get_db
+from app.core.database import get_db, get_async_db
 from app.contexts.auth.dependencies import get_current_admin
 
 # Schemas
@@ -13,6 +15,7 @@ from app.contexts.screen.schemas import (
     SeatLayoutCreate, SeatLayoutUpdate, SeatLayoutRead
 )
 from app.contexts.showtime.schemas import ShowtimeCreate, ShowtimeUpdate, ShowtimeRead
+from app.contexts.audit.schemas import AuditLogPage
 
 router = APIRouter(
     prefix="/admin",
@@ -521,7 +524,9 @@ async def admin_deactivate_user(
 ):
     """Admin deactivates a user (bans them)"""
     from app.contexts.auth.repository import AuthRepository
+    from app.contexts.auth.events import user_deactivated_event
     from app.core.errors import NotFoundError
+    from app.shared.services.event_publisher import publish_event_async
     
     repo = AuthRepository()
     user = repo.get_user_by_id(db, user_id)
@@ -531,6 +536,10 @@ async def admin_deactivate_user(
     
     user.is_active = False
     repo.save(db, user)
+
+    # Drops the cached account status, so live tokens stop working now
+    event = user_deactivated_event(user_id, reason=reason)
+    await publish_event_async(event["type"], event["payload"])
     
     return {
         "user_id": user_id,
@@ -550,4 +559,37 @@ async def admin_delete_user_profile(
     from app.contexts.user.service import UserProfileService
     service = UserProfileService()
     
-    await service.delete_profile(db, user_id)
\ No newline at end of file
+    await service.delete_profile(db, user_id)
+
+# ============================================================
+# AUDIT ADMIN ROUTES
+# ============================================================
+
+@router.get("/audit-logs", response_model=AuditLogPage)
+async def admin_search_audit_logs(
+    actor_id: Optional[int] = None,
+    action: Optional[str] = None,
+    target_type: Optional[str] = None,
+    target_id: Optional[int] = None,
+    since: Optional[datetime] = Query(None, description="Inclusive lower bound on created_at"),
+    until: Optional[datetime] = Query(None, description="Exclusive upper bound on created_at"),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    limit: int = Query(100, ge=1, le=500),
+    db: AsyncSession = Depends(get_async_db),
+    current_admin=Depends(get_current_admin),
+):
+    """Admin searches audit logs, newest first, with keyset pagination"""
+    from app.contexts.audit.service import AuditService
+    service = AuditService()
+
+    return await service.search_audit_logs(
+        db,
+        actor_id=actor_id,
+        action=action,
+        target_type=target_type,
+        target_id=target_id,
+        since=since,
+        until=until,
+        cursor=cursor,
+        limit=limit,
+    )
@@ -0,0 +1,223 @@
+# app/contexts/audit/buffer.py
+
+"""
+Buffered audit log writer.
+
+Writing an audit entry used to cost a full INSERT + COMMIT + SELECT on
+the request's hot path. In "buffered" mode (AUDIT_WRITE_MODE) entries are
+queued in memory and written in batches with one multi-row INSERT and
+one commit, whenever AUDIT_BATCH_SIZE entries are waiting or every
+AUDIT_FLUSH_INTERVAL_SECONDS. The buffer is flushed on shutdown; entries
+still queued when the process crashes are lost, so the interval bounds
+that window.
+
+The buffer is bounded (AUDIT_BUFFER_CAPACITY): when it is full, writers
+wait for the next flush instead of dropping entries. If a batch fails,
+its rows are retried one by one so a single bad row only loses itself.
+
+Rows written for an outbox event carry its event key; the key is claimed
+in processed_events in the same transaction, so a redelivered event does
+not produce a second audit row.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass, asdict
+from datetime import datetime, timezone
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from sqlalchemy import insert
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.shared.outbox.repository import ProcessedEventRepository
+
+from .models import AuditLogEntry
+
+logger = logging.getLogger(__name__)
+
+AUDIT_CONSUMER = "audit"
+
+# Row key holding the dedupe key; not a column
+EVENT_KEY = "event_key"
+
+processed_repo = ProcessedEventRepository()
+
+
+def insert_rows(db, rows: List[Dict[str, Any]]) -> int:
+    """
+    INSERT audit rows in the current transaction (no commit), skipping
+    rows whose event key was already processed. Returns the rows inserted.
+    """
+    claimed = processed_repo.claim(db, AUDIT_CONSUMER, (row[EVENT_KEY] for row in rows if row.get(EVENT_KEY)))
+
+    values = []
+    for row in rows:
+        key = row.get(EVENT_KEY)
+        if key is not None:
+            if key not in claimed:
+                continue  # Redelivered event
+            claimed.discard(key)  # Same event queued twice before a flush
+        values.append({column: value for column, value in row.items() if column != EVENT_KEY})
+
+    if values:
+        db.execute(insert(AuditLogEntry), values)
+    return len(values)
+
+
+@dataclass
+class AuditBufferMetrics:
+    buffered: int = 0
+    flushed: int = 0
+    failed: int = 0
+    flushes: int = 0
+    last_flush_ms: float = 0.0
+    max_flush_ms: float = 0.0
+    total_flush_ms: float = 0.0
+
+
+class AuditBuffer:
+    """Bounded in-memory queue of audit rows, flushed in batches."""
+
+    def __init__(
+        self,
+        capacity: int = 10_000,
+        batch_size: int = 500,
+        flush_interval: float = 1.0,
+    ):
+        self.capacity = capacity
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+        self._rows: Deque[Dict[str, Any]] = deque()
+        self._metrics = AuditBufferMetrics()
+        self._flush_lock: Optional[asyncio.Lock] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._running = False
+
+    async def add(self, row: Dict[str, Any]) -> None:
+        """Queue one audit row (column name -> value)."""
+        row.setdefault("created_at", datetime.now(timezone.utc))
+
+        while len(self._rows) >= self.capacity:
+            # Backpressure: never drop audit entries
+            await self.flush()
+
+        self._rows.append(row)
+        self._metrics.buffered += 1
+
+        if len(self._rows) >= self.batch_size and self._wakeup is not None:
+            self._wakeup.set()
+
+    async def flush(self) -> int:
+        """Write everything queued so far. Returns the number of rows written."""
+        if self._flush_lock is None:
+            self._flush_lock = asyncio.Lock()
+
+        written = 0
+        async with self._flush_lock:
+            while self._rows:
+                batch = [self._rows.popleft() for _ in range(min(self.batch_size, len(self._rows)))]
+                started = time.perf_counter()
+                batch_written, batch_failed = await asyncio.to_thread(self._write, batch)
+                self._record_flush((time.perf_counter() - started) * 1000, batch_written, batch_failed)
+                written += batch_written
+        return written
+
+    def _write(self, rows: List[Dict[str, Any]]) -> Tuple[int, int]:
+        """
+        One multi-row INSERT; falls back to row-by-row if the batch fails.
+        Runs in a worker thread, so it only returns (written, failed) and
+        leaves the metrics to the loop.
+        """
+        db = SessionLocal()
+        try:
+            try:
+                written = insert_rows(db, rows)
+                db.commit()
+                return written, 0
+            except Exception as e:
+                db.rollback()
+                batch_error = e
+
+            written = failed = 0
+            dropped_actions = set()
+            for row in rows:
+                try:
+                    written += insert_rows(db, [row])
+                    db.commit()
+                except Exception:
+                    db.rollback()
+                    failed += 1
+                    dropped_actions.add(row.get("action"))
+
+            if failed:
+                logger.error(
+                    f"❌ Audit batch of {len(rows)} failed, dropped {failed} entries "
+                    f"({', '.join(sorted(map(str, dropped_actions)))}): {batch_error}"
+                )
+            else:
+                logger.warning(f"⚠️  Audit batch of {len(rows)} failed, all rows written one by one: {batch_error}")
+            return written, failed
+        finally:
+            db.close()
+
+    def _record_flush(self, elapsed_ms: float, written: int, failed: int) -> None:
+        metrics = self._metrics
+        metrics.flushed += written
+        metrics.failed += failed
+        metrics.flushes += 1
+        metrics.last_flush_ms = elapsed_ms
+        metrics.max_flush_ms = max(metrics.max_flush_ms, elapsed_ms)
+        metrics.total_flush_ms += elapsed_ms
+
+    async def run_forever(self) -> None:
+        while self._running:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.exception(f"❌ Audit flush failed: {e}")
+
+    def start(self) -> None:
+        if self._task is not None:
+            return
+        self._wakeup = asyncio.Event()
+        self._running = True
+        self._task = asyncio.create_task(self.run_forever())
+        logger.info("📝 Audit buffer started")
+
+    async def stop(self) -> None:
+        """Stop the flusher and write whatever is still queued."""
+        if self._task is not None:
+            self._running = False
+            self._wakeup.set()
+            await self._task
+            self._task = None
+
+        written = await self.flush()
+        logger.info(f"📝 Audit buffer stopped ({written} entries flushed on shutdown)")
+
+    def metrics(self) -> Dict[str, Any]:
+        data = asdict(self._metrics)
+        total_flush_ms = data.pop("total_flush_ms")
+        flushes = self._metrics.flushes
+        data["depth"] = len(self._rows)
+        data["capacity"] = self.capacity
+        data["avg_flush_ms"] = round(total_flush_ms / flushes, 3) if flushes else 0.0
+        return data
+
+
+audit_buffer = AuditBuffer(
+    capacity=settings.AUDIT_BUFFER_CAPACITY,
+    batch_size=settings.AUDIT_BATCH_SIZE,
+    flush_interval=settings.AUDIT_FLUSH_INTERVAL_SECONDS,
+)
@@ -1,8 +1,8 @@
 # app/contexts/audit/handlers.py
 
-from app.core.database import SessionLocal
 from app.core.event_bus import event_bus
 
+from .models import SYSTEM_ACTOR_ID
 from .service import AuditService
 
 # Create service instance
@@ -10,91 +10,90 @@ audit_service = AuditService()
 
 
 async def on_reservation_created(payload: dict):
-    db = SessionLocal()
-    try:
-        await audit_service.write_audit_log(  
-            db=db,
+    await audit_service.write_audit_log(
+        actor_id=payload.get("user_id"),
+        actor_type="user",
+        action="reservation.created",
+        target_type="reservation",
+        target_id=payload["reservation_id"],
+        payload=payload,
+        event_id=payload.get("event_id"),
+    )
+
+
+async def on_reservation_batch_created(payload: dict):
+    # Keep one audit entry per reservation, as for single bookings
+    for item in payload["reservations"]:
+        await audit_service.write_audit_log(
             actor_id=payload.get("user_id"),
             actor_type="user",
             action="reservation.created",
             target_type="reservation",
-            target_id=payload["reservation_id"],
-            payload=payload,
+            target_id=item["reservation_id"],
+            payload={
+                "user_id": payload.get("user_id"),
+                "showtime_id": payload.get("showtime_id"),
+                **item,
+            },
+            event_id=payload.get("event_id"),
         )
-    finally:
-        db.close()
 
 
 async def on_reservation_cancelled(payload: dict):
-    db = SessionLocal()
-    try:
-        await audit_service.write_audit_log(  
-            db=db,
-            actor_id=payload.get("user_id"),
-            actor_type="user",
-            action="reservation.cancelled",
-            target_type="reservation",
-            target_id=payload["reservation_id"],
-            payload=payload,
-        )
-    finally:
-        db.close()
+    await audit_service.write_audit_log(
+        actor_id=payload.get("user_id"),
+        actor_type="user",
+        action="reservation.cancelled",
+        target_type="reservation",
+        target_id=payload["reservation_id"],
+        payload=payload,
+        event_id=payload.get("event_id"),
+    )
 
 
 async def on_payment_succeeded(payload: dict):
-    db = SessionLocal()
-    try:
-        user_id = payload.get("user_id")
-        
-        await audit_service.write_audit_log(  
-            db=db,
-            actor_id=user_id,
-            actor_type="user",
-            action="payment.succeeded",
-            target_type="order",
-            target_id=payload["order_id"],
-            payload=payload,
-        )
-    finally:
-        db.close()
+    user_id = payload.get("user_id")
+
+    await audit_service.write_audit_log(
+        actor_id=user_id,
+        actor_type="user",
+        action="payment.succeeded",
+        target_type="order",
+        target_id=payload["order_id"],
+        payload=payload,
+        event_id=payload.get("event_id"),
+    )
 
 
 async def on_payment_failed(payload: dict):
-    db = SessionLocal()
-    try:
-        user_id = payload.get("user_id")
-        
-        await audit_service.write_audit_log(  
-            db=db,
-            actor_id=user_id,
-            actor_type="user",
-            action="payment.failed",
-            target_type="order",
-            target_id=payload["order_id"],
-            payload=payload,
-        )
-    finally:
-        db.close()
+    user_id = payload.get("user_id")
+
+    await audit_service.write_audit_log(
+        actor_id=user_id,
+        actor_type="user",
+        action="payment.failed",
+        target_type="order",
+        target_id=payload["order_id"],
+        payload=payload,
+        event_id=payload.get("event_id"),
+    )
 
 
 async def on_refund_issued(payload: dict):
-    db = SessionLocal()
-    try:
-        await audit_service.write_audit_log(  
-            db=db,
-            actor_id=None,
-            actor_type="system",
-            action="refund.issued",
-            target_type="refund",
-            target_id=payload["refund_id"],
-            payload=payload,
-        )
-    finally:
-        db.close()
+    await audit_service.write_audit_log(
+        actor_id=SYSTEM_ACTOR_ID,
+        actor_type="system",
+        action="refund.issued",
+        target_type="refund",
+        target_id=payload["refund_id"],
+        payload=payload,
+        event_id=payload.get("event_id"),
+    )
 
 
-event_bus.subscribe("reservation.created", on_reservation_created)
-event_bus.subscribe("reservation.cancelled", on_reservation_cancelled)
-event_bus.subscribe("payment.succeeded", on_payment_succeeded)
-event_bus.subscribe("payment.failed", on_payment_failed)
-event_bus.subscribe("refund.issued", on_refund_issued)
\ No newline at end of file
+event_bus.subscribe("reservation.created", on_reservation_created, group="audit")
+event_bus.subscribe("reservation.batch_created", on_reservation_batch_created, group="audit")
+event_bus.subscribe("reservation.cancelled", on_reservation_cancelled, group="audit")
+event_bus.subscribe("payment.succeeded", on_payment_succeeded, group="audit", after=["order"])
+event_bus.subscribe("payment.failed", on_payment_failed, group="audit", after=["order"])
+event_bus.subscribe("refund.issued", on_refund_issued, group="audit")
\ No newline at end of file
@@ -5,12 +5,18 @@ from sqlalchemy import (
     Integer,
     String,
     DateTime,
-    JSON
+    JSON,
+    Index,
 )
 
 from app.core.base import Base 
 
+# actor_id of entries written by the system itself (actor_type "system")
+SYSTEM_ACTOR_ID = 0
+
 class AuditLogEntry(Base):
+    # Range-partitioned by created_at month (see audit/retention.py);
+    # the table's primary key is (id, created_at), id alone stays unique.
     __tablename__ = "audit_logs"
 
     id = Column(Integer, primary_key=True, index=True)
@@ -33,4 +39,12 @@ class AuditLogEntry(Base):
         DateTime(timezone=True),
         nullable=False,
         default=lambda: datetime.now(timezone.utc)
-    )
\ No newline at end of file
+    )
+
+    # Audit queries: newest first, keyset on (created_at, id), per filter
+    __table_args__ = (
+        Index("ix_audit_logs_created_at_id", "created_at", "id"),
+        Index("ix_audit_logs_actor_created", "actor_id", "created_at", "id"),
+        Index("ix_audit_logs_action_created", "action", "created_at", "id"),
+        Index("ix_audit_logs_target_created", "target_type", "target_id", "created_at", "id"),
+    )
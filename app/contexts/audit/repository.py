@@ -1,11 +1,55 @@
 # app/contexts/audit/repository.py
 
+from datetime import datetime
+from typing import Optional, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from sqlalchemy import select
+from sqlalchemy import select, tuple_
 
 from .models import AuditLogEntry
 
 
+def search_stmt(
+    *,
+    actor_id: Optional[int] = None,
+    action: Optional[str] = None,
+    target_type: Optional[str] = None,
+    target_id: Optional[int] = None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    after: Optional[Tuple[datetime, int]] = None,
+    limit: int = 100,
+):
+    """
+    Filtered audit query, newest first. `after` is the (created_at, id)
+    of the last row of the previous page: a keyset seek on the
+    (..., created_at, id) indexes instead of an OFFSET scan.
+    """
+    stmt = select(AuditLogEntry)
+
+    if actor_id is not None:
+        stmt = stmt.where(AuditLogEntry.actor_id == actor_id)
+    if action is not None:
+        stmt = stmt.where(AuditLogEntry.action == action)
+    if target_type is not None:
+        stmt = stmt.where(AuditLogEntry.target_type == target_type)
+    if target_id is not None:
+        stmt = stmt.where(AuditLogEntry.target_id == target_id)
+    if since is not None:
+        stmt = stmt.where(AuditLogEntry.created_at >= since)
+    if until is not None:
+        stmt = stmt.where(AuditLogEntry.created_at < until)
+    if after is not None:
+        stmt = stmt.where(tuple_(AuditLogEntry.created_at, AuditLogEntry.id) < tuple_(*after))
+
+    return (
+        stmt
+        .order_by(AuditLogEntry.created_at.desc(), AuditLogEntry.id.desc())
+        .limit(limit)
+    )
+
+
 class AuditRepository:
 
     def create(
@@ -38,3 +82,34 @@ class AuditRepository:
             .offset(offset)
         )
         return db.scalars(stmt).all()
+
+
+class AsyncAuditRepository:
+
+    async def get_by_id(
+        self,
+        db: AsyncSession,
+        entry_id: int
+    ) -> AuditLogEntry | None:
+        return await db.get(AuditLogEntry, entry_id)
+
+    async def search(
+        self,
+        db: AsyncSession,
+        **filters,
+    ) -> list[AuditLogEntry]:
+        return (await db.scalars(search_stmt(**filters))).all()
+
+    async def list(
+        self,
+        db: AsyncSession,
+        limit: int = 100,
+        offset: int = 0
+    ) -> list[AuditLogEntry]:
+        stmt = (
+            select(AuditLogEntry)
+            .order_by(AuditLogEntry.created_at.desc())
+            .limit(limit)
+            .offset(offset)
+        )
+        return (await db.scalars(stmt)).all()
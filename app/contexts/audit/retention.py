@@ -0,0 +1,303 @@
+# app/contexts/audit/retention.py
+
+"""
+Audit log partition maintenance.
+
+audit_logs is partitioned by UTC month (audit_logs_pYYYY_MM, plus
+audit_logs_default for anything outside them). This job keeps
+AUDIT_PARTITION_PREMAKE_MONTHS partitions ready ahead of time, so
+inserts never land in the default partition. If some did (the job was
+down, or entries were backdated), a plain CREATE ... PARTITION OF would
+fail for that month; those rows are moved out of the default partition
+in the same transaction that creates the month.
+
+It also retires months older than AUDIT_RETENTION_MONTHS:
+
+    1. DETACH the partition (the live table stops seeing it at once)
+    2. export its rows to AUDIT_ARCHIVE_DIR/audit_logs_YYYY_MM.jsonl.gz
+    3. DROP the detached table
+
+Each step is safe to repeat: a partition that was detached but not yet
+archived (crash in between) is picked up again on the next run. Expired
+rows in the default partition are exported to
+audit_logs_default_<timestamp>.jsonl.gz and deleted.
+
+Run once from the command line with:
+    python -m app.contexts.audit.retention
+"""
+
+import asyncio
+import gzip
+import json
+import logging
+import os
+import re
+from datetime import date, datetime, timezone
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.utils import utcnow
+
+logger = logging.getLogger(__name__)
+
+PARTITION_PATTERN = re.compile(r"^audit_logs_p(\d{4})_(\d{2})$")
+
+DEFAULT_PARTITION = "audit_logs_default"
+
+EXPORT_COLUMNS = (
+    "id", "actor_id", "actor_type", "action", "target_id",
+    "target_type", "payload", "request_id", "created_at",
+)
+
+
+def add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    return f"audit_logs_p{month:%Y_%m}"
+
+
+class AuditRetention:
+    """Creates upcoming monthly partitions and archives expired ones."""
+
+    def __init__(
+        self,
+        retention_months: int = 12,
+        premake_months: int = 3,
+        archive_dir: str = "archive/audit",
+        interval: float = 21600.0,
+        export_batch_size: int = 5000,
+    ):
+        self.retention_months = retention_months
+        self.premake_months = premake_months
+        self.archive_dir = Path(archive_dir)
+        self.interval = interval
+        self.export_batch_size = export_batch_size
+
+        self._task: Optional[asyncio.Task] = None
+        self._stop: Optional[asyncio.Event] = None
+
+    # ----- partitions -----
+
+    def list_partitions(self, db: Session) -> List[Tuple[str, date, bool]]:
+        """(name, month, attached) of every monthly audit table, oldest first."""
+        rows = db.execute(text("""
+            SELECT c.relname, i.inhparent IS NOT NULL AS attached
+            FROM pg_class c
+            LEFT JOIN pg_inherits i ON i.inhrelid = c.oid
+            WHERE c.relkind = 'r' AND c.relname LIKE 'audit_logs_p%'
+        """)).all()
+
+        partitions = []
+        for name, attached in rows:
+            match = PARTITION_PATTERN.match(name)
+            if match:
+                partitions.append((name, date(int(match[1]), int(match[2]), 1), attached))
+        return sorted(partitions, key=lambda partition: partition[1])
+
+    def ensure_partitions(self, db: Session, now: datetime) -> List[str]:
+        """Create the current month's partition and the next few. Returns the new ones."""
+        existing = {name for name, _, _ in self.list_partitions(db)}
+        current = now.astimezone(timezone.utc).date().replace(day=1)
+
+        created = []
+        for offset in range(self.premake_months + 1):
+            month = add_months(current, offset)
+            name = partition_name(month)
+            if name in existing:
+                continue
+            try:
+                self._create_partition(db, name, month)
+            except Exception as e:
+                db.rollback()
+                # Inserts for this month keep landing in the default partition until it exists
+                logger.error(f"❌ Could not create audit partition {name}, retrying next run: {e}")
+                continue
+            created.append(name)
+        return created
+
+    def _create_partition(self, db: Session, name: str, month: date) -> None:
+        """Create one month, first moving any of its rows out of the default partition."""
+        bounds = (
+            f"FROM ('{month:%Y-%m-%d} 00:00:00+00') "
+            f"TO ('{add_months(month, 1):%Y-%m-%d} 00:00:00+00')"
+        )
+        in_month = {
+            "start": datetime(month.year, month.month, 1, tzinfo=timezone.utc),
+            "end": datetime.combine(add_months(month, 1), datetime.min.time(), timezone.utc),
+        }
+        stranded = db.execute(
+            text(f"SELECT count(*) FROM {DEFAULT_PARTITION} WHERE created_at >= :start AND created_at < :end"),
+            in_month,
+        ).scalar()
+
+        if not stranded:
+            db.execute(text(f"CREATE TABLE {name} PARTITION OF audit_logs FOR VALUES {bounds}"))
+            db.commit()
+            logger.info(f"🗂️ Created audit partition {name}")
+            return
+
+        # Build the month as a standalone table, move the rows in, then attach
+        # it; ATTACH checks the default partition, which no longer has them
+        columns = ", ".join(EXPORT_COLUMNS)
+        db.execute(text(f"CREATE TABLE {name} (LIKE audit_logs INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"))
+        moved = db.execute(
+            text(
+                f"WITH moved AS ("
+                f"DELETE FROM {DEFAULT_PARTITION} WHERE created_at >= :start AND created_at < :end "
+                f"RETURNING {columns}) "
+                f"INSERT INTO {name} ({columns}) SELECT {columns} FROM moved"
+            ),
+            in_month,
+        ).rowcount
+        db.execute(text(f"ALTER TABLE audit_logs ATTACH PARTITION {name} FOR VALUES {bounds}"))
+        db.commit()
+        logger.warning(f"⚠️ Created audit partition {name} and moved {moved} stranded entries into it from {DEFAULT_PARTITION}")
+
+    # ----- archival -----
+
+    def archive_expired(self, db: Session, now: datetime) -> List[Path]:
+        """Detach, export and drop every partition older than the retention window."""
+        cutoff = add_months(now.astimezone(timezone.utc).date().replace(day=1), -self.retention_months)
+
+        archived = []
+        for name, month, attached in self.list_partitions(db):
+            if month >= cutoff:
+                break
+            if attached:
+                db.execute(text(f"ALTER TABLE audit_logs DETACH PARTITION {name}"))
+                db.commit()
+                logger.info(f"🗂️ Detached audit partition {name}")
+
+            path = self._export(db, name, self.archive_dir / f"audit_logs_{month:%Y_%m}.jsonl.gz")
+            db.commit()  # End the read transaction before the DROP
+            db.execute(text(f"DROP TABLE {name}"))
+            db.commit()
+            archived.append(path)
+            logger.info(f"🗄️ Archived audit partition {name} to {path}")
+
+        path = self._archive_default(db, cutoff, now)
+        if path is not None:
+            archived.append(path)
+        return archived
+
+    def _archive_default(self, db: Session, cutoff: date, now: datetime) -> Optional[Path]:
+        """Export and delete default-partition rows older than the retention window."""
+        expired = "created_at < :cutoff"
+        params = {"cutoff": datetime.combine(cutoff, datetime.min.time(), timezone.utc)}
+        if not db.execute(text(f"SELECT count(*) FROM {DEFAULT_PARTITION} WHERE {expired}"), params).scalar():
+            db.commit()
+            return None
+
+        # Block writes to the default partition so the DELETE removes exactly what was exported
+        db.execute(text(f"LOCK TABLE {DEFAULT_PARTITION} IN EXCLUSIVE MODE"))
+        path = self._export(
+            db,
+            DEFAULT_PARTITION,
+            self.archive_dir / f"{DEFAULT_PARTITION}_{now.astimezone(timezone.utc):%Y%m%dT%H%M%S}.jsonl.gz",
+            where=expired,
+            params=params,
+        )
+        deleted = db.execute(text(f"DELETE FROM {DEFAULT_PARTITION} WHERE {expired}"), params).rowcount
+        db.commit()
+        logger.info(f"🗄️ Archived {deleted} expired entries from {DEFAULT_PARTITION} to {path}")
+        return path
+
+    def _export(
+        self,
+        db: Session,
+        name: str,
+        path: Path,
+        where: Optional[str] = None,
+        params: Optional[dict] = None,
+    ) -> Path:
+        """Stream a table's rows to gzipped JSON lines (written to a temp file, then renamed)."""
+        self.archive_dir.mkdir(parents=True, exist_ok=True)
+        partial = path.with_name(path.name + ".partial")
+
+        query = f"SELECT {', '.join(EXPORT_COLUMNS)} FROM {name}"
+        if where:
+            query += f" WHERE {where}"
+        result = db.execute(
+            text(f"{query} ORDER BY id"),
+            params or {},
+            execution_options={"yield_per": self.export_batch_size},
+        )
+
+        with open(partial, "wb") as raw:
+            with gzip.GzipFile(fileobj=raw, mode="wb") as archive:
+                for row in result.mappings():
+                    archive.write((json.dumps(dict(row), default=_json_default) + "\n").encode())
+            raw.flush()
+            os.fsync(raw.fileno())
+
+        os.replace(partial, path)
+        return path
+
+    # ----- job -----
+
+    def run_once(self) -> List[Path]:
+        db = SessionLocal()
+        try:
+            now = utcnow()
+            self.ensure_partitions(db, now)
+            return self.archive_expired(db, now)
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    async def run_forever(self) -> None:
+        while not self._stop.is_set():
+            try:
+                await asyncio.to_thread(self.run_once)
+            except Exception as e:
+                logger.exception(f"❌ Audit retention run failed: {e}")
+
+            try:
+                await asyncio.wait_for(self._stop.wait(), timeout=self.interval)
+            except asyncio.TimeoutError:
+                pass
+
+    def start(self) -> None:
+        if self._task is not None:
+            return
+        self._stop = asyncio.Event()
+        self._task = asyncio.create_task(self.run_forever())
+        logger.info("🗂️ Audit retention job started")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._stop.set()
+        await self._task
+        self._task = None
+        logger.info("🗂️ Audit retention job stopped")
+
+
+def _json_default(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError(f"Cannot serialize {type(value).__name__}")
+
+
+audit_retention = AuditRetention(
+    retention_months=settings.AUDIT_RETENTION_MONTHS,
+    premake_months=settings.AUDIT_PARTITION_PREMAKE_MONTHS,
+    archive_dir=settings.AUDIT_ARCHIVE_DIR,
+    interval=settings.AUDIT_RETENTION_INTERVAL_SECONDS,
+)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    for archive_path in audit_retention.run_once():
+        print(archive_path)
@@ -0,0 +1,26 @@
+# app/contexts/audit/schemas.py
+
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel
+
+
+class AuditLogRead(BaseModel):
+    id: int
+    actor_id: Optional[int] = None
+    actor_type: str
+    action: str
+    target_type: str
+    target_id: int
+    payload: Dict[str, Any]
+    request_id: Optional[int] = None
+    created_at: datetime
+
+    model_config = {"from_attributes": True}
+
+
+class AuditLogPage(BaseModel):
+    """Newest first; pass next_cursor back as `cursor` for the next page."""
+    items: List[AuditLogRead]
+    next_cursor: Optional[str] = None
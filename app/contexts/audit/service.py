@@ -1,18 +1,33 @@
+import asyncio
+import base64
+from datetime import datetime
+from typing import Optional, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from .models import AuditLogEntry
-from .repository import AuditRepository
+from app.core.config import settings
+from app.core.errors import ValidationError
+from app.core.unit_of_work import event_session
+
+from .buffer import EVENT_KEY, audit_buffer, insert_rows
+from .models import SYSTEM_ACTOR_ID, AuditLogEntry
+from .repository import AuditRepository, AsyncAuditRepository
+from .schemas import AuditLogPage, AuditLogRead
 
 
 class AuditService:
     """Service for Audit business logic."""
     
-    def __init__(self):
+    def __init__(self, write_mode: str = settings.AUDIT_WRITE_MODE):
         self.repo = AuditRepository()
+        self.async_repo = AsyncAuditRepository()
+        self.buffer = audit_buffer
+        self.write_mode = write_mode  # "buffered" or "direct"
     
     async def write_audit_log(
         self,
-        db: Session,
+        db: Session | None = None,
         *,
         actor_id: int | None,
         actor_type: str,
@@ -21,19 +36,48 @@ class AuditService:
         target_id: int,
         payload: dict,
         request_id: int | None = None,
-    ) -> AuditLogEntry:
-        """Write an audit log entry."""
-        entry = AuditLogEntry(
-            actor_id=actor_id,
-            actor_type=actor_type,
-            action=action,
-            target_type=target_type,
-            target_id=target_id,
-            payload=payload,
-            request_id=request_id
-        )
+        event_id: str | None = None,
+    ) -> None:
+        """
+        Write an audit log entry.
+
+        In buffered mode the entry is queued and written by the audit
+        buffer's next batch; in direct mode it is inserted and committed
+        right away, using `db` or a session of its own.
+
+        Pass the outbox event_id when auditing an event: a redelivered
+        event is then written only once (per target). Without an actor_id
+        the entry is recorded as SYSTEM_ACTOR_ID.
+        """
+        fields = {
+            "actor_id": actor_id if actor_id is not None else SYSTEM_ACTOR_ID,
+            "actor_type": actor_type,
+            "action": action,
+            "target_type": target_type,
+            "target_id": target_id,
+            "payload": payload,
+            "request_id": request_id,
+        }
+
+        if event_id is not None:
+            fields[EVENT_KEY] = f"{event_id}:{target_type}:{target_id}"
+
+        if self.write_mode == "buffered":
+            await self.buffer.add(fields)
+            return None
+
+        if db is not None:
+            return self._write_direct(db, fields)
+
+        return await asyncio.to_thread(self._write_direct_in_event_session, fields)
+
+    def _write_direct(self, db: Session, fields: dict) -> None:
+        insert_rows(db, [fields])
+        db.commit()
 
-        return self.repo.create(db, entry)
+    def _write_direct_in_event_session(self, fields: dict) -> None:
+        with event_session() as db:
+            self._write_direct(db, fields)
     
     # ===== READ OPERATIONS (sync) =====
     
@@ -48,4 +92,55 @@ class AuditService:
         offset: int = 0
     ) -> list[AuditLogEntry]:
         """List audit logs with pagination."""
-        return self.repo.list(db, limit=limit, offset=offset)
\ No newline at end of file
+        return self.repo.list(db, limit=limit, offset=offset)
+
+    # ===== QUERY API (async) =====
+
+    async def search_audit_logs(
+        self,
+        db: AsyncSession,
+        *,
+        actor_id: Optional[int] = None,
+        action: Optional[str] = None,
+        target_type: Optional[str] = None,
+        target_id: Optional[int] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+    ) -> AuditLogPage:
+        """One page of matching audit logs, newest first, plus the cursor for the next one."""
+        entries = await self.async_repo.search(
+            db,
+            actor_id=actor_id,
+            action=action,
+            target_type=target_type,
+            target_id=target_id,
+            since=since,
+            until=until,
+            after=self.decode_cursor(cursor) if cursor else None,
+            limit=limit + 1,  # One extra row tells whether there is a next page
+        )
+
+        next_cursor = None
+        if len(entries) > limit:
+            entries = entries[:limit]
+            next_cursor = self.encode_cursor(entries[-1])
+
+        return AuditLogPage(
+            items=[AuditLogRead.model_validate(entry) for entry in entries],
+            next_cursor=next_cursor,
+        )
+
+    @staticmethod
+    def encode_cursor(entry: AuditLogEntry) -> str:
+        raw = f"{entry.created_at.isoformat()}|{entry.id}"
+        return base64.urlsafe_b64encode(raw.encode()).decode()
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+        try:
+            created_at, entry_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+            return datetime.fromisoformat(created_at), int(entry_id)
+        except Exception:
+            raise ValidationError("Invalid audit log cursor", {"cursor": cursor})
@@ -4,22 +4,29 @@ from sqlalchemy.orm import Session
 from jose import JWTError
 
 from app.core.database import get_db
+from app.core.utils import utcnow
 from app.contexts.auth.security import decode_token
 from .service import AuthService
-from .repository import AuthRepository
+from .repository import RefreshTokenRepository
+from .revocation import session_revocations
+from .token_cache import (
+    AuthenticatedUser,
+    TokenClaims,
+    get_user_status,
+    token_cache,
+)
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
 
-user_repo = AuthRepository()
+refresh_token_repo = RefreshTokenRepository()
 
 
-def get_current_user(
-    token: str = Depends(oauth2_scheme),
-    db: Session = Depends(get_db),
-):
-    """
-    Extracts the authenticated user from the JWT token.
-    """
+def _verify_access_token(token: str) -> TokenClaims:
+    """Verified claims of an access token; the signature is checked once per token."""
+    claims = token_cache.get(token)
+    if claims is not None:
+        return claims
+
     try:
         payload = decode_token(token)
         user_id = int(payload.get("sub"))
@@ -30,25 +37,68 @@ def get_current_user(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid token type",
             )
-    except (JWTError, ValueError, KeyError):
+        claims = TokenClaims(
+            user_id=user_id,
+            token_version=int(payload.get("token_version", 0)),
+            expires_at=float(payload["exp"]),
+            session_id=payload.get("sid"),
+        )
+    except (JWTError, ValueError, KeyError, TypeError):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Could not validate credentials",
             headers={"WWW-Authenticate": "Bearer"},
         )
-    
-    user = user_repo.get_user_by_id(db, user_id)
-    if not user or not user.is_active:
+
+    token_cache.put_claims(token, claims)
+    return claims
+
+
+def get_current_user(
+    token: str = Depends(oauth2_scheme),
+    db: Session = Depends(get_db),
+) -> AuthenticatedUser:
+    """
+    Extracts the authenticated user from the JWT token.
+    Cached tokens and account status make this query-free in the common case.
+    """
+    claims = _verify_access_token(token)
+
+    user_status = get_user_status(db, claims.user_id)
+    if not user_status or not user_status.is_active:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="User inactive or not found",
         )
+
+    if claims.token_version != user_status.token_version:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Token has been revoked",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    # Per-device logout: the token's session may have been revoked
+    session_id = claims.session_id
+    if session_id and session_revocations.is_revoked(
+        session_id,
+        lambda: refresh_token_repo.is_session_revoked(db, session_id, utcnow()),
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Session has been logged out",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
     
-    return user
+    return AuthenticatedUser(
+        id=claims.user_id,
+        user_type=user_status.user_type,
+        token_version=user_status.token_version,
+    )
 
 
 def get_current_admin(
-    current_user = Depends(get_current_user),
+    current_user: AuthenticatedUser = Depends(get_current_user),
 ):
     """
     Only admins can access admin endpoints.
@@ -32,4 +32,25 @@ def user_deactivated_event(user_id: int, reason: str = "admin_action") -> dict:
             "user_id": user_id,
             "reason": reason,
         },
-    }
\ No newline at end of file
+    }
+
+
+def token_version_bumped_event(user_id: int, token_version: int) -> dict:
+    return {
+        "type": "auth.token_version_bumped",
+        "payload": {
+            "user_id": user_id,
+            "token_version": token_version,
+        },
+    }
+
+
+def session_revoked_event(user_id: int, session_id: str, reason: str = "logout") -> dict:
+    return {
+        "type": "auth.session_revoked",
+        "payload": {
+            "user_id": user_id,
+            "session_id": session_id,
+            "reason": reason,
+        },
+    }
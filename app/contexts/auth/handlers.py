@@ -1,9 +1,17 @@
 # app/contexts/auth/handlers.py
+import logging
 
 from sqlalchemy.orm import Session
-from app.core.database import SessionLocal
+from app.core.unit_of_work import event_session
+from app.core.broadcast import broadcast
 from app.core.event_bus import event_bus
 from app.contexts.auth.repository import AuthRepository
+from app.contexts.auth.events import user_deactivated_event
+from app.contexts.auth.revocation import SESSION_REVOCATIONS_CHANNEL
+from app.contexts.auth.token_cache import USER_STATUS_CHANNEL
+from app.shared.services.event_publisher import publish_event_async
+
+logger = logging.getLogger(__name__)
 
 auth_repo = AuthRepository()
 
@@ -18,21 +26,44 @@ async def on_admin_force_deactivate(payload: dict):
     if not user_id:
         return
     
-    db = SessionLocal()
-    try:
-        user = auth_repo.get_user_by_id(db, user_id)
+    with event_session() as db:
+        try:
+            user = auth_repo.get_user_by_id(db, user_id)
         
-        if user:
-            user.is_active = False
-            auth_repo.save(db, user)
+            if user:
+                user.is_active = False
+                auth_repo.save(db, user)
         
-        db.commit()
-    except Exception as e:
-        db.rollback()
-        print(f"Error deactivating user {user_id}: {e}")
-    finally:
-        db.close()
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.exception(f"❌ Failed to deactivate user {user_id}: {e}")
+            return
+
+    event = user_deactivated_event(user_id, reason=payload.get("reason", "admin_action"))
+    await publish_event_async(event["type"], event["payload"])
+
+
+async def on_user_status_changed(payload: dict):
+    """
+    Handles auth.user_deactivated and auth.token_version_bumped.
+    Drops the cached account status in every worker, so the next request
+    re-reads it.
+    """
+    await broadcast.publish(USER_STATUS_CHANNEL, {"user_id": payload["user_id"]})
+
+
+async def on_session_revoked(payload: dict):
+    """
+    Handles auth.session_revoked.
+    The session's access tokens are rejected, in every worker, from the
+    next request on.
+    """
+    await broadcast.publish(SESSION_REVOCATIONS_CHANNEL, {"session_id": payload["session_id"]})
 
 
 # Event subscriptions
-event_bus.subscribe("admin.user_force_deactivate", on_admin_force_deactivate)
\ No newline at end of file
+event_bus.subscribe("admin.user_force_deactivate", on_admin_force_deactivate, blocking=True)
+event_bus.subscribe("auth.user_deactivated", on_user_status_changed)
+event_bus.subscribe("auth.token_version_bumped", on_user_status_changed)
+event_bus.subscribe("auth.session_revoked", on_session_revoked)
\ No newline at end of file
@@ -0,0 +1,110 @@
+# app/contexts/auth/hashing.py
+
+"""
+Bounded executor for password hashing.
+
+A bcrypt hash or verify takes ~100-300ms of CPU. Run inline in an async
+route it froze the event loop for every other request. Hashing now runs
+on a dedicated pool of AUTH_HASH_WORKERS threads (bcrypt releases the
+GIL, so threads hash in parallel), separate from the default executor
+used by sync routes and asyncio.to_thread.
+
+At most AUTH_HASH_MAX_PENDING hashes may be running or queued. Beyond
+that, new logins are rejected with 503 + Retry-After: queueing them
+would only make every waiting login time out.
+
+verify_and_update() also returns a new hash when the stored one was made
+with different cost parameters (AUTH_BCRYPT_ROUNDS), so login can
+upgrade it transparently.
+"""
+
+import asyncio
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from fastapi import HTTPException, status
+
+from app.core.config import settings
+
+from .security import pwd_context
+
+logger = logging.getLogger(__name__)
+
+
+class PasswordHasher:
+    """Runs pwd_context calls on a size-limited thread pool."""
+
+    def __init__(self, workers: int = 4, max_pending: int = 64):
+        self.workers = workers
+        self.max_pending = max_pending
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="password-hash")
+
+        self._pending = 0  # Running + queued; only touched on the event loop
+        self._completed = 0
+        self._rejected = 0
+        self._total_wait_ms = 0.0
+        self._total_hash_ms = 0.0
+
+    async def _run(self, fn: Callable, *args) -> Any:
+        if self._pending >= self.max_pending:
+            self._rejected += 1
+            logger.warning(f"⚠️  Password hashing saturated ({self._pending} pending), rejecting")
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Too many concurrent sign-ins, please retry shortly",
+                headers={"Retry-After": "1"},
+            )
+
+        submitted = time.perf_counter()
+        timings = {}
+
+        def timed():
+            started = time.perf_counter()
+            timings["wait"] = started - submitted
+            try:
+                return fn(*args)
+            finally:
+                timings["hash"] = time.perf_counter() - started
+
+        self._pending += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, timed)
+        finally:
+            self._pending -= 1
+            self._completed += 1
+            self._total_wait_ms += timings.get("wait", 0.0) * 1000
+            self._total_hash_ms += timings.get("hash", 0.0) * 1000
+
+    async def hash(self, password: str) -> str:
+        return await self._run(pwd_context.hash, password)
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        return await self._run(pwd_context.verify, password, hashed_password)
+
+    async def verify_and_update(self, password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+        """(valid, new_hash); new_hash is set when the stored hash should be replaced."""
+        return await self._run(pwd_context.verify_and_update, password, hashed_password)
+
+    def metrics(self) -> Dict[str, Any]:
+        completed = self._completed or 1
+        return {
+            "workers": self.workers,
+            "pending": self._pending,
+            "queued": max(0, self._pending - self.workers),
+            "max_pending": self.max_pending,
+            "completed": self._completed,
+            "rejected": self._rejected,
+            "avg_wait_ms": round(self._total_wait_ms / completed, 3),
+            "avg_hash_ms": round(self._total_hash_ms / completed, 3),
+        }
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+password_hasher = PasswordHasher(
+    workers=settings.AUTH_HASH_WORKERS,
+    max_pending=settings.AUTH_HASH_MAX_PENDING,
+)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, func, Boolean
+from sqlalchemy import Column, Integer, String, DateTime, func, Boolean, ForeignKey, Index
 
 from app.core.base import Base 
 
@@ -21,4 +21,49 @@ class UserCredential(Base):
 
     token_version = Column(Integer, nullable=False, default=0)
     
-    user_type = Column(String, nullable=False, default="user")
\ No newline at end of file
+    user_type = Column(String, nullable=False, default="user")
+
+
+class RefreshToken(Base):
+    """
+    One issued refresh token. Tokens rotated from the same login share a
+    family_id (the session); a refresh token is usable exactly once.
+    """
+    __tablename__ = "refresh_tokens"
+
+    jti = Column(String(32), primary_key=True)
+
+    family_id = Column(String(32), nullable=False)
+
+    user_id = Column(Integer, ForeignKey("user_credentials.id", ondelete="CASCADE"), nullable=False)
+
+    expires_at = Column(DateTime(timezone=True), nullable=False)
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    revoked_at = Column(DateTime(timezone=True), nullable=True)
+
+    replaced_by = Column(String(32), nullable=True)
+
+    __table_args__ = (
+        Index("ix_refresh_tokens_family_id", "family_id"),
+        Index("ix_refresh_tokens_user_id", "user_id"),
+    )
+
+
+class RevokedSession(Base):
+    """
+    A logged-out (or compromised) session. Rows are only needed until the
+    session's last access token expires.
+    """
+    __tablename__ = "revoked_sessions"
+
+    family_id = Column(String(32), primary_key=True)
+
+    user_id = Column(Integer, nullable=False)
+
+    reason = Column(String, nullable=False)
+
+    revoked_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    expires_at = Column(DateTime(timezone=True), nullable=False, index=True)
@@ -1,5 +1,10 @@
+from datetime import datetime
+from typing import List
+
+from sqlalchemy import select, update, delete
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from .models import UserCredential
+from .models import UserCredential, RefreshToken, RevokedSession
 
 class AuthRepository:  
 
@@ -36,4 +41,91 @@ class AuthRepository:
         db.add(user_credential)
         db.commit()
         db.refresh(user_credential)
-        return user_credential
\ No newline at end of file
+        return user_credential
+
+
+class RefreshTokenRepository:
+
+    def create(self, db: Session, token: RefreshToken) -> RefreshToken:
+        db.add(token)
+        db.commit()
+        return token
+
+    def get(self, db: Session, jti: str) -> RefreshToken | None:
+        return db.get(RefreshToken, jti)
+
+    def rotate(self, db: Session, jti: str, replacement: RefreshToken, now: datetime) -> bool:
+        """
+        Spend a refresh token and register its replacement, atomically.
+        The conditional UPDATE lets exactly one of two concurrent refreshes
+        win; False means the token was unknown, expired or already used.
+        """
+        stmt = (
+            update(RefreshToken)
+            .where(
+                RefreshToken.jti == jti,
+                RefreshToken.revoked_at.is_(None),
+                RefreshToken.expires_at > now,
+            )
+            .values(revoked_at=now, replaced_by=replacement.jti)
+            .returning(RefreshToken.jti)
+        )
+        if db.execute(stmt).scalar_one_or_none() is None:
+            db.rollback()
+            return False
+
+        db.add(replacement)
+        db.commit()
+        return True
+
+    def revoke_family(
+        self,
+        db: Session,
+        *,
+        family_id: str,
+        user_id: int,
+        reason: str,
+        now: datetime,
+        session_expires_at: datetime,
+    ) -> None:
+        """Revoke every live token of a session and record the session as revoked."""
+        db.execute(
+            update(RefreshToken)
+            .where(RefreshToken.family_id == family_id, RefreshToken.revoked_at.is_(None))
+            .values(revoked_at=now)
+        )
+        db.merge(RevokedSession(
+            family_id=family_id,
+            user_id=user_id,
+            reason=reason,
+            revoked_at=now,
+            expires_at=session_expires_at,
+        ))
+        db.commit()
+
+    def is_session_revoked(self, db: Session, family_id: str, now: datetime) -> bool:
+        stmt = select(RevokedSession.family_id).where(
+            RevokedSession.family_id == family_id,
+            RevokedSession.expires_at > now,
+        )
+        return db.execute(stmt).first() is not None
+
+    def list_revoked_sessions(self, db: Session, now: datetime) -> List[str]:
+        stmt = select(RevokedSession.family_id).where(RevokedSession.expires_at > now)
+        return list(db.scalars(stmt))
+
+    def delete_expired(self, db: Session, now: datetime) -> None:
+        """Drop registry rows nothing can present any more."""
+        db.execute(delete(RevokedSession).where(RevokedSession.expires_at <= now))
+        db.execute(delete(RefreshToken).where(RefreshToken.expires_at <= now))
+        db.commit()
+
+
+class AsyncAuthRepository:
+
+    async def get_user_by_id(self, db: AsyncSession, user_id: int):
+        return await db.get(UserCredential, user_id)
+
+    async def get_user_by_email(self, db: AsyncSession, email: str):
+        stmt = select(UserCredential).where(UserCredential.email == email)
+        return (await db.scalars(stmt)).first()
@@ -0,0 +1,180 @@
+# app/contexts/auth/revocation.py
+
+"""
+Revoked-session filter.
+
+Access tokens carry their session id ("sid", the refresh token family).
+Logging a device out revokes its session, and get_current_user has to
+reject that session's access tokens until they expire. Looking each
+sid up in revoked_sessions would put a query back on every request, so
+the revoked sids are kept in an in-memory bloom filter:
+
+- not in the filter: not revoked, no query (the common case)
+- in the filter: checked against the table once (false positives run
+  at about AUTH_REVOCATION_BLOOM_ERROR_RATE), and the answer remembered
+
+The auth.session_revoked handler adds a revocation to the filter of
+every worker through app.core.broadcast. A worker that is not listening
+for broadcasts could miss one, so until it listens (again) it checks
+every sid against the table, and it rebuilds the filter once it does.
+The filter is also rebuilt every AUTH_REVOCATION_RELOAD_SECONDS, which
+prunes expired registry rows.
+"""
+
+import asyncio
+import hashlib
+import logging
+import math
+from typing import Callable, Iterable, Optional, Set
+
+from app.core.broadcast import broadcast
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.utils import utcnow
+
+from .repository import RefreshTokenRepository
+
+logger = logging.getLogger(__name__)
+
+SESSION_REVOCATIONS_CHANNEL = "auth_session_revocations"
+
+
+class BloomFilter:
+    """Fixed-size bloom filter over strings (double hashing on one blake2b digest)."""
+
+    def __init__(self, capacity: int, error_rate: float):
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, key: str) -> Iterable[int]:
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hashes))
+
+    def add(self, key: str) -> None:
+        for position in self._positions(key):
+            self.bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, key: str) -> bool:
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+
+class SessionRevocationFilter:
+    """Bloom filter of revoked session ids, rebuilt from revoked_sessions."""
+
+    def __init__(self, capacity: int = 100_000, error_rate: float = 0.001, reload_interval: float = 60.0):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.reload_interval = reload_interval
+        self.repo = RefreshTokenRepository()
+
+        self._bloom = BloomFilter(capacity, error_rate)
+        self._confirmed: Set[str] = set()
+        self._false_positives: Set[str] = set()
+        self._added_during_reload: Optional[Set[str]] = None
+        self._task: Optional[asyncio.Task] = None
+        self._stop: Optional[asyncio.Event] = None
+        self._wakeup: Optional[asyncio.Event] = None
+
+    def add(self, session_id: str) -> None:
+        self._bloom.add(session_id)
+        self._confirmed.add(session_id)
+        self._false_positives.discard(session_id)
+        if self._added_during_reload is not None:
+            self._added_during_reload.add(session_id)
+
+    def is_revoked(self, session_id: str, confirm: Callable[[], bool]) -> bool:
+        """confirm() checks the table; it only runs when the filter says "maybe"."""
+        if not broadcast.synced:
+            # Could have missed a revocation: always ask the table
+            return confirm()
+        if session_id not in self._bloom:
+            return False
+        if session_id in self._confirmed:
+            return True
+        if session_id in self._false_positives:
+            return False
+        if confirm():
+            self._confirmed.add(session_id)
+            return True
+        self._false_positives.add(session_id)
+        return False
+
+    def reload(self) -> int:
+        """Rebuild the filter from the table. Returns the number of revoked sessions."""
+        self._added_during_reload = set()
+        db = SessionLocal()
+        try:
+            now = utcnow()
+            self.repo.delete_expired(db, now)
+            session_ids = self.repo.list_revoked_sessions(db, now)
+        except Exception:
+            self._added_during_reload = None
+            raise
+        finally:
+            db.close()
+
+        # Grow past the configured capacity rather than let false positives climb
+        bloom = BloomFilter(max(self.capacity, 2 * len(session_ids)), self.error_rate)
+        for session_id in session_ids:
+            bloom.add(session_id)
+
+        # Keep revocations that arrived while the table was being read
+        added, self._added_during_reload = self._added_during_reload, None
+        for session_id in added:
+            bloom.add(session_id)
+
+        # Swap in one step; readers see either the old or the new set
+        self._bloom, self._confirmed = bloom, set(session_ids) | added
+        self._false_positives = set()
+        return len(session_ids)
+
+    def request_reload(self) -> None:
+        """Rebuild the filter now rather than at the next interval."""
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def run_forever(self) -> None:
+        while not self._stop.is_set():
+            self._wakeup.clear()
+            try:
+                await asyncio.to_thread(self.reload)
+            except Exception as e:
+                logger.exception(f"❌ Revoked session reload failed: {e}")
+
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.reload_interval)
+            except asyncio.TimeoutError:
+                pass
+
+    def start(self) -> None:
+        if self._task is not None:
+            return
+        self._stop = asyncio.Event()
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.create_task(self.run_forever())
+        logger.info("🔐 Session revocation filter started")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._stop.set()
+        self._wakeup.set()
+        await self._task
+        self._task = None
+
+
+session_revocations = SessionRevocationFilter(
+    capacity=settings.AUTH_REVOCATION_BLOOM_CAPACITY,
+    error_rate=settings.AUTH_REVOCATION_BLOOM_ERROR_RATE,
+    reload_interval=settings.AUTH_REVOCATION_RELOAD_SECONDS,
+)
+
+
+def _on_session_revoked(message: dict) -> None:
+    session_revocations.add(message["session_id"])
+
+
+broadcast.subscribe(SESSION_REVOCATIONS_CHANNEL, _on_session_revoked, on_resync=session_revocations.request_reload)
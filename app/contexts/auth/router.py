@@ -59,17 +59,33 @@ async def login(  # Made async!
 
 
 # -----------------------------------------------------------
-# Refresh (stays sync - no events)
+# Refresh (rotates the refresh token)
 # -----------------------------------------------------------
 
 @router.post(
     "/refresh",
     response_model=TokenResponse,
 )
-def refresh(
+async def refresh(
     payload: RefreshTokenRequest,
     db: Session = Depends(get_db),
 ):
     auth_service = AuthService()
-    token = auth_service.refresh_tokens(db, payload.refresh_token)
-    return token
\ No newline at end of file
+    token = await auth_service.refresh_tokens(db, payload.refresh_token)
+    return token
+
+
+# -----------------------------------------------------------
+# Logout (this device's session only)
+# -----------------------------------------------------------
+
+@router.post(
+    "/logout",
+    status_code=status.HTTP_204_NO_CONTENT,
+)
+async def logout(
+    payload: RefreshTokenRequest,
+    db: Session = Depends(get_db),
+):
+    auth_service = AuthService()
+    await auth_service.logout(db, payload.refresh_token)
\ No newline at end of file
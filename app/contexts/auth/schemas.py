@@ -31,6 +31,8 @@ class TokenPayload(BaseModel):
     token_version: int
     exp: Optional[datetime] = None
     iat: Optional[datetime] = None
+    jti: Optional[str] = None    # refresh tokens: registry id
+    sid: Optional[str] = None    # session (refresh token family)
 
 
 class UserCredentialResponse(BaseModel):
@@ -1,6 +1,6 @@
 # app/core/security.py
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from jose import jwt, JWTError
 from passlib.context import CryptContext
@@ -11,6 +11,10 @@ from app.core.config import settings
 pwd_context = CryptContext(
     schemes=["bcrypt"],
     deprecated="auto",
+    bcrypt__rounds=settings.AUTH_BCRYPT_ROUNDS,
+    # Hashes made with any other cost are upgraded on the next login
+    bcrypt__min_rounds=settings.AUTH_BCRYPT_ROUNDS,
+    bcrypt__max_rounds=settings.AUTH_BCRYPT_ROUNDS,
 )
 
 
@@ -32,26 +36,31 @@ def _build_token_payload(
     token_type: str,
     token_version: int,
     expires_delta: timedelta,
+    session_id: Optional[str] = None,
 ) -> Dict[str, Any]:
     now = datetime.now(timezone.utc)
     expire = now + expires_delta
 
-    return {
+    payload = {
         "sub": str(user_id),
         "type": token_type,
         "token_version": token_version,
         "iat": now,
         "exp": expire,
     }
+    if session_id is not None:
+        payload["sid"] = session_id
+    return payload
 
 
-def create_access_token(*, user_id: int, token_version: int = 0) -> str:
+def create_access_token(*, user_id: int, token_version: int = 0, session_id: Optional[str] = None) -> str:
     """
     Creates a short-lived access token.
     
     Args:
         user_id: The user's ID to encode in the token
         token_version: Token version for invalidation (default 0)
+        session_id: Refresh token family the token belongs to ("sid")
     
     Returns:
         Encoded JWT access token string
@@ -61,17 +70,28 @@ def create_access_token(*, user_id: int, token_version: int = 0) -> str:
         token_type="access",
         token_version=token_version,
         expires_delta=timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES),
+        session_id=session_id,
     )
     return jwt.encode(payload, settings.SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
 
 
-def create_refresh_token(*, user_id: int, token_version: int = 0) -> str:
+def create_refresh_token(
+    *,
+    user_id: int,
+    token_version: int = 0,
+    jti: Optional[str] = None,
+    session_id: Optional[str] = None,
+    expires_at: Optional[datetime] = None,
+) -> str:
     """
     Creates a long-lived refresh token.
     
     Args:
         user_id: The user's ID to encode in the token
         token_version: Token version for invalidation (default 0)
+        jti: Registry id of this token (see RefreshToken)
+        session_id: Refresh token family the token belongs to ("sid")
+        expires_at: Expiry recorded in the registry (default: REFRESH_TOKEN_EXPIRE_DAYS from now)
     
     Returns:
         Encoded JWT refresh token string
@@ -80,8 +100,13 @@ def create_refresh_token(*, user_id: int, token_version: int = 0) -> str:
         user_id=user_id,
         token_type="refresh",
         token_version=token_version,
-        expires_delta=timedelta(days=7),  # 7 days for refresh
+        expires_delta=timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS),
+        session_id=session_id,
     )
+    if expires_at is not None:
+        payload["exp"] = expires_at
+    if jti is not None:
+        payload["jti"] = jti
     return jwt.encode(payload, settings.SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
 
 
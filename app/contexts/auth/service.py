@@ -1,25 +1,37 @@
-from typing import Tuple
+import hashlib
+import logging
+import uuid
+from datetime import timedelta
+from typing import Optional, Tuple
 
 from fastapi import HTTPException, status
 from jose import JWTError
 from pydantic import ValidationError
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
+from app.core.config import settings
+from app.core.utils import utcnow
 from app.contexts.auth.schemas import SignUpRequest, TokenResponse, TokenPayload
+from .hashing import password_hasher
 from .security import (
-    hash_password,
-    verify_password,
     create_access_token,
     create_refresh_token,
     decode_token,
 )
-from app.contexts.auth.repository import AuthRepository
+from .token_cache import get_user_status
+from app.contexts.auth.models import RefreshToken
+from app.contexts.auth.repository import AuthRepository, RefreshTokenRepository
 from app.contexts.auth.events import (
     user_registered_event,
     user_logged_in_event,
+    token_version_bumped_event,
+    session_revoked_event,
 )
 from app.shared.services.event_publisher import publish_event_async  # Changed!
 
+logger = logging.getLogger(__name__)
+
 
 class AuthService:
     """
@@ -27,10 +39,12 @@ class AuthService:
     - registration
     - login
     - token refresh
+    - logout / session revocation
     """
 
     def __init__(self):
         self.repo = AuthRepository()
+        self.refresh_repo = RefreshTokenRepository()
 
     # -------------------------------------------------------
     # Registration
@@ -44,7 +58,7 @@ class AuthService:
                 detail="Email already registered",
             )
 
-        hashed = hash_password(payload.password)
+        hashed = await password_hasher.hash(payload.password)
         user = self.repo.create_user(db, email=payload.email, hashed_password=hashed)
         
         # Emit event
@@ -57,19 +71,24 @@ class AuthService:
     # Login
     # -------------------------------------------------------
 
-    def authenticate_user(self, db: Session, email: str, password: str):
-        """This stays sync - just validation logic"""
+    async def authenticate_user(self, db: Session, email: str, password: str):
+        """Checks the password off the event loop; re-hashes it if the cost settings changed."""
         user = self.repo.get_user_by_email(db, email)
         if not user:
             return None
 
-        if not verify_password(password, user.hashed_password):
+        valid, new_hash = await password_hasher.verify_and_update(password, user.hashed_password)
+        if not valid:
             return None
 
+        if new_hash:
+            user.hashed_password = new_hash
+            self.repo.save(db, user)
+
         return user
 
     async def login(self, db: Session, email: str, password: str) -> TokenResponse:  # Made async!
-        user = self.authenticate_user(db, email, password)
+        user = await self.authenticate_user(db, email, password)
         if not user:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
@@ -78,6 +97,7 @@ class AuthService:
             )
 
         access_token, refresh_token = self._issue_token_pair(
+            db,
             user_id=user.id,
             token_version=user.token_version,
         )
@@ -92,61 +112,182 @@ class AuthService:
         )
 
     # -------------------------------------------------------
-    # Refresh (stays sync - no events)
+    # Refresh (rotation with reuse detection)
     # -------------------------------------------------------
 
-    def refresh_tokens(self, db: Session, refresh_token: str) -> TokenResponse:
-        try:
-            payload_dict = decode_token(refresh_token)
-            payload = TokenPayload(**payload_dict)
-        except (JWTError, ValidationError):
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid refresh token",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
-
-        if payload.type != "refresh":
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid token type for refresh",
-            )
+    async def refresh_tokens(self, db: Session, refresh_token: str) -> TokenResponse:
+        payload = self._decode_refresh_token(refresh_token)
 
-        user = self.repo.get_user_by_id(db, payload.sub)
-        if not user:
+        user_status = get_user_status(db, payload.sub)
+        if not user_status or not user_status.is_active:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="User not found",
             )
 
         # Check token_version invariant
-        if payload.token_version != user.token_version:
+        if payload.token_version != user_status.token_version:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Token has been revoked",
             )
 
-        access_token, new_refresh_token = self._issue_token_pair(
-            user_id=user.id,
-            token_version=user.token_version,
+        if not payload.jti or not payload.sid:
+            payload = self._adopt_legacy_refresh_token(db, refresh_token, payload)
+
+        tokens = self._issue_token_pair(
+            db,
+            user_id=payload.sub,
+            token_version=user_status.token_version,
+            session_id=payload.sid,
+            replaces=payload.jti,
         )
+        if tokens is None:
+            stored = self.refresh_repo.get(db, payload.jti)
+            if stored is not None and stored.revoked_at is not None:
+                # A spent token came back: it was stolen or replayed. End the session.
+                logger.warning(f"⚠️  Refresh token reuse for user {payload.sub}, revoking session {payload.sid}")
+                await self._revoke_session(db, payload.sub, payload.sid, reason="reuse")
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Token has been revoked",
+            )
 
+        access_token, new_refresh_token = tokens
         return TokenResponse(
             access_token=access_token,
             refresh_token=new_refresh_token,
         )
 
+    # -------------------------------------------------------
+    # Logout (this device only)
+    # -------------------------------------------------------
+
+    async def logout(self, db: Session, refresh_token: str) -> None:
+        payload = self._decode_refresh_token(refresh_token)
+        if not payload.jti or not payload.sid:
+            payload = self._adopt_legacy_refresh_token(db, refresh_token, payload)
+        await self._revoke_session(db, payload.sub, payload.sid, reason="logout")
+
+    # -------------------------------------------------------
+    # Revocation
+    # -------------------------------------------------------
+
+    async def revoke_all_sessions(self, db: Session, user_id: int) -> int:
+        """Invalidate every access and refresh token of a user. Returns the new token_version."""
+        user = self.repo.get_user_by_id(db, user_id)
+        if not user:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="User not found",
+            )
+
+        user.token_version += 1
+        self.repo.save(db, user)
+
+        event = token_version_bumped_event(user.id, user.token_version)
+        await publish_event_async(event["type"], event["payload"])
+
+        return user.token_version
+
     # -------------------------------------------------------
     # Internal helpers
     # -------------------------------------------------------
 
-    def _issue_token_pair(self, *, user_id: int, token_version: int) -> Tuple[str, str]:
+    def _issue_token_pair(
+        self,
+        db: Session,
+        *,
+        user_id: int,
+        token_version: int,
+        session_id: Optional[str] = None,
+        replaces: Optional[str] = None,
+    ) -> Optional[Tuple[str, str]]:
+        """
+        Issue an access/refresh pair and register the refresh token. A new
+        login starts a session; a refresh (`replaces`) spends the old token
+        and returns None if it was already spent.
+        """
+        session_id = session_id or uuid.uuid4().hex
+        registered = RefreshToken(
+            jti=uuid.uuid4().hex,
+            family_id=session_id,
+            user_id=user_id,
+            expires_at=utcnow() + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS),
+        )
+
+        if replaces is None:
+            self.refresh_repo.create(db, registered)
+        elif not self.refresh_repo.rotate(db, replaces, registered, utcnow()):
+            return None
+
         access_token = create_access_token(
             user_id=user_id,
             token_version=token_version,
+            session_id=session_id,
         )
         refresh_token = create_refresh_token(
             user_id=user_id,
             token_version=token_version,
+            jti=registered.jti,
+            session_id=session_id,
+            expires_at=registered.expires_at,
         )
-        return access_token, refresh_token
\ No newline at end of file
+        return access_token, refresh_token
+
+    def _adopt_legacy_refresh_token(self, db: Session, refresh_token: str, payload: TokenPayload) -> TokenPayload:
+        """
+        Register a refresh token issued before the registry existed (no jti
+        or sid) as the start of a new session, so it rotates like any
+        other: usable once, treated as reuse after that. Its registry id is
+        derived from the token, so every presentation maps to the same row.
+        """
+        jti = hashlib.blake2b(refresh_token.encode(), digest_size=16).hexdigest()
+        stored = self.refresh_repo.get(db, jti)
+        if stored is None:
+            try:
+                stored = self.refresh_repo.create(db, RefreshToken(
+                    jti=jti,
+                    family_id=uuid.uuid4().hex,
+                    user_id=payload.sub,
+                    expires_at=payload.exp or utcnow() + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS),
+                ))
+            except IntegrityError:
+                # A concurrent request registered it first
+                db.rollback()
+                stored = self.refresh_repo.get(db, jti)
+
+        return payload.model_copy(update={"jti": stored.jti, "sid": stored.family_id})
+
+    def _decode_refresh_token(self, refresh_token: str) -> TokenPayload:
+        try:
+            payload_dict = decode_token(refresh_token)
+            payload = TokenPayload(**payload_dict)
+        except (JWTError, ValidationError):
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid refresh token",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+
+        if payload.type != "refresh":
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid token type for refresh",
+            )
+        return payload
+
+    async def _revoke_session(self, db: Session, user_id: int, session_id: str, reason: str) -> None:
+        now = utcnow()
+        self.refresh_repo.revoke_family(
+            db,
+            family_id=session_id,
+            user_id=user_id,
+            reason=reason,
+            now=now,
+            # The session's access tokens are the last thing that can still be used
+            session_expires_at=now + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES),
+        )
+
+        event = session_revoked_event(user_id, session_id, reason)
+        await publish_event_async(event["type"], event["payload"])
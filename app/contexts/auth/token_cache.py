@@ -0,0 +1,188 @@
+# app/contexts/auth/token_cache.py
+
+"""
+Caches behind get_current_user.
+
+Authenticating a request used to decode and HMAC-verify the JWT, then
+load the UserCredential row just to read is_active. Two bounded LRU
+caches make the common case free:
+
+- VerifiedTokenCache: access token -> its verified claims. An entry
+  never outlives the token's own exp.
+- UserStatusCache: user id -> is_active / token_version / user_type.
+  The auth.user_deactivated and auth.token_version_bumped handler
+  invalidates the entry in every worker through app.core.broadcast.
+
+get_current_user runs in the threadpool, so both caches are guarded by a
+lock. A worker that is not listening for broadcasts could miss an
+invalidation, so until it listens (again) it reads the status from the
+database on every request, and it drops every entry once it does.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Dict, Generic, Optional, Tuple, TypeVar
+
+from app.core.broadcast import broadcast
+from app.core.config import settings
+
+from .repository import AuthRepository
+
+V = TypeVar("V")
+
+USER_STATUS_CHANNEL = "auth_user_status"
+
+
+@dataclass(frozen=True)
+class TokenClaims:
+    user_id: int
+    token_version: int
+    expires_at: float  # Epoch seconds (the JWT's exp)
+    session_id: Optional[str] = None  # "sid": refresh token family
+
+
+@dataclass(frozen=True)
+class UserStatus:
+    is_active: bool
+    token_version: int
+    user_type: str
+
+    @classmethod
+    def from_user(cls, user) -> "UserStatus":
+        return cls(is_active=user.is_active, token_version=user.token_version, user_type=user.user_type)
+
+
+@dataclass(frozen=True)
+class AuthenticatedUser:
+    """What get_current_user returns: enough for authorization, no ORM row."""
+    id: int
+    user_type: str
+    token_version: int
+
+
+class _TTLCache(Generic[V]):
+    """Thread-safe LRU whose entries expire at a per-entry deadline (monotonic clock)."""
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[object, Tuple[float, V]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key) -> Optional[V]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            deadline, value = entry
+            if time.monotonic() >= deadline:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def put(self, key, value: V, ttl: Optional[float] = None) -> None:
+        with self._lock:
+            self._store(key, value, ttl)
+
+    def _store(self, key, value: V, ttl: Optional[float]) -> None:
+        ttl = self.ttl_seconds if ttl is None else min(ttl, self.ttl_seconds)
+        if ttl <= 0:
+            return
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def pop(self, key) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class VerifiedTokenCache(_TTLCache[TokenClaims]):
+    """Access token string -> verified claims."""
+
+    def put_claims(self, token: str, claims: TokenClaims) -> None:
+        self.put(token, claims, ttl=claims.expires_at - time.time())
+
+
+class UserStatusCache(_TTLCache[UserStatus]):
+    """User id -> account status, dropped when the account changes."""
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        super().__init__(max_entries, ttl_seconds)
+        # Bumped on every invalidation, so a load that raced one is not cached
+        self._generations: Dict[int, int] = {}
+        self._epoch = 0  # Bumped when every entry is dropped
+
+    def generation(self, user_id: int) -> int:
+        """Take before reading from the database; pass to put_status()."""
+        return self._epoch + self._generations.get(user_id, 0)
+
+    def put_status(self, user_id: int, status: UserStatus, generation: int) -> None:
+        with self._lock:
+            if self.generation(user_id) == generation:
+                self._store(user_id, status, None)
+
+    def get_or_load(self, user_id: int, load: Callable[[], Optional[UserStatus]]) -> Optional[UserStatus]:
+        """Cached status, or load() it (from the database) and cache the result."""
+        if not broadcast.synced:
+            # Could have missed an invalidation: always ask the database
+            return load()
+
+        user_status = self.get(user_id)
+        if user_status is not None:
+            return user_status
+
+        generation = self.generation(user_id)
+        user_status = load()
+        if user_status is not None:
+            self.put_status(user_id, user_status, generation)
+        return user_status
+
+    def invalidate(self, user_id: Optional[int] = None) -> None:
+        with self._lock:
+            if user_id is None:
+                self._epoch += 1
+                self._entries.clear()
+            else:
+                self._generations[user_id] = self._generations.get(user_id, 0) + 1
+                self._entries.pop(user_id, None)
+
+
+_user_repo = AuthRepository()
+
+token_cache = VerifiedTokenCache(
+    max_entries=settings.AUTH_TOKEN_CACHE_SIZE,
+    ttl_seconds=settings.AUTH_TOKEN_CACHE_TTL_SECONDS,
+)
+
+user_status_cache = UserStatusCache(
+    max_entries=settings.AUTH_USER_CACHE_SIZE,
+    ttl_seconds=settings.AUTH_USER_CACHE_TTL_SECONDS,
+)
+
+
+def _on_user_status_changed(message: dict) -> None:
+    user_status_cache.invalidate(message["user_id"])
+
+
+broadcast.subscribe(USER_STATUS_CHANNEL, _on_user_status_changed, on_resync=user_status_cache.invalidate)
+
+
+def get_user_status(db, user_id: int) -> Optional[UserStatus]:
+    """Cached account status; loads the credential row on a miss."""
+    def load() -> Optional[UserStatus]:
+        user = _user_repo.get_user_by_id(db, user_id)
+        return UserStatus.from_user(user) if user else None
+
+    return user_status_cache.get_or_load(user_id, load)
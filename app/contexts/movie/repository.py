@@ -1,4 +1,5 @@
 # app/contexts/movie/repository.py
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from sqlalchemy import select
 from .models import Movie
@@ -40,4 +41,32 @@ class MovieRepository:
     def delete(self, db: Session, movie: Movie):
         """Delete a movie."""
         db.delete(movie)
-        db.commit()
\ No newline at end of file
+        db.commit()
+
+
+class AsyncMovieRepository:
+    """Async repository for Movie aggregate."""
+
+    async def get_by_id(self, db: AsyncSession, movie_id: int):
+        """Get movie by ID."""
+        return await db.get(Movie, movie_id)
+
+    async def get_by_title(self, db: AsyncSession, title: str):
+        """Get movie by title."""
+        return (await db.scalars(
+            select(Movie).where(Movie.title == title)
+        )).first()
+
+    async def list_all(self, db: AsyncSession, active_only: bool = True):
+        """List all movies, optionally filtering by active status."""
+        stmt = select(Movie)
+        if active_only:
+            stmt = stmt.where(Movie.is_active == True)
+        return (await db.scalars(stmt)).all()
+
+    async def save(self, db: AsyncSession, movie: Movie):
+        """Create or update a movie."""
+        db.add(movie)
+        await db.commit()
+        await db.refresh(movie)
+        return movie
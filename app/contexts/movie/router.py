@@ -1,8 +1,9 @@
 # app/contexts/movie/router.py
 from fastapi import APIRouter, Depends, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.core.database import get_db
+from app.core.database import get_db, get_async_db
 from app.core.errors import NotFoundError
 from app.contexts.auth.dependencies import get_current_user  
 
@@ -38,19 +39,19 @@ async def create_movie_route(
 
 # LIST MOVIES
 @router.get("/", response_model=list[MovieRead])
-def list_movies_route(
-    db: Session = Depends(get_db),
+async def list_movies_route(
+    db: AsyncSession = Depends(get_async_db),
 ):
-    return movie_service.list_movies(db) 
+    return await movie_service.list_movies_async(db)
 
 
 # GET MOVIE BY ID
 @router.get("/{movie_id}", response_model=MovieRead)
-def get_movie_route(
+async def get_movie_route(
     movie_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
-    return movie_service.get_movie(db, movie_id)  
+    return await movie_service.get_movie_async(db, movie_id)
 
 
 # UPDATE MOVIE
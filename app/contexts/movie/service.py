@@ -1,3 +1,4 @@
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from sqlalchemy import select
 from datetime import datetime, timezone
@@ -8,7 +9,7 @@ from app.shared.services.event_publisher import publish_event_async
 from .models import Movie
 from app.contexts.showtime.models import Showtime
 from .schemas import MovieCreate, MovieUpdate
-from .repository import MovieRepository
+from .repository import MovieRepository, AsyncMovieRepository
 from .events import (
     movie_created_event,
     movie_updated_event,
@@ -22,6 +23,7 @@ class MovieService:
     
     def __init__(self):
         self.repo = MovieRepository()
+        self.async_repo = AsyncMovieRepository()
     
     async def create_movie(self, db: Session, data: MovieCreate, user_id: int = None) -> Movie:
         """Create a new movie."""
@@ -129,4 +131,15 @@ class MovieService:
     
     def list_movies(self, db: Session, active_only: bool = True):
         """List all movies (read operation, can stay sync)."""
-        return self.repo.list_all(db, active_only=active_only)
\ No newline at end of file
+        return self.repo.list_all(db, active_only=active_only)
+
+    async def get_movie_async(self, db: AsyncSession, movie_id: int) -> Movie:
+        """Get movie by ID without blocking the event loop."""
+        movie = await self.async_repo.get_by_id(db, movie_id)
+        if not movie:
+            raise NotFoundError("Movie not found")
+        return movie
+
+    async def list_movies_async(self, db: AsyncSession, active_only: bool = True):
+        """List all movies without blocking the event loop."""
+        return await self.async_repo.list_all(db, active_only=active_only)
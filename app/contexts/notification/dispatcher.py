@@ -0,0 +1,330 @@
+# app/contexts/notification/dispatcher.py
+
+"""
+Notification delivery pipeline.
+
+Event handlers only enqueue emails; a small pool of worker tasks
+delivers them. Each worker takes up to NOTIFICATION_BATCH_SIZE queued
+emails and sends them over one pooled connection in a worker thread, so
+SMTP latency never blocks the event loop. Failed emails are re-queued
+with exponential backoff, up to NOTIFICATION_MAX_ATTEMPTS; an email whose
+recipient the server refused is not retried.
+
+Transports (NOTIFICATION_TRANSPORT):
+    smtp     persistent connections to SMTP_HOST, SMTP_POOL_SIZE at most,
+             secured as SMTP_SECURITY says ("starttls", "ssl" or "none")
+    console  prints the email (development)
+    memory   keeps sent emails in a list (stand-in SMTP sink for tests)
+"""
+
+import asyncio
+import logging
+import queue
+import smtplib
+import ssl
+import time
+from dataclasses import asdict, dataclass
+from email.message import EmailMessage
+from typing import Any, Dict, List, Optional, Set
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+SMTP_STARTTLS = "starttls"  # Plain connection upgraded with STARTTLS (port 587)
+SMTP_SSL = "ssl"  # TLS from the first byte (port 465)
+SMTP_PLAIN = "none"  # No encryption (local relays)
+
+
+@dataclass
+class Email:
+    to_email: str
+    subject: str
+    body: str
+    attempts: int = 0
+    rejected: bool = False  # Permanent failure: never retried
+
+
+@dataclass
+class DispatcherMetrics:
+    enqueued: int = 0
+    sent: int = 0
+    retried: int = 0
+    failed: int = 0
+    batches: int = 0
+    last_batch_ms: float = 0.0
+
+
+# ============================================================
+# TRANSPORTS
+# ============================================================
+
+class ConsoleTransport:
+    """Prints emails instead of sending them."""
+
+    def send_batch(self, emails: List[Email]) -> List[Email]:
+        """Deliver a batch; returns the emails that failed."""
+        for email in emails:
+            print("---- EMAIL ----")
+            print(f"To: {email.to_email}")
+            print(f"Subject: {email.subject}")
+            print(email.body)
+            print("---------------")
+        return []
+
+    def close(self) -> None:
+        pass
+
+
+class MemoryTransport:
+    """Keeps delivered emails in memory."""
+
+    def __init__(self):
+        self.outbox: List[Email] = []
+
+    def send_batch(self, emails: List[Email]) -> List[Email]:
+        self.outbox.extend(emails)
+        return []
+
+    def close(self) -> None:
+        pass
+
+
+class SmtpTransport:
+    """
+    Pool of persistent SMTP connections. A batch is sent over a single
+    connection; a connection that fails is discarded and re-opened for
+    the next batch.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        user: str,
+        password: str,
+        from_email: str,
+        pool_size: int = 4,
+        timeout: float = 10.0,
+        security: str = SMTP_STARTTLS,
+    ):
+        if security not in (SMTP_STARTTLS, SMTP_SSL, SMTP_PLAIN):
+            raise ValueError(f"Unknown SMTP security: {security}")
+
+        self.host = host
+        self.port = port
+        self.user = user
+        self.password = password
+        self.from_email = from_email
+        self.timeout = timeout
+        self.security = security
+
+        self._idle: "queue.LifoQueue[Optional[smtplib.SMTP]]" = queue.LifoQueue()
+        for _ in range(pool_size):
+            self._idle.put(None)  # Slot: connected lazily
+
+    def _connect(self) -> smtplib.SMTP:
+        if self.security == SMTP_SSL:
+            connection = smtplib.SMTP_SSL(
+                self.host, self.port, timeout=self.timeout, context=ssl.create_default_context()
+            )
+        else:
+            connection = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+            if self.security == SMTP_STARTTLS:
+                connection.starttls(context=ssl.create_default_context())
+        if self.user:
+            connection.login(self.user, self.password)
+        return connection
+
+    def send_batch(self, emails: List[Email]) -> List[Email]:
+        connection = self._idle.get()  # Blocks while every connection is busy
+        failed: List[Email] = []
+        try:
+            for email in emails:
+                try:
+                    if connection is None:
+                        connection = self._connect()
+                    connection.send_message(self._to_message(email))
+                except smtplib.SMTPRecipientsRefused as e:
+                    # Retrying cannot help; the connection is still usable
+                    logger.error(f"❌ Recipient refused {email.to_email}: {e}")
+                    email.rejected = True
+                    failed.append(email)
+                except (smtplib.SMTPException, OSError) as e:
+                    logger.warning(f"⚠️  SMTP error, reconnecting: {e}")
+                    self._discard(connection)
+                    connection = None
+                    failed.append(email)
+        finally:
+            self._idle.put(connection)
+        return failed
+
+    def _to_message(self, email: Email) -> EmailMessage:
+        message = EmailMessage()
+        message["From"] = self.from_email
+        message["To"] = email.to_email
+        message["Subject"] = email.subject
+        message.set_content(email.body)
+        return message
+
+    @staticmethod
+    def _discard(connection: Optional[smtplib.SMTP]) -> None:
+        if connection is None:
+            return
+        try:
+            connection.quit()
+        except Exception:
+            connection.close()
+
+    def close(self) -> None:
+        while True:
+            try:
+                self._discard(self._idle.get_nowait())
+            except queue.Empty:
+                return
+
+
+def build_transport(name: str):
+    if name == "smtp":
+        return SmtpTransport(
+            host=settings.SMTP_HOST,
+            port=settings.SMTP_PORT,
+            user=settings.SMTP_USER,
+            password=settings.SMTP_PASSWORD,
+            from_email=settings.NOTIFICATION_FROM_EMAIL,
+            pool_size=settings.SMTP_POOL_SIZE,
+            timeout=settings.SMTP_TIMEOUT_SECONDS,
+            security=settings.SMTP_SECURITY,
+        )
+    if name == "memory":
+        return MemoryTransport()
+    return ConsoleTransport()
+
+
+# ============================================================
+# DISPATCHER
+# ============================================================
+
+class NotificationDispatcher:
+    """Queue of outgoing emails drained by a pool of worker tasks."""
+
+    def __init__(
+        self,
+        transport,
+        workers: int = 4,
+        queue_size: int = 10_000,
+        batch_size: int = 50,
+        max_attempts: int = 5,
+        backoff_base: float = 1.0,
+    ):
+        self.transport = transport
+        self.workers = workers
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.queue_size = queue_size
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+        self._retries: Set[asyncio.Task] = set()
+        self._metrics = DispatcherMetrics()
+
+    def _ensure_queue(self) -> asyncio.Queue:
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self.queue_size)
+        return self._queue
+
+    async def enqueue(self, to_email: str, subject: str, body: str) -> None:
+        """Queue an email; only waits when the queue is full."""
+        await self._ensure_queue().put(Email(to_email=to_email, subject=subject, body=body))
+        self._metrics.enqueued += 1
+
+    async def _worker(self) -> None:
+        q = self._queue
+        while True:
+            batch = [await q.get()]
+            while len(batch) < self.batch_size and not q.empty():
+                batch.append(q.get_nowait())
+
+            try:
+                await self._deliver(batch)
+            except Exception as e:
+                logger.exception(f"❌ Notification batch failed: {e}")
+                self._retry(batch)
+            finally:
+                for _ in batch:
+                    q.task_done()
+
+    async def _deliver(self, batch: List[Email]) -> None:
+        started = time.perf_counter()
+        failed = await asyncio.to_thread(self.transport.send_batch, batch)
+
+        self._metrics.batches += 1
+        self._metrics.last_batch_ms = (time.perf_counter() - started) * 1000
+        self._metrics.sent += len(batch) - len(failed)
+        self._retry(failed)
+
+    def _retry(self, emails: List[Email]) -> None:
+        for email in emails:
+            email.attempts += 1
+            if email.rejected:
+                self._metrics.failed += 1
+                continue
+            if email.attempts >= self.max_attempts:
+                self._metrics.failed += 1
+                logger.error(f"❌ Giving up on email to {email.to_email} ({email.subject}) after {email.attempts} attempts")
+                continue
+
+            self._metrics.retried += 1
+            delay = self.backoff_base * 2 ** (email.attempts - 1)
+            task = asyncio.create_task(self._requeue_later(email, delay))
+            self._retries.add(task)
+            task.add_done_callback(self._retries.discard)
+
+    async def _requeue_later(self, email: Email, delay: float) -> None:
+        await asyncio.sleep(delay)
+        await self._queue.put(email)
+
+    def start(self) -> None:
+        if self._tasks:
+            return
+        self._ensure_queue()
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+        logger.info(f"📧 Notification dispatcher started ({self.workers} workers)")
+
+    async def stop(self, timeout: float = 10.0) -> None:
+        """Deliver what is queued (pending retries are abandoned), then stop the workers."""
+        if not self._tasks:
+            return
+
+        for task in list(self._retries):
+            task.cancel()
+
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout=timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"⚠️  {self._queue.qsize()} notifications still queued at shutdown")
+
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self.transport.close()
+        logger.info("📧 Notification dispatcher stopped")
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            **asdict(self._metrics),
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+            "pending_retries": len(self._retries),
+            "workers": len(self._tasks),
+        }
+
+
+notification_dispatcher = NotificationDispatcher(
+    transport=build_transport(settings.NOTIFICATION_TRANSPORT),
+    workers=settings.NOTIFICATION_WORKERS,
+    queue_size=settings.NOTIFICATION_QUEUE_SIZE,
+    batch_size=settings.NOTIFICATION_BATCH_SIZE,
+    max_attempts=settings.NOTIFICATION_MAX_ATTEMPTS,
+)
@@ -1,6 +1,7 @@
+from app.core.database import AsyncSessionLocal
 from app.core.event_bus import event_bus
-from app.core.database import SessionLocal
-from app.contexts.user.repository import UserProfileRepository
+from app.contexts.user.repository import AsyncUserProfileRepository
+from app.shared.outbox.repository import AsyncProcessedEventRepository
 
 from .service import (
     send_booking_confirmation,
@@ -8,66 +9,46 @@ from .service import (
     send_refund_issued,
 )
 
-profile_repo = UserProfileRepository()
+NOTIFICATION_CONSUMER = "notification"
 
+profile_repo = AsyncUserProfileRepository()
+processed_repo = AsyncProcessedEventRepository()
 
-async def on_payment_succeeded(payload: dict):
+
+async def _notify_user(payload: dict, send) -> None:
+    """Email the event's user, once per event even if it is redelivered."""
     # Fetch user email from database
     user_id = payload.get("user_id")
     if not user_id:
         return  # Can't send email without user_id
-    
-    db = SessionLocal()
-    try:
-        profile = profile_repo.get_by_user_id(db, user_id)  # ← FIXED!
+
+    async with AsyncSessionLocal() as db:
+        event_id = payload.get("event_id")
+        if event_id and not await processed_repo.claim(db, NOTIFICATION_CONSUMER, [event_id]):
+            return  # Already sent for this event
+
+        profile = await profile_repo.get_by_user_id(db, user_id)
         if not profile:
             return  # User profile not found
-        
+
         # Add user_email to payload for the email template
         email_payload = {**payload, "user_email": profile.email}
-        send_booking_confirmation(email_payload)
-    finally:
-        db.close()
+        await send(email_payload)
+        await db.commit()
+
+
+async def on_payment_succeeded(payload: dict):
+    await _notify_user(payload, send_booking_confirmation)
 
 
 async def on_payment_failed(payload: dict):
-    # Fetch user email from database
-    user_id = payload.get("user_id")
-    if not user_id:
-        return  # Can't send email without user_id
-    
-    db = SessionLocal()
-    try:
-        profile = profile_repo.get_by_user_id(db, user_id)  # ← FIXED!
-        if not profile:
-            return  # User profile not found
-        
-        # Add user_email to payload for the email template
-        email_payload = {**payload, "user_email": profile.email}
-        send_payment_failure(email_payload)
-    finally:
-        db.close()
+    await _notify_user(payload, send_payment_failure)
 
 
 async def on_refund_issued(payload: dict):
-    # Fetch user email from database
-    user_id = payload.get("user_id")
-    if not user_id:
-        return  # Can't send email without user_id
-    
-    db = SessionLocal()
-    try:
-        profile = profile_repo.get_by_user_id(db, user_id)  # ← FIXED!
-        if not profile:
-            return  # User profile not found
-        
-        # Add user_email to payload for the email template
-        email_payload = {**payload, "user_email": profile.email}
-        send_refund_issued(email_payload)
-    finally:
-        db.close()
+    await _notify_user(payload, send_refund_issued)
 
 
-event_bus.subscribe("payment.succeeded", on_payment_succeeded)
-event_bus.subscribe("payment.failed", on_payment_failed)
-event_bus.subscribe("refund.issued", on_refund_issued)
\ No newline at end of file
+event_bus.subscribe("payment.succeeded", on_payment_succeeded, group="notification", after=["order"])
+event_bus.subscribe("payment.failed", on_payment_failed, group="notification", after=["order"])
+event_bus.subscribe("refund.issued", on_refund_issued, group="notification")
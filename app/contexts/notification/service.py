@@ -1,57 +1,58 @@
-from pathlib import Path
+from typing import List
 
-
-TEMPLATES_DIR = Path(__file__).parent / "templates"
+from .dispatcher import notification_dispatcher
+from .template_registry import template_registry
 
 
 def _render_template(template_name: str, context: dict) -> str:
-    template_path = TEMPLATES_DIR / template_name
-    template = template_path.read_text()
-    return template.format(**context)
+    return template_registry.render(template_name, context)
 
 
-def send_email(to_email: str, subject: str, body: str) -> None:
+async def send_email(to_email: str, subject: str, body: str) -> None:
     """
-    Fake email sender for now.
-    This is intentionally simple.
+    Queue an email for delivery.
+    The notification dispatcher sends it in the background.
     """
-    print("---- EMAIL ----")
-    print(f"To: {to_email}")
-    print(f"Subject: {subject}")
-    print(body)
-    print("---------------")
+    await notification_dispatcher.enqueue(to_email, subject, body)
+
+
+async def send_bulk(template_name: str, subject: str, payloads: List[dict]) -> None:
+    """Render one template for many recipients (each payload has user_email) and queue them."""
+    bodies = template_registry.render_many(template_name, payloads)
+    for payload, body in zip(payloads, bodies):
+        await send_email(to_email=payload["user_email"], subject=subject, body=body)
 
 
-def send_booking_confirmation(payload: dict) -> None:
+async def send_booking_confirmation(payload: dict) -> None:
     body = _render_template(
         "booking_confirmation.txt",
         payload,
     )
-    send_email(
+    await send_email(
         to_email=payload["user_email"],
         subject="Booking Confirmed",
         body=body,
     )
 
 
-def send_payment_failure(payload: dict) -> None:
+async def send_payment_failure(payload: dict) -> None:
     body = _render_template(
         "payment_failure.txt",
         payload,
     )
-    send_email(
+    await send_email(
         to_email=payload["user_email"],
         subject="Payment Failed",
         body=body,
     )
 
 
-def send_refund_issued(payload: dict) -> None:
+async def send_refund_issued(payload: dict) -> None:
     body = _render_template(
         "refund_issued.txt",
         payload,
     )
-    send_email(
+    await send_email(
         to_email=payload["user_email"],
         subject="Refund Issued",
         body=body,
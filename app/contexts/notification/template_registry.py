@@ -0,0 +1,114 @@
+# app/contexts/notification/template_registry.py
+
+"""
+Precompiled notification templates.
+
+Templates use str.format syntax. Each file in notification/templates is
+read and parsed once (at startup, or on first use) into literal text and
+replacement fields, so rendering an email does no disk I/O and no
+re-parsing. Files are re-read only when their mtime changes; mtimes are
+checked at most every NOTIFICATION_TEMPLATE_CHECK_SECONDS.
+"""
+
+import logging
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from string import Formatter
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from app.core.config import settings
+from app.core.errors import NotFoundError
+
+logger = logging.getLogger(__name__)
+
+TEMPLATES_DIR = Path(__file__).parent / "templates"
+
+_formatter = Formatter()
+
+# (literal text, field name, format spec, conversion); field name is None for trailing text
+Segment = Tuple[str, Optional[str], str, Optional[str]]
+
+
+@dataclass
+class CompiledTemplate:
+    name: str
+    mtime_ns: int
+    segments: List[Segment]
+
+    @classmethod
+    def compile(cls, path: Path) -> "CompiledTemplate":
+        source = path.read_text()
+        return cls(
+            name=path.name,
+            mtime_ns=path.stat().st_mtime_ns,
+            segments=[
+                (literal, field_name, format_spec or "", conversion)
+                for literal, field_name, format_spec, conversion in _formatter.parse(source)
+            ],
+        )
+
+    def render(self, context: dict) -> str:
+        """Same result as source.format(**context)."""
+        parts = []
+        for literal, field_name, format_spec, conversion in self.segments:
+            parts.append(literal)
+            if field_name is None:
+                continue
+            value, _ = _formatter.get_field(field_name, (), context)
+            value = _formatter.convert_field(value, conversion)
+            if format_spec and "{" in format_spec:
+                format_spec = _formatter.vformat(format_spec, (), context)
+            parts.append(format(value, format_spec))
+        return "".join(parts)
+
+
+class TemplateRegistry:
+    """Compiled templates by file name, refreshed when files change on disk."""
+
+    def __init__(self, directory: Path = TEMPLATES_DIR, check_interval: float = 2.0):
+        self.directory = directory
+        self.check_interval = check_interval
+
+        self._templates: Dict[str, CompiledTemplate] = {}
+        self._checked_at = 0.0
+
+    def load(self) -> int:
+        """Compile every template in the directory. Returns how many were (re)loaded."""
+        loaded = 0
+        seen = set()
+        for path in self.directory.glob("*.txt"):
+            seen.add(path.name)
+            current = self._templates.get(path.name)
+            if current is not None and current.mtime_ns == path.stat().st_mtime_ns:
+                continue
+            self._templates[path.name] = CompiledTemplate.compile(path)
+            loaded += 1
+            if current is not None:
+                logger.info(f"📧 Reloaded template {path.name}")
+
+        for name in set(self._templates) - seen:
+            del self._templates[name]
+
+        self._checked_at = time.monotonic()
+        return loaded
+
+    def get(self, name: str) -> CompiledTemplate:
+        if time.monotonic() - self._checked_at >= self.check_interval:
+            self.load()
+
+        template = self._templates.get(name)
+        if template is None:
+            raise NotFoundError(f"Template {name} not found", {"template": name})
+        return template
+
+    def render(self, name: str, context: dict) -> str:
+        return self.get(name).render(context)
+
+    def render_many(self, name: str, contexts: Iterable[dict]) -> List[str]:
+        """Render one template for many payloads (one lookup, one freshness check)."""
+        template = self.get(name)
+        return [template.render(context) for context in contexts]
+
+
+template_registry = TemplateRegistry(check_interval=settings.NOTIFICATION_TEMPLATE_CHECK_SECONDS)
@@ -11,6 +11,7 @@ def order_created_event(
     user_id: int,
     showtime_id: int,
     seat_code: str,
+    final_amount: float,
 ) -> dict:
     return {
         "type": "order.created",
@@ -20,32 +21,69 @@ def order_created_event(
             "user_id": user_id,
             "showtime_id": showtime_id,
             "seat_code": seat_code,
+            "final_amount": final_amount,
         },
     }
 
 
-def order_completed_event(order_id: int) -> dict:
+def order_completed_event(
+    order_id: int,
+    reservation_id: int,
+    user_id: int,
+    showtime_id: int,
+    seat_code: str,
+    final_amount: float = None,
+) -> dict:
     return {
         "type": "order.completed",
         "payload": {
             "order_id": order_id,
+            "reservation_id": reservation_id,
+            "user_id": user_id,
+            "showtime_id": showtime_id,
+            "seat_code": seat_code,
+            "final_amount": final_amount,
         },
     }
 
 
-def order_cancelled_event(order_id: int) -> dict:
+def order_cancelled_event(
+    order_id: int,
+    reservation_id: int,
+    user_id: int,
+    showtime_id: int,
+    seat_code: str,
+    final_amount: float = None,
+) -> dict:
     return {
         "type": "order.cancelled",
         "payload": {
             "order_id": order_id,
+            "reservation_id": reservation_id,
+            "user_id": user_id,
+            "showtime_id": showtime_id,
+            "seat_code": seat_code,
+            "final_amount": final_amount,
         },
     }
 
 
-def order_expired_event(order_id: int) -> dict:
+def order_expired_event(
+    order_id: int,
+    reservation_id: int,
+    user_id: int,
+    showtime_id: int,
+    seat_code: str,
+    final_amount: float = None,
+) -> dict:
     return {
         "type": "order.expired",
         "payload": {
             "order_id": order_id,
+            "reservation_id": reservation_id,
+            "user_id": user_id,
+            "showtime_id": showtime_id,
+            "seat_code": seat_code,
+            "final_amount": final_amount,
         },
     }
@@ -1,4 +1,5 @@
 # app/contexts/order/repository.py
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from sqlalchemy import select
 from .models import Order
@@ -41,4 +42,37 @@ class OrderRepository:
         db.add(order)
         db.commit()
         db.refresh(order)
-        return order
\ No newline at end of file
+        return order
+
+
+class AsyncOrderRepository:
+    """Async repository for Order aggregate."""
+
+    async def get_by_id(self, db: AsyncSession, order_id: int):
+        """Get order by ID."""
+        return await db.get(Order, order_id)
+
+    async def get_by_reservation_id(self, db: AsyncSession, reservation_id: int):
+        """Get order by reservation ID."""
+        stmt = select(Order).where(Order.reservation_id == reservation_id)
+        return await db.scalar(stmt)
+
+    async def list_user_orders(self, db: AsyncSession, user_id: int, completed_only: bool = True):
+        """List orders for a user."""
+        stmt = (
+            select(Order)
+            .where(Order.user_id == user_id)
+            .order_by(Order.created_at.desc())
+        )
+
+        if completed_only:
+            stmt = stmt.where(Order.is_completed == True)
+
+        return (await db.scalars(stmt)).all()
+
+    async def save(self, db: AsyncSession, order: Order):
+        """Create or update an order."""
+        db.add(order)
+        await db.commit()
+        await db.refresh(order)
+        return order
@@ -1,8 +1,8 @@
 # app/contexts/order/router.py
 from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
+from app.core.database import get_async_db
 from ..auth.dependencies import get_current_user
 
 from .schemas import OrderRead
@@ -18,11 +18,11 @@ order_service = OrderService()
 
 
 @router.get("/", response_model=list[OrderRead])
-def list_user_orders(
-    db: Session = Depends(get_db),
+async def list_user_orders(
+    db: AsyncSession = Depends(get_async_db),
     current_user = Depends(get_current_user),
 ):
-    return order_service.list_user_orders(
+    return await order_service.list_user_orders_async(
         db=db,
         user_id=current_user.id,
         completed_only=False
@@ -1,13 +1,13 @@
 # app/contexts/order/service.py
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.core.errors import ValidationError, NotFoundError, ConflictError
-from app.shared.services.event_publisher import publish_event_async
+from app.core.errors import ValidationError, NotFoundError
+from app.shared.services.event_publisher import stage_event
 
 from .models import Order
-from .repository import OrderRepository
+from .repository import OrderRepository, AsyncOrderRepository
 from .events import (
-    order_created_event,
     order_completed_event,
     order_cancelled_event,
     order_expired_event,
@@ -19,36 +19,7 @@ class OrderService:
     
     def __init__(self):
         self.repo = OrderRepository()
-
-    async def create_order_from_event(
-        self, 
-        db: Session, 
-        user_id: int, 
-        reservation_id: int,
-        showtime_id: int,
-        seat_code: str,
-    ):
-        """Create an order (triggered by reservation.created event)."""
-        order = Order(
-            user_id=user_id,
-            reservation_id=reservation_id,
-            pricing_snapshot={},
-            final_amount=0,
-            is_completed=False,
-        )
-
-        order = self.repo.create(db, order)
-
-        event = order_created_event(
-            order_id=order.id,
-            reservation_id=reservation_id,
-            user_id=user_id,
-            showtime_id=showtime_id,
-            seat_code=seat_code,
-        )
-        await publish_event_async(event["type"], event["payload"])
-
-        return order
+        self.async_repo = AsyncOrderRepository()
 
     async def complete_order_from_event(
         self,  
@@ -61,14 +32,16 @@ class OrderService:
             raise NotFoundError("Order not found")
 
         if order.is_completed:
-            raise ConflictError("Order already completed")
-        
+            # Idempotent: a redelivered payment.succeeded is a no-op
+            return order
+
         order.is_completed = True
 
-        order = self.repo.save(db, order)
+        event = order_completed_event(**self._event_fields(order))
+        stage_event(db, event["type"], event["payload"])
 
-        event = order_completed_event(order.id)
-        await publish_event_async(event["type"], event["payload"])
+        db.commit()
+        db.refresh(order)
 
         return order
 
@@ -82,8 +55,9 @@ class OrderService:
         if order is None:
             raise NotFoundError("Order not found")
 
-        event = order_cancelled_event(order.id)
-        await publish_event_async(event["type"], event["payload"])
+        event = order_cancelled_event(**self._event_fields(order))
+        stage_event(db, event["type"], event["payload"])
+        db.commit()
 
         return order
 
@@ -97,11 +71,25 @@ class OrderService:
         if order is None:
             raise NotFoundError("Order not found")
 
-        event = order_expired_event(order.id)
-        await publish_event_async(event["type"], event["payload"])
+        event = order_expired_event(**self._event_fields(order))
+        stage_event(db, event["type"], event["payload"])
+        db.commit()
 
         return order
     
+    @staticmethod
+    def _event_fields(order: Order) -> dict:
+        """Denormalized order fields carried by order.* status events."""
+        reservation = order.reservation
+        return {
+            "order_id": order.id,
+            "reservation_id": order.reservation_id,
+            "user_id": order.user_id,
+            "showtime_id": reservation.showtime_id,
+            "seat_code": reservation.seat_code,
+            "final_amount": order.final_amount,
+        }
+
     # ===== READ OPERATIONS (sync) =====
     
     def get_order(self, db: Session, order_id: int) -> Order:
@@ -113,4 +101,17 @@ class OrderService:
     
     def list_user_orders(self, db: Session, user_id: int, completed_only: bool = False):
         """List orders for a user."""
-        return self.repo.list_user_orders(db, user_id, completed_only=completed_only)
\ No newline at end of file
+        return self.repo.list_user_orders(db, user_id, completed_only=completed_only)
+
+    # ===== READ OPERATIONS (async) =====
+
+    async def get_order_async(self, db: AsyncSession, order_id: int) -> Order:
+        """Get order by ID."""
+        order = await self.async_repo.get_by_id(db, order_id)
+        if not order:
+            raise NotFoundError("Order not found")
+        return order
+
+    async def list_user_orders_async(self, db: AsyncSession, user_id: int, completed_only: bool = False):
+        """List orders for a user."""
+        return await self.async_repo.list_user_orders(db, user_id, completed_only=completed_only)
@@ -1,6 +1,6 @@
 # app/contexts/payment/handlers.py
 
-from app.core.database import SessionLocal
+from app.core.unit_of_work import event_session
 from app.core.event_bus import event_bus
 
 from app.contexts.order.service import OrderService  # Changed!
@@ -14,13 +14,11 @@ async def on_payment_succeeded(payload: dict):
     if not order_id:
         return
     
-    db = SessionLocal()
-    try:
+    with event_session() as db:
         await order_service.complete_order_from_event(db, order_id)  # Use service!
-    finally:
-        db.close()
 
-event_bus.subscribe("payment.succeeded", on_payment_succeeded)
+# group "order": notification and audit handlers read the completed order
+event_bus.subscribe("payment.succeeded", on_payment_succeeded, group="order", blocking=True)
 
 
 async def on_payment_failed(payload: dict):
@@ -29,4 +27,4 @@ async def on_payment_failed(payload: dict):
     if not order_id:
         return
     
-event_bus.subscribe("payment.failed", on_payment_failed)
\ No newline at end of file
+event_bus.subscribe("payment.failed", on_payment_failed, group="order")
\ No newline at end of file
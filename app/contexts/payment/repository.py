@@ -1,5 +1,6 @@
 # app/contexts/payment/repository.py
 
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from sqlalchemy import select
 
@@ -38,3 +39,17 @@ class PaymentRepository:
         return payment_attempt
 
     
+
+
+class AsyncPaymentRepository:
+
+    async def get_payment_attempt_by_id(
+        self,
+        db: AsyncSession,
+        payment_attempt_id: int
+    ):
+        return await db.get(PaymentAttempt, payment_attempt_id)
+
+    async def list_payment_attempts_for_order(self, db: AsyncSession, order_id: int):
+        stmt = select(PaymentAttempt).where(PaymentAttempt.order_id == order_id)
+        return (await db.scalars(stmt)).all()
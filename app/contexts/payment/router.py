@@ -1,8 +1,9 @@
 # app/contexts/payment/router.py
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.core.database import get_db
+from app.core.database import get_db, get_async_db
 from ..auth.dependencies import get_current_user
 from ..order.repository import OrderRepository
 from .schemas import PaymentAttemptRead
@@ -62,22 +63,22 @@ async def confirm_payment_route(
 
 
 @router.get("/order/{order_id}", response_model=list[PaymentAttemptRead])
-def list_payment_attempts_for_order_route(
+async def list_payment_attempts_for_order_route(
     order_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
-    return payment_service.list_payment_attempts_for_order(
+    return await payment_service.list_payment_attempts_for_order_async(
         db=db,
         order_id=order_id,
     )
 
 
 @router.get("/{payment_attempt_id}", response_model=PaymentAttemptRead)
-def get_payment_attempt_by_id_route(
+async def get_payment_attempt_by_id_route(
     payment_attempt_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
-    return payment_service.get_payment_attempt(
+    return await payment_service.get_payment_attempt_async(
         db=db,
         payment_attempt_id=payment_attempt_id,
     )
\ No newline at end of file
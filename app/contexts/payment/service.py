@@ -1,11 +1,12 @@
 # app/contexts/payment/service.py
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.core.errors import ValidationError, NotFoundError, ConflictError
-from app.shared.services.event_publisher import publish_event_async
+from app.shared.services.event_publisher import stage_event
 
 from .models import PaymentAttempt, PaymentStatus
-from .repository import PaymentRepository
+from .repository import PaymentRepository, AsyncPaymentRepository
 from .events import (
     payment_attempt_pending_event,
     payment_attempt_succeeded_event,
@@ -18,6 +19,7 @@ class PaymentService:
     
     def __init__(self):
         self.repo = PaymentRepository()
+        self.async_repo = AsyncPaymentRepository()
 
     async def create_payment_attempt(
         self,
@@ -33,7 +35,8 @@ class PaymentService:
             final_amount=final_amount
         )
 
-        payment_attempt = self.repo.create_payment_attempt(db, payment_attempt)
+        db.add(payment_attempt)
+        db.flush()  # Get the ID without committing
 
         # Get user_id from the order
         order = payment_attempt.order
@@ -45,7 +48,10 @@ class PaymentService:
             final_amount=final_amount,
             user_id=order.user_id
         )
-        await publish_event_async(event["type"], event["payload"])
+        stage_event(db, event["type"], event["payload"])
+
+        db.commit()
+        db.refresh(payment_attempt)
 
         return payment_attempt
 
@@ -77,15 +83,16 @@ class PaymentService:
         payment_attempt.status = PaymentStatus.SUCCEEDED
         payment_attempt.provider_payment_id = provider_payment_id
 
-        payment_attempt = self.repo.save(db, payment_attempt)
-
         event = payment_attempt_succeeded_event(
             payment_attempt_id=payment_attempt_id,
             order_id=order.id,
             final_amount=payment_attempt.final_amount,
             user_id=order.user_id
         )
-        await publish_event_async(event["type"], event["payload"])
+        stage_event(db, event["type"], event["payload"])
+
+        db.commit()
+        db.refresh(payment_attempt)
 
         return payment_attempt
 
@@ -112,8 +119,6 @@ class PaymentService:
         payment_attempt.status = PaymentStatus.FAILED
         payment_attempt.failure_reason = failure_reason
 
-        payment_attempt = self.repo.save(db, payment_attempt)
-
         # Get order for user_id
         order = payment_attempt.order
 
@@ -123,7 +128,10 @@ class PaymentService:
             order_id=payment_attempt.order_id,
             user_id=order.user_id
         )
-        await publish_event_async(event["type"], event["payload"])
+        stage_event(db, event["type"], event["payload"])
+
+        db.commit()
+        db.refresh(payment_attempt)
 
         return payment_attempt
     
@@ -138,4 +146,17 @@ class PaymentService:
     
     def list_payment_attempts_for_order(self, db: Session, order_id: int):
         """List payment attempts for an order."""
-        return self.repo.list_payment_attempts_for_order(db, order_id)
\ No newline at end of file
+        return self.repo.list_payment_attempts_for_order(db, order_id)
+
+    # ===== READ OPERATIONS (async) =====
+
+    async def get_payment_attempt_async(self, db: AsyncSession, payment_attempt_id: int):
+        """Get payment attempt by ID."""
+        payment_attempt = await self.async_repo.get_payment_attempt_by_id(db, payment_attempt_id)
+        if not payment_attempt:
+            raise NotFoundError("Payment attempt not found")
+        return payment_attempt
+
+    async def list_payment_attempts_for_order_async(self, db: AsyncSession, order_id: int):
+        """List payment attempts for an order."""
+        return await self.async_repo.list_payment_attempts_for_order(db, order_id)
@@ -0,0 +1,340 @@
+# app/contexts/pricing/engine.py
+
+"""
+Compiled pricing pipeline.
+
+Active price modifiers change rarely but are applied to every order, so
+they are compiled once into an immutable pipeline and kept in-process.
+Pricing an order is then plain arithmetic: no query, no ORM objects.
+
+Targeted modifiers (applies_to) are matched through a bitmask index: each
+modifier owns one bit, and every targeting dimension maps a value to the
+mask of modifiers accepting it. Matching a seat is one AND per dimension,
+and only the matching modifiers are visited afterwards.
+
+The pipeline is rebuilt by the pricing.modifier_* handlers, and expires
+after PRICING_PIPELINE_TTL_SECONDS so other processes pick up edits too.
+"""
+
+import hashlib
+import itertools
+import json
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+from zoneinfo import ZoneInfo
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+
+from .models import PriceModifier
+from .repository import PricingRepository, AsyncPricingRepository
+from .schemas import PriceCalculationResult
+
+logger = logging.getLogger(__name__)
+
+BASE_PRICE = 1000
+
+ADDITIVE = "additive"
+MULTIPLICATIVE = "multiplicative"
+
+# applies_to keys matched by exact value, and the PricingContext field each reads
+DIMENSIONS = (
+    ("formats", "format"),
+    ("screen_ids", "screen_id"),
+    ("movie_ids", "movie_id"),
+    ("rows", "row"),
+    ("seat_types", "seat_type"),
+    ("weekdays", "weekday"),
+)
+TIME_WINDOW = "time_window"
+
+MAX_MEMOIZED_CONTEXTS = 10_000
+
+_versions = itertools.count(1)
+_timezone = ZoneInfo(settings.TIMEZONE)
+
+
+def _minute_of_day(value: str) -> int:
+    hours, minutes = value.split(":")
+    return int(hours) * 60 + int(minutes)
+
+
+@dataclass(frozen=True)
+class PricingContext:
+    """What a targeted modifier can match on, for one seat of one showtime."""
+
+    format: Optional[str] = None
+    screen_id: Optional[int] = None
+    movie_id: Optional[int] = None
+    row: Optional[str] = None
+    seat_type: Optional[str] = None
+    weekday: Optional[int] = None  # Monday = 0, in settings.TIMEZONE
+    minute_of_day: Optional[int] = None
+
+    @classmethod
+    def for_showtime(
+        cls,
+        format: str,
+        screen_id: int,
+        movie_id: int,
+        start_time: datetime,
+        row: Optional[str] = None,
+        seat_type: Optional[str] = None,
+    ) -> "PricingContext":
+        local = start_time.astimezone(_timezone)
+        return cls(
+            format=format,
+            screen_id=screen_id,
+            movie_id=movie_id,
+            row=row,
+            seat_type=seat_type,
+            weekday=local.weekday(),
+            minute_of_day=local.hour * 60 + local.minute,
+        )
+
+
+class _Rule:
+    __slots__ = ("modifier_type", "amount", "entry", "window")
+
+    def __init__(self, modifier: PriceModifier, window: Optional[Tuple[int, int]]):
+        self.modifier_type = modifier.modifier_type
+        self.amount = modifier.amount
+        self.entry = {
+            "name": modifier.name,
+            "modifier_type": modifier.modifier_type,
+            "amount": modifier.amount,
+        }
+        self.window = window
+
+    def in_window(self, minute: Optional[int]) -> bool:
+        if minute is None:
+            return False
+        start, end = self.window
+        if start <= end:
+            return start <= minute < end
+        return minute >= start or minute < end  # Wraps past midnight
+
+
+# An empty window: no minute of the day falls in it
+NEVER = (0, 0)
+
+
+def _parse_window(modifier: PriceModifier, window) -> Tuple[int, int]:
+    try:
+        return _minute_of_day(window["start"]), _minute_of_day(window["end"])
+    except (KeyError, TypeError, ValueError):
+        # Fail closed: dropping the window would apply the modifier everywhere
+        logger.warning(f"⚠️ Disabling price modifier {modifier.name!r}: invalid time_window")
+        return NEVER
+
+
+def _fingerprint(*content) -> str:
+    """Short stable hash of JSON-serializable content."""
+    encoded = json.dumps(content, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.blake2b(encoded.encode(), digest_size=8).hexdigest()
+
+
+class CompiledPricingPipeline:
+    """
+    Read-only pricing pipeline built from the active modifiers.
+
+    - rules: one per modifier, in application order (bit i = rules[i])
+    - untargeted: mask of modifiers without applies_to (apply everywhere)
+    - index: dimension -> (wildcard mask, {value: mask})
+    - timed: mask of modifiers that also carry a time_window
+    - fingerprint: hash of the modifiers' content, equal in every process
+      that compiled the same modifiers (used in ETags)
+    Matches are memoized per context and results per match mask, so seats
+    priced alike share one (read-only) PriceCalculationResult.
+    """
+
+    __slots__ = (
+        "version",
+        "fingerprint",
+        "base_price",
+        "rules",
+        "untargeted",
+        "index",
+        "timed",
+        "compiled_at",
+        "quotes",
+        "_matches",
+        "_results",
+    )
+
+    def __init__(self, modifiers: Iterable[PriceModifier], base_price: float = BASE_PRICE):
+        modifiers = list(modifiers)
+        self.version = next(_versions)
+        self.fingerprint = _fingerprint(
+            base_price,
+            [
+                (m.id, m.name, m.modifier_type, m.amount, m.applies_to)
+                for m in modifiers
+            ],
+        )
+        self.base_price = base_price
+
+        rules: List[_Rule] = []
+        untargeted = 0
+        timed = 0
+        wildcards = {field: 0 for _, field in DIMENSIONS}
+        by_value: Dict[str, Dict[object, int]] = {field: {} for _, field in DIMENSIONS}
+
+        for i, modifier in enumerate(modifiers):
+            bit = 1 << i
+            targets = modifier.applies_to or {}
+
+            window = None
+            if targets.get(TIME_WINDOW):
+                window = _parse_window(modifier, targets[TIME_WINDOW])
+                timed |= bit
+            rules.append(_Rule(modifier, window))
+
+            targeted = window is not None
+            for key, field in DIMENSIONS:
+                values = targets.get(key)
+                if not values:
+                    wildcards[field] |= bit
+                    continue
+                targeted = True
+                for value in values:
+                    by_value[field][value] = by_value[field].get(value, 0) | bit
+
+            if not targeted:
+                untargeted |= bit
+
+        self.rules: Tuple[_Rule, ...] = tuple(rules)
+        self.untargeted = untargeted
+        self.index = {
+            field: (wildcards[field], by_value[field]) for _, field in DIMENSIONS
+        }
+        self.timed = timed
+        self.compiled_at = time.monotonic()
+        # Showtime quotes built on this pipeline, keyed by ETag (see PricingService)
+        self.quotes: Dict[str, object] = {}
+        self._matches: Dict[PricingContext, int] = {}
+        self._results: Dict[int, PriceCalculationResult] = {}
+
+    def match(self, context: Optional[PricingContext]) -> int:
+        """Mask of the modifiers that apply to a context."""
+        if context is None:
+            return self.untargeted
+
+        mask = self._matches.get(context)
+        if mask is None:
+            if len(self._matches) >= MAX_MEMOIZED_CONTEXTS:
+                self._matches.clear()
+            mask = self._matches[context] = self._match(context)
+        return mask
+
+    def _match(self, context: PricingContext) -> int:
+        mask = (1 << len(self.rules)) - 1
+        for field, (wildcard, values) in self.index.items():
+            mask &= wildcard | values.get(getattr(context, field), 0)
+            if not mask:
+                return 0
+
+        timed = mask & self.timed
+        while timed:
+            low = timed & -timed
+            if not self.rules[low.bit_length() - 1].in_window(context.minute_of_day):
+                mask ^= low
+            timed ^= low
+        return mask
+
+    def _apply_mask(self, mask: int) -> PriceCalculationResult:
+        cached = self._results.get(mask)
+        if cached is not None:
+            return cached
+
+        price = self.base_price
+        applied = []
+        remaining = mask
+        while remaining:
+            low = remaining & -remaining
+            rule = self.rules[low.bit_length() - 1]
+            remaining ^= low
+
+            applied.append(rule.entry)
+            if rule.modifier_type == ADDITIVE:
+                price += rule.amount
+            elif rule.modifier_type == MULTIPLICATIVE:
+                price *= rule.amount
+
+        # Values were validated when the modifiers were saved
+        result = PriceCalculationResult.model_construct(
+            base_price=self.base_price,
+            final_price=price,
+            modifiers_applied=applied,
+        )
+        self._results[mask] = result
+        return result
+
+    @property
+    def final_price(self) -> float:
+        """Price with only the untargeted modifiers applied."""
+        return self._apply_mask(self.untargeted).final_price
+
+    def evaluate(self, context: Optional[PricingContext] = None) -> PriceCalculationResult:
+        """Shared result object: callers must not mutate it (model_dump() to keep a copy)."""
+        return self._apply_mask(self.match(context))
+
+
+class PricingEngine:
+    """Holds the current pipeline and rebuilds it on demand."""
+
+    def __init__(self, ttl_seconds: float = 60.0):
+        self.ttl_seconds = ttl_seconds
+        self.repo = PricingRepository()
+        self.async_repo = AsyncPricingRepository()
+        self._pipeline: Optional[CompiledPricingPipeline] = None
+        # Bumped on invalidate, so a rebuild that raced a change is discarded
+        self._generation = 0
+
+    def _current(self) -> Optional[CompiledPricingPipeline]:
+        pipeline = self._pipeline
+        if pipeline is not None and time.monotonic() - pipeline.compiled_at <= self.ttl_seconds:
+            return pipeline
+        return None
+
+    def get(self, db: Session) -> CompiledPricingPipeline:
+        """Return the current pipeline, compiling it from the database if needed."""
+        return self._current() or self.rebuild(db)
+
+    async def get_async(self, db: AsyncSession) -> CompiledPricingPipeline:
+        pipeline = self._current()
+        if pipeline is not None:
+            return pipeline
+        generation = self._generation
+        modifiers = await self.async_repo.list_active_modifiers(db)
+        return self._compile(modifiers, generation)
+
+    def rebuild(self, db: Session) -> CompiledPricingPipeline:
+        generation = self._generation
+        return self._compile(self.repo.list_active_modifiers(db), generation)
+
+    def _compile(self, modifiers, generation: int) -> CompiledPricingPipeline:
+        pipeline = CompiledPricingPipeline(modifiers)
+        if generation == self._generation:
+            self._pipeline = pipeline
+        logger.debug(f"Compiled pricing pipeline v{pipeline.version} ({len(pipeline.rules)} modifiers)")
+        return pipeline
+
+    def install(self, pipeline: CompiledPricingPipeline) -> None:
+        self._pipeline = pipeline
+
+    def invalidate(self) -> None:
+        self._generation += 1
+        self._pipeline = None
+
+    @property
+    def version(self) -> Optional[int]:
+        return self._pipeline.version if self._pipeline is not None else None
+
+
+pricing_engine = PricingEngine(ttl_seconds=settings.PRICING_PIPELINE_TTL_SECONDS)
@@ -2,43 +2,27 @@
 import logging
 from typing import Dict, Any
 
-from app.core.database import SessionLocal
+from app.core.unit_of_work import event_session
 from app.core.event_bus import event_bus
 
-from .service import PricingService
+from .engine import pricing_engine
 
 logger = logging.getLogger(__name__)
 
-# Create service instance
-pricing_service = PricingService()
+async def on_modifier_changed(payload: Dict[str, Any]) -> None:
+    """pricing.modifier_created / updated / deleted: recompile the pipeline"""
+    pricing_engine.invalidate()
 
-
-async def on_order_created(payload: Dict[str, Any]) -> None:
-    """
-    Triggered when OrderContext emits 'order.created'.
-    PricingContext computes pricing snapshot.
-    """
-    order_id = payload.get("order_id")
-
-    if not order_id:
-        logger.warning("⚠️ Received order.created event without order_id")
-        return
-
-    logger.info(f"💰 Pricing handler received order.created for order {order_id}")
-
-    db = SessionLocal()
-    try:
-        result = await pricing_service.create_snapshot_from_event(
-            db=db,
-            order_id=order_id,
-        )
-        logger.info(f"✓ Pricing snapshot created for order {order_id}: final_price={result.final_price}")
-    except Exception as e:
-        logger.error(f"❌ Failed to create pricing snapshot for order {order_id}: {e}")
-        raise
-    finally:
-        db.close()
+    with event_session() as db:
+        try:
+            pipeline = pricing_engine.rebuild(db)
+            logger.info(f"💰 Pricing pipeline rebuilt (v{pipeline.version}, {len(pipeline.rules)} modifiers)")
+        except Exception as e:
+            # The next price calculation compiles it instead
+            logger.error(f"❌ Failed to rebuild pricing pipeline: {e}")
 
 
 # Register with event bus
-event_bus.subscribe("order.created", on_order_created)
\ No newline at end of file
+event_bus.subscribe("pricing.modifier_created", on_modifier_changed, blocking=True)
+event_bus.subscribe("pricing.modifier_updated", on_modifier_changed, blocking=True)
+event_bus.subscribe("pricing.modifier_deleted", on_modifier_changed, blocking=True)
\ No newline at end of file
@@ -1,8 +1,12 @@
 # app/contexts/pricing/repository.py
 
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from sqlalchemy import select
 
+from app.contexts.showtime.models import Showtime
+from app.contexts.screen.models import Screen
+
 from .models import PriceModifier
 
 
@@ -16,7 +20,12 @@ class PricingRepository:
         return db.scalars(stmt).all()
 
     def list_active_modifiers(self, db: Session):
-        stmt = select(PriceModifier).where(PriceModifier.is_active == True)
+        # Ordered, so modifiers are always applied in the same sequence
+        stmt = (
+            select(PriceModifier)
+            .where(PriceModifier.is_active == True)
+            .order_by(PriceModifier.id)
+        )
         return db.scalars(stmt).all()
 
     def create_modifier(self, db: Session, modifier: PriceModifier):
@@ -34,3 +43,35 @@ class PricingRepository:
     def delete_modifier(self, db: Session, modifier: PriceModifier):
         db.delete(modifier)
         db.commit()
+
+
+class AsyncPricingRepository:
+
+    async def get_modifier_by_id(self, db: AsyncSession, modifier_id: int):
+        return await db.get(PriceModifier, modifier_id)
+
+    async def list_modifiers(self, db: AsyncSession):
+        stmt = select(PriceModifier)
+        return (await db.scalars(stmt)).all()
+
+    async def list_active_modifiers(self, db: AsyncSession):
+        stmt = (
+            select(PriceModifier)
+            .where(PriceModifier.is_active == True)
+            .order_by(PriceModifier.id)
+        )
+        return (await db.scalars(stmt)).all()
+
+    async def get_showtime_facts(self, db: AsyncSession, showtime_id: int):
+        stmt = (
+            select(
+                Showtime.format,
+                Showtime.screen_id,
+                Showtime.movie_id,
+                Showtime.start_time,
+                Screen.seat_layout_id,
+            )
+            .join(Screen, Screen.id == Showtime.screen_id)
+            .where(Showtime.id == showtime_id)
+        )
+        return (await db.execute(stmt)).first()
@@ -1,8 +1,9 @@
 # app/contexts/pricing/router.py
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Header, Response
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.core.database import get_db
+from app.core.database import get_db, get_async_db
 from app.core.errors import NotFoundError
 from app.contexts.auth.dependencies import get_current_user
 
@@ -12,6 +13,7 @@ from .schemas import (
     PriceModifierCreate,
     PriceModifierUpdate,
     PriceModifierRead,
+    ShowtimeQuote,
 )
 
 router = APIRouter(
@@ -41,18 +43,36 @@ async def create_modifier(
 
 
 @router.get("/modifiers", response_model=list[PriceModifierRead])
-def list_modifiers(
-    db: Session = Depends(get_db),
+async def list_modifiers(
+    db: AsyncSession = Depends(get_async_db),
+):
+    return await pricing_service.list_modifiers_async(db)
+
+
+@router.get("/showtimes/{showtime_id}/quote", response_model=ShowtimeQuote)
+async def quote_showtime(
+    showtime_id: int,
+    response: Response,
+    if_none_match: str = Header(None),
+    db: AsyncSession = Depends(get_async_db),
 ):
-    return pricing_service.list_modifiers(db)
+    """Prices for every seat of a showtime, revalidated by ETag."""
+    etag, quote = await pricing_service.quote_showtime_async(db, showtime_id, if_none_match)
+
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if quote is None:
+        return Response(status_code=304, headers=headers)
+
+    response.headers.update(headers)
+    return quote
 
 
 @router.get("/modifiers/{modifier_id}", response_model=PriceModifierRead)
-def get_modifier(
+async def get_modifier(
     modifier_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
-    modifier = pricing_service.get_modifier(db, modifier_id)
+    modifier = await pricing_service.get_modifier_async(db, modifier_id)
     if not modifier:
         raise NotFoundError("Modifier not found")
     return modifier
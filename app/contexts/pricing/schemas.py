@@ -1,7 +1,45 @@
 # app/contexts/pricing/schemas.py
 
 from typing import Optional, Dict, Literal, List
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, field_validator
+
+from app.contexts.showtime.models import FormatEnum
+
+
+class TimeWindow(BaseModel):
+    """Local start time, "HH:MM"; end before start wraps past midnight."""
+    start: str = Field(pattern=r"^([01]\d|2[0-3]):[0-5]\d$")
+    end: str = Field(pattern=r"^([01]\d|2[0-3]):[0-5]\d$")
+
+
+class PriceModifierTargets(BaseModel):
+    """
+    applies_to: a modifier applies where every given key matches.
+    Omitted keys match anything; no keys at all means "every order".
+    """
+    formats: Optional[List[FormatEnum]] = None
+    screen_ids: Optional[List[int]] = None
+    movie_ids: Optional[List[int]] = None
+    rows: Optional[List[str]] = None
+    seat_types: Optional[List[str]] = None
+    weekdays: Optional[List[int]] = Field(default=None, description="Monday = 0")
+    time_window: Optional[TimeWindow] = None
+
+    model_config = {"extra": "forbid"}
+
+    @field_validator("weekdays")
+    @classmethod
+    def check_weekdays(cls, weekdays):
+        if weekdays and any(day < 0 or day > 6 for day in weekdays):
+            raise ValueError("weekdays must be between 0 (Monday) and 6 (Sunday)")
+        return weekdays
+
+
+def _validate_applies_to(applies_to: Optional[Dict]) -> Optional[Dict]:
+    if applies_to is None:
+        return None
+    targets = PriceModifierTargets.model_validate(applies_to)
+    return targets.model_dump(mode="json", exclude_none=True)
 
 
 class PriceModifierBase(BaseModel):
@@ -13,7 +51,11 @@ class PriceModifierBase(BaseModel):
 
 
 class PriceModifierCreate(PriceModifierBase):
-    pass
+
+    @field_validator("applies_to")
+    @classmethod
+    def check_applies_to(cls, applies_to):
+        return _validate_applies_to(applies_to)
 
 
 class PriceModifierUpdate(BaseModel):
@@ -23,6 +65,11 @@ class PriceModifierUpdate(BaseModel):
     applies_to: Optional[Dict] = None
     is_active: Optional[bool] = None
 
+    @field_validator("applies_to")
+    @classmethod
+    def check_applies_to(cls, applies_to):
+        return _validate_applies_to(applies_to)
+
 
 class PriceModifierRead(PriceModifierBase):
     id: int
@@ -34,3 +81,17 @@ class PriceCalculationResult(BaseModel):
     base_price: float
     final_price: float
     modifiers_applied: List[Dict]
+
+
+class SeatPriceClass(BaseModel):
+    """Seats that end up with the same modifiers (and so the same price)."""
+    final_price: float
+    modifiers_applied: List[Dict]
+    seat_codes: List[str]
+
+
+class ShowtimeQuote(BaseModel):
+    showtime_id: int
+    base_price: float
+    total_seats: int
+    classes: List[SeatPriceClass]
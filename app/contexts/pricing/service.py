@@ -1,18 +1,26 @@
 # app/contexts/pricing/service.py
+import zlib
+from typing import Optional, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from app.shared.services.event_publisher import publish_event_async
 
-from .repository import PricingRepository
-from .schemas import PriceCalculationResult
+from .repository import PricingRepository, AsyncPricingRepository
+from .schemas import PriceCalculationResult, SeatPriceClass, ShowtimeQuote
 from .events import (
-    pricing_snapshot_created_event,
     pricing_modifier_created_event,
     pricing_modifier_updated_event,
     pricing_modifier_deleted_event,
 )
+from app.core.errors import NotFoundError
+from app.contexts.screen.layout_index import CompiledSeatLayout, layout_index_cache
+from app.contexts.screen.repository import AsyncSeatLayoutRepository
+
 from .models import PriceModifier
+from .engine import BASE_PRICE, CompiledPricingPipeline, PricingContext, pricing_engine
 
-BASE_PRICE = 1000
+MAX_CACHED_QUOTES = 1000
 
 
 class PricingService:
@@ -20,58 +28,129 @@ class PricingService:
     
     def __init__(self):
         self.repo = PricingRepository()
+        self.async_repo = AsyncPricingRepository()
+        self.async_layout_repo = AsyncSeatLayoutRepository()
 
-    def calculate_price(self, db: Session) -> PriceCalculationResult:
+    def calculate_price(
+        self,
+        db: Session,
+        context: PricingContext = None,
+    ) -> PriceCalculationResult:
         """
         Pure calculation function - stays sync since it's just math.
         This can be called from both sync and async contexts.
+
+        Runs the cached pricing pipeline; `db` is only used to compile
+        the pipeline when it is missing or stale. Without a context only
+        untargeted modifiers (no applies_to) are applied.
+        """
+        return pricing_engine.get(db).evaluate(context)
+
+    @staticmethod
+    def seat_context(
+        showtime,
+        layout: Optional[CompiledSeatLayout] = None,
+        seat_code: str = None,
+    ) -> PricingContext:
+        """
+        Pricing context from anything with the Showtime pricing columns
+        (a Showtime or a get_showtime_facts row) and a compiled layout.
         """
-        active_modifiers = self.repo.list_active_modifiers(db)
-
-        price = BASE_PRICE
-        applied = []
-
-        for modifier in active_modifiers:
-            # Add entry to snapshot
-            applied.append({
-                "name": modifier.name,
-                "modifier_type": modifier.modifier_type,
-                "amount": modifier.amount,
-            })
-
-            # Apply the math
-            if modifier.modifier_type == "additive":
-                price += modifier.amount
-            elif modifier.modifier_type == "multiplicative":
-                price *= modifier.amount
-
-        return PriceCalculationResult(
-            base_price=BASE_PRICE,
-            modifiers_applied=applied,
-            final_price=price,
+        row = seat_type = None
+        position = layout.index.get(seat_code) if layout and seat_code else None
+        if position is not None:
+            row = layout.row_of(position)
+            seat_type = layout.seat_type(seat_code)
+
+        return PricingContext.for_showtime(
+            format=showtime.format.value,
+            screen_id=showtime.screen_id,
+            movie_id=showtime.movie_id,
+            start_time=showtime.start_time,
+            row=row,
+            seat_type=seat_type,
         )
 
-    async def create_snapshot_from_event(
+    # ===== SHOWTIME QUOTES =====
+
+    async def quote_showtime_async(
         self,
-        db: Session,
-        order_id: int,
-    ) -> PriceCalculationResult:
+        db: AsyncSession,
+        showtime_id: int,
+        if_none_match: Optional[str] = None,
+    ) -> Tuple[str, Optional[ShowtimeQuote]]:
         """
-        Async service function for event handling.
-        Calculates pricing and publishes event.
+        Price every seat of a showtime.
+
+        Returns (etag, quote); quote is None when if_none_match already
+        matches. The ETag is built from content (modifiers, seat layout and
+        the showtime's priced attributes), so every worker computes the same
+        one for the same prices. Quotes are kept on the pipeline so they are
+        dropped with it.
         """
-        # Calculate pricing (sync operation)
-        result = self.calculate_price(db)
+        facts = await self.async_repo.get_showtime_facts(db, showtime_id)
+        if facts is None:
+            raise NotFoundError("Showtime not found")
 
-        # Publish event using async version
-        event = pricing_snapshot_created_event(
-            order_id=order_id,
-            snapshot=result.model_dump()
+        layout = layout_index_cache.peek(facts.seat_layout_id)
+        if layout is None:
+            seat_layout = await self.async_layout_repo.get_by_id(db, facts.seat_layout_id)
+            if seat_layout is None:
+                raise NotFoundError("Seat layout not found")
+            layout = layout_index_cache.get(seat_layout)
+
+        pipeline = await pricing_engine.get_async(db)
+
+        facts_key = zlib.crc32(repr(tuple(facts)).encode())
+        etag = f'W/"{showtime_id}-{pipeline.fingerprint}-{layout.fingerprint}-{facts_key:08x}"'
+        if if_none_match and etag in {tag.strip() for tag in if_none_match.split(",")}:
+            return etag, None
+
+        quote = pipeline.quotes.get(etag)
+        if quote is None:
+            quote = self._build_quote(showtime_id, facts, layout, pipeline)
+            if len(pipeline.quotes) >= MAX_CACHED_QUOTES:
+                pipeline.quotes.clear()
+            pipeline.quotes[etag] = quote
+        return etag, quote
+
+    def _build_quote(
+        self,
+        showtime_id: int,
+        facts,
+        layout: CompiledSeatLayout,
+        pipeline: CompiledPricingPipeline,
+    ) -> ShowtimeQuote:
+        """One evaluation per (row, seat type); seats are grouped by outcome."""
+        seats_by_mask: dict = {}
+        contexts: dict = {}
+        for row in layout.rows:
+            for seat_code in layout.row_seats(row):
+                seat_type = layout.seat_type(seat_code)
+                context = contexts.get((row, seat_type))
+                if context is None:
+                    context = contexts[(row, seat_type)] = self.seat_context(
+                        facts, layout, seat_code
+                    )
+                mask = pipeline.match(context)
+                seats_by_mask.setdefault(mask, (context, []))[1].append(seat_code)
+
+        classes = []
+        for context, seat_codes in seats_by_mask.values():
+            result = pipeline.evaluate(context)
+            classes.append(SeatPriceClass(
+                final_price=result.final_price,
+                modifiers_applied=result.modifiers_applied,
+                seat_codes=seat_codes,
+            ))
+
+        return ShowtimeQuote(
+            showtime_id=showtime_id,
+            base_price=pipeline.base_price,
+            total_seats=layout.total_seats,
+            classes=classes,
         )
-        await publish_event_async(event["type"], event["payload"])
 
-        return result
-    
     # ===== MODIFIER CRUD (for admin) =====
     
     async def create_modifier(
@@ -120,4 +199,14 @@ class PricingService:
     
     def list_modifiers(self, db: Session):
         """List all modifiers."""
-        return self.repo.list_modifiers(db)
\ No newline at end of file
+        return self.repo.list_modifiers(db)
+
+    # ===== READ OPERATIONS (async) =====
+
+    async def get_modifier_async(self, db: AsyncSession, modifier_id: int):
+        """Get modifier by ID."""
+        return await self.async_repo.get_modifier_by_id(db, modifier_id)
+
+    async def list_modifiers_async(self, db: AsyncSession):
+        """List all modifiers."""
+        return await self.async_repo.list_modifiers(db)
@@ -2,7 +2,7 @@
 import logging
 from typing import Dict, Any
 
-from app.core.database import SessionLocal
+from app.core.unit_of_work import event_session
 from app.core.event_bus import event_bus
 
 from .service import RefundService
@@ -27,24 +27,22 @@ async def on_refund_approved(payload: Dict[str, Any]) -> None:
 
     logger.info(f"💳 Processing approved refund {refund_request_id}")
 
-    db = SessionLocal()
-    try:
-        # Mock provider refund ID
-        provider_refund_id = f"mock_refund_{refund_request_id}"
+    with event_session() as db:
+        try:
+            # Mock provider refund ID
+            provider_refund_id = f"mock_refund_{refund_request_id}"
         
-        await refund_service.complete_refund(
-            db=db,
-            refund_request_id=refund_request_id,
-            provider_refund_id=provider_refund_id,
-            user_id=user_id,
-        )
-        logger.info(f"✓ Refund {refund_request_id} completed with provider ID: {provider_refund_id}")
-    except Exception as e:
-        logger.error(f"❌ Failed to complete refund {refund_request_id}: {e}")
-        raise
-    finally:
-        db.close()
+            await refund_service.complete_refund(
+                db=db,
+                refund_request_id=refund_request_id,
+                provider_refund_id=provider_refund_id,
+                user_id=user_id,
+            )
+            logger.info(f"✓ Refund {refund_request_id} completed with provider ID: {provider_refund_id}")
+        except Exception as e:
+            logger.error(f"❌ Failed to complete refund {refund_request_id}: {e}")
+            raise
 
 
 # Register with event bus
-event_bus.subscribe("refund.request_approved", on_refund_approved)
\ No newline at end of file
+event_bus.subscribe("refund.request_approved", on_refund_approved, blocking=True)
\ No newline at end of file
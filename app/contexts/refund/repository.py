@@ -1,3 +1,4 @@
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from sqlalchemy import select
 
@@ -27,4 +28,18 @@ class RefundRepository:
         db.add(refund_request)
         db.commit()
         db.refresh(refund_request)
-        return refund_request
\ No newline at end of file
+        return refund_request
+
+
+class AsyncRefundRepository:
+
+    async def get_by_id(self, db: AsyncSession, refund_request_id: int):
+        return await db.get(RefundRequest, refund_request_id)
+
+    async def list_by_payment_attempt_id(self, db: AsyncSession, payment_attempt_id: int):
+        stmt = select(RefundRequest).where(RefundRequest.payment_attempt_id == payment_attempt_id)
+        return (await db.scalars(stmt)).all()
+
+    async def list_by_reservation_id(self, db: AsyncSession, reservation_id: int):
+        stmt = select(RefundRequest).where(RefundRequest.reservation_id == reservation_id)
+        return (await db.scalars(stmt)).all()
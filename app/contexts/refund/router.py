@@ -1,8 +1,9 @@
 # app/contexts/refund/router.py
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.core.database import get_db
+from app.core.database import get_db, get_async_db
 from app.contexts.auth.dependencies import get_current_user
 from app.contexts.reservation.repository import ReservationRepository
 from app.contexts.payment.repository import PaymentRepository
@@ -55,30 +56,30 @@ async def create_refund_request(
 
 
 @router.get("/payment/{payment_attempt_id}", response_model=list[RefundRead])
-def list_refunds_for_payment(
+async def list_refunds_for_payment(
     payment_attempt_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user = Depends(get_current_user),
 ):
     """List refunds for a payment."""
-    return refund_service.list_refunds_for_payment(db, payment_attempt_id)
+    return await refund_service.list_refunds_for_payment_async(db, payment_attempt_id)
 
 
 @router.get("/reservation/{reservation_id}", response_model=list[RefundRead])
-def list_refunds_for_reservation(
+async def list_refunds_for_reservation(
     reservation_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user = Depends(get_current_user),
 ):
     """List refunds for a reservation."""
-    return refund_service.list_refunds_for_reservation(db, reservation_id)
+    return await refund_service.list_refunds_for_reservation_async(db, reservation_id)
 
 
 @router.get("/{refund_request_id}", response_model=RefundRead)
-def get_refund_request(
+async def get_refund_request(
     refund_request_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user = Depends(get_current_user),
 ):
     """Get a refund request by ID."""
-    return refund_service.get_refund_request(db, refund_request_id)
\ No newline at end of file
+    return await refund_service.get_refund_request_async(db, refund_request_id)
\ No newline at end of file
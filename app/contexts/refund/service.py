@@ -1,11 +1,12 @@
 # app/contexts/refund/service.py
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.core.errors import NotFoundError, ConflictError
-from app.shared.services.event_publisher import publish_event_async
+from app.shared.services.event_publisher import stage_event
 
 from .models import RefundRequest, RefundStatus
-from .repository import RefundRepository
+from .repository import RefundRepository, AsyncRefundRepository
 from .events import (
     refund_request_created_event,
     refund_request_approved_event,
@@ -19,6 +20,7 @@ class RefundService:
     
     def __init__(self):
         self.repo = RefundRepository()
+        self.async_repo = AsyncRefundRepository()
 
     async def create_refund_request(
         self,
@@ -38,7 +40,8 @@ class RefundService:
             status=RefundStatus.PENDING,
         )
 
-        refund_request = self.repo.create(db, refund_request)
+        db.add(refund_request)
+        db.flush()  # Get the ID without committing
 
         event = refund_request_created_event(
             refund_request_id=refund_request.id,
@@ -48,7 +51,10 @@ class RefundService:
             reason=reason,
             user_id=user_id,
         )
-        await publish_event_async(event["type"], event["payload"])
+        stage_event(db, event["type"], event["payload"])
+
+        db.commit()
+        db.refresh(refund_request)
 
         return refund_request
 
@@ -67,13 +73,15 @@ class RefundService:
             raise ConflictError(f"Refund request is not pending (current: {refund_request.status})")
 
         refund_request.status = RefundStatus.APPROVED
-        refund_request = self.repo.save(db, refund_request)
 
         event = refund_request_approved_event(
             refund_request_id=refund_request.id,
             user_id=user_id,
         )
-        await publish_event_async(event["type"], event["payload"])
+        stage_event(db, event["type"], event["payload"])
+
+        db.commit()
+        db.refresh(refund_request)
 
         return refund_request
 
@@ -94,14 +102,16 @@ class RefundService:
 
         refund_request.status = RefundStatus.REJECTED
         refund_request.rejection_reason = rejection_reason
-        refund_request = self.repo.save(db, refund_request)
 
         event = refund_request_rejected_event(
             refund_request_id=refund_request.id,
             rejection_reason=rejection_reason,
             user_id=user_id,
         )
-        await publish_event_async(event["type"], event["payload"])
+        stage_event(db, event["type"], event["payload"])
+
+        db.commit()
+        db.refresh(refund_request)
 
         return refund_request
 
@@ -122,14 +132,16 @@ class RefundService:
 
         refund_request.status = RefundStatus.COMPLETED
         refund_request.provider_refund_id = provider_refund_id
-        refund_request = self.repo.save(db, refund_request)
 
         event = refund_request_completed_event(
             refund_request_id=refund_request.id,
             provider_refund_id=provider_refund_id,
             user_id=user_id,
         )
-        await publish_event_async(event["type"], event["payload"])
+        stage_event(db, event["type"], event["payload"])
+
+        db.commit()
+        db.refresh(refund_request)
 
         return refund_request
     
@@ -148,4 +160,21 @@ class RefundService:
     
     def list_refunds_for_reservation(self, db: Session, reservation_id: int):
         """List refunds for a reservation."""
-        return self.repo.list_by_reservation_id(db, reservation_id)
\ No newline at end of file
+        return self.repo.list_by_reservation_id(db, reservation_id)
+
+    # ===== READ OPERATIONS (async) =====
+
+    async def get_refund_request_async(self, db: AsyncSession, refund_request_id: int):
+        """Get refund request by ID."""
+        refund_request = await self.async_repo.get_by_id(db, refund_request_id)
+        if not refund_request:
+            raise NotFoundError("Refund request not found")
+        return refund_request
+
+    async def list_refunds_for_payment_async(self, db: AsyncSession, payment_attempt_id: int):
+        """List refunds for a payment."""
+        return await self.async_repo.list_by_payment_attempt_id(db, payment_attempt_id)
+
+    async def list_refunds_for_reservation_async(self, db: AsyncSession, reservation_id: int):
+        """List refunds for a reservation."""
+        return await self.async_repo.list_by_reservation_id(db, reservation_id)
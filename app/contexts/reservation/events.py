@@ -2,6 +2,9 @@
 
 """
 Domain events emitted by ReservationContext.
+
+order_id is the order the booking saga created (and priced) in the
+same transaction as the reservation.
 """
 
 
@@ -10,6 +13,8 @@ def reservation_created_event(
     user_id: int,
     showtime_id: int,
     seat_code: str,
+    expires_at: str,
+    order_id: int,
 ) -> dict:
     return {
         "type": "reservation.created",
@@ -18,23 +23,59 @@ def reservation_created_event(
             "user_id": user_id,
             "showtime_id": showtime_id,
             "seat_code": seat_code,
+            "expires_at": expires_at,
+            "order_id": order_id,
+        },
+    }
+
+
+def reservation_batch_created_event(
+    user_id: int,
+    showtime_id: int,
+    reservations: list[dict],
+    expires_at: str,
+) -> dict:
+    """reservations: [{"reservation_id": ..., "seat_code": ..., "order_id": ...}, ...]"""
+    return {
+        "type": "reservation.batch_created",
+        "payload": {
+            "user_id": user_id,
+            "showtime_id": showtime_id,
+            "reservations": reservations,
+            "expires_at": expires_at,
         },
     }
 
 
-def reservation_cancelled_event(reservation_id: int) -> dict:
+def reservation_cancelled_event(
+    reservation_id: int,
+    user_id: int,
+    showtime_id: int,
+    seat_code: str,
+) -> dict:
     return {
         "type": "reservation.cancelled",
         "payload": {
             "reservation_id": reservation_id,
+            "user_id": user_id,
+            "showtime_id": showtime_id,
+            "seat_code": seat_code,
         },
     }
 
 
-def reservation_expired_event(reservation_id: int) -> dict:
+def reservation_expired_event(
+    reservation_id: int,
+    user_id: int,
+    showtime_id: int,
+    seat_code: str,
+) -> dict:
     return {
         "type": "reservation.expired",
         "payload": {
             "reservation_id": reservation_id,
+            "user_id": user_id,
+            "showtime_id": showtime_id,
+            "seat_code": seat_code,
         },
     }
\ No newline at end of file
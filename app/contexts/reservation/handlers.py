@@ -1,13 +1,22 @@
 # app/contexts/reservation/handlers.py
-from app.core.database import SessionLocal
+from datetime import datetime
+
+from app.core.unit_of_work import event_session
 from app.core.event_bus import event_bus
 
 from .models import ReservationStatus
 from .service import ReservationService
+from .worker import reservation_expiration_scheduler
 
 reservation_service = ReservationService()
 
 
+async def on_reservation_created(payload: dict):
+    """reservation.created / reservation.batch_created: wake the expiry scheduler"""
+    if payload.get("expires_at"):
+        reservation_expiration_scheduler.schedule(datetime.fromisoformat(payload["expires_at"]))
+
+
 async def on_seat_expired(payload: dict):
     showtime_id = payload.get("showtime_id")
     seat_code = payload.get("seat_code")
@@ -15,8 +24,7 @@ async def on_seat_expired(payload: dict):
     if not showtime_id or not seat_code:
         return
 
-    db = SessionLocal()
-    try:
+    with event_session() as db:
         # Get reservation directly from repo (handler doesn't go through service for this)
         from .repository import ReservationRepository
         repo = ReservationRepository()
@@ -28,8 +36,6 @@ async def on_seat_expired(payload: dict):
         )
         if reservation:
             await reservation_service.expire_reservation(db, reservation=reservation)
-    finally:
-        db.close()
 
 
 async def on_showtime_cancelled(payload: dict):
@@ -37,8 +43,7 @@ async def on_showtime_cancelled(payload: dict):
     if not showtime_id:
         return
 
-    db = SessionLocal()
-    try:
+    with event_session() as db:
         from .repository import ReservationRepository
         repo = ReservationRepository()
         
@@ -49,8 +54,6 @@ async def on_showtime_cancelled(payload: dict):
                 reservation_id=res.id,
                 allow_admin_override=True,
             )
-    finally:
-        db.close()
 
 
 async def on_admin_force_cancel_reservation(payload: dict):
@@ -58,17 +61,16 @@ async def on_admin_force_cancel_reservation(payload: dict):
     if not reservation_id:
         return
 
-    db = SessionLocal()
-    try:
+    with event_session() as db:
         await reservation_service.cancel_reservation(
             db,
             reservation_id=reservation_id,
             allow_admin_override=True,
         )
-    finally:
-        db.close()
 
 
-event_bus.subscribe("seat.expired", on_seat_expired)
-event_bus.subscribe("showtime.cancelled", on_showtime_cancelled)
-event_bus.subscribe("admin.force_cancel_reservation", on_admin_force_cancel_reservation)
\ No newline at end of file
+event_bus.subscribe("reservation.created", on_reservation_created, group="reservation")
+event_bus.subscribe("reservation.batch_created", on_reservation_created, group="reservation")
+event_bus.subscribe("seat.expired", on_seat_expired, group="reservation", blocking=True)
+event_bus.subscribe("showtime.cancelled", on_showtime_cancelled, group="reservation", blocking=True)
+event_bus.subscribe("admin.force_cancel_reservation", on_admin_force_cancel_reservation, group="reservation", blocking=True)
\ No newline at end of file
@@ -9,6 +9,7 @@ from sqlalchemy import (
     Enum as SAEnum,
     ForeignKey,
     Index,
+    text,
 )
 from sqlalchemy.orm import relationship
 
@@ -51,4 +52,10 @@ class Reservation(Base):
             "showtime_id",
             "seat_code"
         ),
+        # Expiration scheduler: next ACTIVE deadlines, in order
+        Index(
+            "idx_reservation_active_expires",
+            "expires_at",
+            postgresql_where=text("status = 'ACTIVE'"),
+        ),
     )
\ No newline at end of file
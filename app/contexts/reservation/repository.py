@@ -2,8 +2,9 @@
 from datetime import datetime
 from typing import List, Optional
 
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from sqlalchemy import select
+from sqlalchemy import select, update, and_
 
 from .models import Reservation, ReservationStatus
 
@@ -55,6 +56,52 @@ class ReservationRepository:
         )
         return db.scalars(stmt).all()
 
+    def list_upcoming_expiries(self, db: Session, limit: int) -> List[datetime]:
+        """Next ACTIVE reservation deadlines (served by idx_reservation_active_expires)."""
+        stmt = (
+            select(Reservation.expires_at)
+            .where(
+                Reservation.status == ReservationStatus.ACTIVE,
+                Reservation.expires_at.is_not(None),
+            )
+            .order_by(Reservation.expires_at)
+            .limit(limit)
+        )
+        return db.scalars(stmt).all()
+
+    def expire_batch(self, db: Session, now: datetime, limit: int):
+        """
+        Mark up to `limit` due reservations EXPIRED in one statement (no commit).
+
+        Rows are claimed with SKIP LOCKED so concurrent sweepers never
+        expire the same reservation twice. Returns (id, user_id,
+        showtime_id, seat_code) rows.
+        """
+        is_due = and_(
+            Reservation.status == ReservationStatus.ACTIVE,
+            Reservation.expires_at <= now,
+        )
+        due_ids = (
+            select(Reservation.id)
+            .where(is_due)
+            .order_by(Reservation.expires_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        stmt = (
+            update(Reservation)
+            .where(Reservation.id.in_(due_ids.scalar_subquery()), is_due)
+            .values(status=ReservationStatus.EXPIRED, expires_at=None)
+            .returning(
+                Reservation.id,
+                Reservation.user_id,
+                Reservation.showtime_id,
+                Reservation.seat_code,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        return db.execute(stmt).all()
+
     def create(self, db: Session, reservation: Reservation) -> Reservation:
         """Create a new reservation."""
         db.add(reservation)
@@ -67,4 +114,42 @@ class ReservationRepository:
         db.add(reservation)
         db.commit()
         db.refresh(reservation)
-        return reservation
\ No newline at end of file
+        return reservation
+
+
+class AsyncReservationRepository:
+    """Async repository for Reservation aggregate."""
+
+    async def get_by_id(self, db: AsyncSession, reservation_id: int) -> Optional[Reservation]:
+        """Get reservation by ID."""
+        return await db.get(Reservation, reservation_id)
+
+    async def list_for_user(self, db: AsyncSession, user_id: int) -> List[Reservation]:
+        """List all reservations for a user."""
+        stmt = (
+            select(Reservation)
+            .where(Reservation.user_id == user_id)
+            .order_by(Reservation.created_at.desc())
+        )
+        return (await db.scalars(stmt)).all()
+
+    async def get_active_by_showtime_and_seat(
+        self,
+        db: AsyncSession,
+        showtime_id: int,
+        seat_code: str,
+    ) -> Optional[Reservation]:
+        """Get active reservation for a specific seat at a showtime."""
+        stmt = select(Reservation).where(
+            Reservation.showtime_id == showtime_id,
+            Reservation.seat_code == seat_code,
+            Reservation.status == ReservationStatus.ACTIVE,
+        )
+        return (await db.scalars(stmt)).first()
+
+    async def save(self, db: AsyncSession, reservation: Reservation) -> Reservation:
+        """Create or update a reservation."""
+        db.add(reservation)
+        await db.commit()
+        await db.refresh(reservation)
+        return reservation
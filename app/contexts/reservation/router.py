@@ -1,13 +1,16 @@
 # app/contexts/reservation/router.py
 from fastapi import APIRouter, Depends, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.core.database import get_db
+from app.core.database import get_db, get_async_db
 from app.core.errors import NotFoundError
 from ..auth.dependencies import get_current_user  
+from .saga import booking_saga
 from .service import ReservationService
 from .schemas import (
     ReservationCreate,
+    ReservationBatchCreate,
     ReservationRead,
 )
 
@@ -26,28 +29,45 @@ async def create_reservation_route(
     db: Session = Depends(get_db),
     current_user = Depends(get_current_user),  
 ):
-    return await reservation_service.create_reservation(
-        db=db, 
-        user_id=current_user.id, 
-        data=payload
+    reservations = await booking_saga.book(
+        db=db,
+        user_id=current_user.id,
+        showtime_id=payload.showtime_id,
+        seat_codes=[payload.seat_code],
     )
+    return reservations[0]
 
 
-@router.get("/", response_model=list[ReservationRead])
-def list_reservations_route(
+@router.post("/batch", response_model=list[ReservationRead])
+async def create_reservations_route(
+    payload: ReservationBatchCreate,
     db: Session = Depends(get_db),
+    current_user = Depends(get_current_user),
+):
+    """Reserve several seats at once (all or nothing)."""
+    return await booking_saga.book(
+        db=db,
+        user_id=current_user.id,
+        showtime_id=payload.showtime_id,
+        seat_codes=payload.seat_codes,
+    )
+
+
+@router.get("/", response_model=list[ReservationRead])
+async def list_reservations_route(
+    db: AsyncSession = Depends(get_async_db),
     current_user = Depends(get_current_user), 
 ):
-    return reservation_service.list_user_reservations(db, current_user.id)
+    return await reservation_service.list_user_reservations_async(db, current_user.id)
 
 
 @router.get("/{reservation_id}", response_model=ReservationRead)
-def get_reservation_route(
+async def get_reservation_route(
     reservation_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user = Depends(get_current_user),  
 ):
-    reservation = reservation_service.get_reservation(db, reservation_id)
+    reservation = await reservation_service.get_reservation_async(db, reservation_id)
     
     # Check ownership
     if reservation.user_id != current_user.id:
@@ -0,0 +1,171 @@
+# app/contexts/reservation/saga.py
+
+"""
+Booking saga.
+
+Booking a seat used to be a chain of event handlers, each with its own
+session and commit: reservation -> seat lock -> order (final_amount=0) ->
+pricing snapshot -> order update. The saga runs every step in the
+caller's transaction and commits once; the domain events are staged in
+the same transaction and delivered afterwards by the outbox relay.
+
+It is the only way seats are booked, so the events are notifications of
+work already done: no handler locks seats, creates orders or prices
+them in response.
+"""
+
+import logging
+from datetime import datetime, timezone
+from typing import List
+
+from sqlalchemy.orm import Session
+
+from app.shared.services.event_publisher import stage_event
+from app.contexts.order.events import order_created_event
+from app.contexts.order.models import Order
+from app.contexts.pricing.events import pricing_snapshot_created_event
+from app.contexts.pricing.service import PricingService
+from app.contexts.screen.layout_index import layout_index_cache
+from app.contexts.seat_availability.events import seat_locked_event, seat_batch_locked_event
+from app.contexts.seat_availability.service import SeatAvailabilityService
+from app.contexts.showtime.models import Showtime
+
+from .events import reservation_created_event, reservation_batch_created_event
+from .models import Reservation, ReservationStatus
+from .service import ReservationService, RESERVATION_DURATION
+
+logger = logging.getLogger(__name__)
+
+
+class BookingSaga:
+    """Reserve, lock, order and price a group of seats in one transaction."""
+
+    def __init__(self):
+        self.reservation_service = ReservationService()
+        self.seat_service = SeatAvailabilityService()
+        self.pricing_service = PricingService()
+
+    async def book(
+        self,
+        db: Session,
+        user_id: int,
+        showtime_id: int,
+        seat_codes: List[str],
+    ) -> List[Reservation]:
+        """
+        Book seats all-or-nothing. A single seat emits reservation.created,
+        several emit reservation.batch_created (like the plain endpoints).
+        """
+        layout = self.reservation_service._get_layout_for_showtime(db, showtime_id)
+        for seat_code in seat_codes:
+            self.reservation_service._validate_seat_code(layout, seat_code)
+        compiled = layout_index_cache.get(layout)
+        showtime = db.get(Showtime, showtime_id)  # Already in the identity map
+
+        # 1. Seat locks (rolls back and raises ConflictError if any is taken)
+        seat_locks = self.seat_service.acquire_locks(db, showtime_id, seat_codes, user_id)
+
+        # 2. Reservations
+        now = datetime.now(timezone.utc)
+        expires_at = now + RESERVATION_DURATION
+        reservations = [
+            Reservation(
+                user_id=user_id,
+                showtime_id=showtime_id,
+                seat_code=seat_lock.seat_code,
+                status=ReservationStatus.ACTIVE,
+                expires_at=expires_at,
+            )
+            for seat_lock in seat_locks
+        ]
+        db.add_all(reservations)
+        db.flush()
+
+        # 3. Orders, priced up front
+        snapshots = []
+        for reservation in reservations:
+            context = self.pricing_service.seat_context(showtime, compiled, reservation.seat_code)
+            snapshots.append(self.pricing_service.calculate_price(db, context).model_dump())
+
+        orders = [
+            Order(
+                user_id=user_id,
+                reservation_id=reservation.id,
+                pricing_snapshot=snapshot,
+                final_amount=snapshot["final_price"],
+                is_completed=False,
+            )
+            for reservation, snapshot in zip(reservations, snapshots)
+        ]
+        db.add_all(orders)
+        db.flush()
+
+        # 4. Domain events, delivered after commit
+        self._stage_events(db, user_id, showtime_id, seat_locks, reservations, orders)
+
+        db.commit()
+        for reservation in reservations:
+            db.refresh(reservation)
+
+        logger.info(
+            f"🎟️ Booked {len(reservations)} seat(s) for user {user_id} "
+            f"on showtime {showtime_id} (orders {[o.id for o in orders]})"
+        )
+        return reservations
+
+    @staticmethod
+    def _stage_events(db, user_id, showtime_id, seat_locks, reservations, orders) -> None:
+        lock_expires_at = seat_locks[0].lock_expires_at.isoformat()
+        expires_at = reservations[0].expires_at.isoformat()
+
+        if len(reservations) == 1:
+            reservation, order = reservations[0], orders[0]
+            events = [
+                seat_locked_event(showtime_id, reservation.seat_code, user_id, lock_expires_at),
+                reservation_created_event(
+                    reservation_id=reservation.id,
+                    user_id=user_id,
+                    showtime_id=showtime_id,
+                    seat_code=reservation.seat_code,
+                    expires_at=expires_at,
+                    order_id=order.id,
+                ),
+            ]
+        else:
+            events = [
+                seat_batch_locked_event(
+                    showtime_id=showtime_id,
+                    seat_codes=[seat_lock.seat_code for seat_lock in seat_locks],
+                    user_id=user_id,
+                    expires_at=lock_expires_at,
+                ),
+                reservation_batch_created_event(
+                    user_id=user_id,
+                    showtime_id=showtime_id,
+                    reservations=[
+                        {"reservation_id": r.id, "seat_code": r.seat_code, "order_id": o.id}
+                        for r, o in zip(reservations, orders)
+                    ],
+                    expires_at=expires_at,
+                ),
+            ]
+
+        for reservation, order in zip(reservations, orders):
+            events.append(order_created_event(
+                order_id=order.id,
+                reservation_id=reservation.id,
+                user_id=user_id,
+                showtime_id=showtime_id,
+                seat_code=reservation.seat_code,
+                final_amount=order.final_amount,
+            ))
+            events.append(pricing_snapshot_created_event(
+                order_id=order.id,
+                snapshot=order.pricing_snapshot,
+            ))
+
+        for event in events:
+            stage_event(db, event["type"], event["payload"])
+
+
+booking_saga = BookingSaga()
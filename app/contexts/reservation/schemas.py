@@ -1,7 +1,9 @@
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+
+from app.core.config import settings
 
 from .models import ReservationStatus
 
@@ -16,6 +18,11 @@ class ReservationCreate(ReservationBase):
     pass 
 
 
+class ReservationBatchCreate(BaseModel):
+    showtime_id: int
+    seat_codes: List[str] = Field(min_length=1, max_length=settings.SEAT_BATCH_MAX_SEATS)
+
+
 class ReservationUpdate(BaseModel):
     status: Optional[ReservationStatus] = None
 
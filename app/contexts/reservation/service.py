@@ -1,27 +1,27 @@
 # app/contexts/reservation/service.py
 from datetime import datetime, timedelta, timezone
 
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from app.core.config import settings
 from app.core.errors import ValidationError, NotFoundError, ConflictError
-from app.shared.services.event_publisher import publish_event_async
+from app.shared.services.event_publisher import stage_event
 
-from app.contexts.seat_availability.repository import SeatLockRepository
-from app.contexts.seat_availability.models import StatusEnum
 from app.contexts.showtime.models import Showtime
 from app.contexts.screen.models import Screen, SeatLayout
+from app.contexts.screen.layout_index import layout_index_cache
 
 from .models import Reservation, ReservationStatus
-from .schemas import ReservationCreate
-from .repository import ReservationRepository
+from .repository import ReservationRepository, AsyncReservationRepository
 from .events import (
-    reservation_created_event,
     reservation_cancelled_event,
     reservation_expired_event,
 )
 
 
 RESERVATION_DURATION = timedelta(minutes=10)
+EXPIRE_BATCH_SIZE = settings.EXPIRATION_BATCH_SIZE
 
 
 class ReservationService:
@@ -29,120 +29,7 @@ class ReservationService:
     
     def __init__(self):
         self.repo = ReservationRepository()
-        self.seat_repo = SeatLockRepository()
-
-    async def create_reservation(
-        self,
-        db: Session,
-        user_id: int,
-        data: ReservationCreate,
-    ) -> Reservation:
-        """Create a new reservation."""
-        # Basic validation
-        if not data.seat_code:
-            raise ValidationError("Seat code is required")
-
-        # ===== VALIDATE SEAT EXISTS IN LAYOUT =====
-        # Get showtime to find screen
-        showtime = db.get(Showtime, data.showtime_id)
-        if not showtime:
-            raise NotFoundError("Showtime not found")
-        
-        # Get screen and layout
-        screen = db.get(Screen, showtime.screen_id)
-        if not screen:
-            raise NotFoundError("Screen not found")
-        
-        layout = db.get(SeatLayout, screen.seat_layout_id)
-        if not layout:
-            raise NotFoundError("Seat layout not found")
-        
-        # Validate seat code exists in grid
-        if layout.grid:
-            # Parse seat code (e.g., "A-5" -> row "A", seat "5")
-            try:
-                row_part, seat_num = data.seat_code.split('-')
-                seat_num = int(seat_num)
-            except (ValueError, AttributeError):
-                raise ValidationError(
-                    f"Invalid seat code format: {data.seat_code}",
-                    {"expected_format": "ROW-NUMBER (e.g., A-5)"}
-                )
-            
-            # Check if row exists
-            if row_part not in layout.grid:
-                raise ValidationError(
-                    f"Invalid row: {row_part}",
-                    {"available_rows": list(layout.grid.keys())}
-                )
-            
-            # Check if seat exists in row
-            row_seats = layout.grid[row_part]
-            if data.seat_code not in row_seats:
-                raise ValidationError(
-                    f"Seat {data.seat_code} does not exist in row {row_part}",
-                    {"available_seats": [s for s in row_seats if s != "AISLE"]}
-                )
-        # If no grid, fall back to basic validation (rows x seats_per_row)
-        else:
-            try:
-                row_part, seat_num = data.seat_code.split('-')
-                seat_num = int(seat_num)
-                
-                # Basic bounds check
-                if seat_num < 1 or seat_num > layout.seats_per_row:
-                    raise ValidationError(
-                        f"Seat number must be between 1 and {layout.seats_per_row}"
-                    )
-            except (ValueError, AttributeError):
-                raise ValidationError("Invalid seat code format")
-        # ===== END SEAT VALIDATION =====
-
-        # ===== PRE-CHECK SEAT AVAILABILITY =====
-        seat_lock = self.seat_repo.get_by_showtime_and_code(
-            db, 
-            data.showtime_id, 
-            data.seat_code
-        )
-        
-        # If seat exists and is not available, reject immediately
-        if seat_lock:
-            if seat_lock.status == StatusEnum.RESERVED:
-                raise ValidationError(
-                    "Seat is already reserved",
-                    {"seat_code": data.seat_code}
-                )
-            if seat_lock.status == StatusEnum.LOCKED and seat_lock.locked_by_user_id != user_id:
-                raise ValidationError(
-                    "Seat is locked by another user",
-                    {"seat_code": data.seat_code}
-                )
-        # ===== END PRE-CHECK =====
-
-        # Expiration time aligned with seat lock duration
-        now = datetime.now(timezone.utc)
-        expires_at = now + RESERVATION_DURATION
-
-        reservation = Reservation(
-            user_id=user_id,
-            showtime_id=data.showtime_id,
-            seat_code=data.seat_code,
-            status=ReservationStatus.ACTIVE,
-            expires_at=expires_at,
-        )
-
-        reservation = self.repo.create(db, reservation)
-
-        # Emit event
-        event = reservation_created_event(
-            reservation_id=reservation.id,
-            user_id=user_id,
-            showtime_id=data.showtime_id,
-            seat_code=data.seat_code,
-        )
-        await publish_event_async(event["type"], event["payload"])
-
-        return reservation
+        self.async_repo = AsyncReservationRepository()
 
     async def cancel_reservation(
         self,
@@ -168,11 +55,17 @@ class ReservationService:
         reservation.status = ReservationStatus.CANCELLED
         reservation.expires_at = None
 
-        reservation = self.repo.save(db, reservation)
-
         # Emit event
-        event = reservation_cancelled_event(reservation.id)
-        await publish_event_async(event["type"], event["payload"])
+        event = reservation_cancelled_event(
+            reservation_id=reservation.id,
+            user_id=reservation.user_id,
+            showtime_id=reservation.showtime_id,
+            seat_code=reservation.seat_code,
+        )
+        stage_event(db, event["type"], event["payload"])
+
+        db.commit()
+        db.refresh(reservation)
 
         return reservation
 
@@ -188,22 +81,44 @@ class ReservationService:
         reservation.status = ReservationStatus.EXPIRED
         reservation.expires_at = None
 
-        reservation = self.repo.save(db, reservation)
-
         # Emit event
-        event = reservation_expired_event(reservation.id)
-        await publish_event_async(event["type"], event["payload"])
+        event = reservation_expired_event(
+            reservation_id=reservation.id,
+            user_id=reservation.user_id,
+            showtime_id=reservation.showtime_id,
+            seat_code=reservation.seat_code,
+        )
+        stage_event(db, event["type"], event["payload"])
+
+        db.commit()
+        db.refresh(reservation)
 
         return reservation
 
-    async def sweep_expired_reservations(self, db: Session) -> int:
+    def sweep_expired_reservations(self, db: Session) -> int:
         """Background task: expire all reservations past their expiration time."""
-        now = datetime.now(timezone.utc)
-        expired = self.repo.get_expired(db, now)
-
-        for res in expired:
-            await self.expire_reservation(db, reservation=res)
-
+        total = 0
+        while True:
+            now = datetime.now(timezone.utc)
+            expired = self.expire_reservations_batch(db, now, EXPIRE_BATCH_SIZE)
+            total += expired
+            if expired < EXPIRE_BATCH_SIZE:
+                return total
+
+    def expire_reservations_batch(self, db: Session, now: datetime, limit: int) -> int:
+        """Expire up to `limit` due reservations with one UPDATE and one commit."""
+        expired = self.repo.expire_batch(db, now, limit)
+
+        for row in expired:
+            event = reservation_expired_event(
+                reservation_id=row.id,
+                user_id=row.user_id,
+                showtime_id=row.showtime_id,
+                seat_code=row.seat_code,
+            )
+            stage_event(db, event["type"], event["payload"])
+
+        db.commit()
         return len(expired)
     
     # ===== READ OPERATIONS (sync) =====
@@ -217,4 +132,67 @@ class ReservationService:
     
     def list_user_reservations(self, db: Session, user_id: int):
         """List all reservations for a user."""
-        return self.repo.list_for_user(db, user_id)
\ No newline at end of file
+        return self.repo.list_for_user(db, user_id)
+
+    async def get_reservation_async(self, db: AsyncSession, reservation_id: int) -> Reservation:
+        """Get reservation by ID without blocking the event loop."""
+        reservation = await self.async_repo.get_by_id(db, reservation_id)
+        if not reservation:
+            raise NotFoundError("Reservation not found")
+        return reservation
+
+    async def list_user_reservations_async(self, db: AsyncSession, user_id: int):
+        """List all reservations for a user without blocking the event loop."""
+        return await self.async_repo.list_for_user(db, user_id)
+
+    # =====================================================================
+    # SEAT VALIDATION HELPERS
+    # =====================================================================
+
+    def _get_layout_for_showtime(self, db: Session, showtime_id: int) -> SeatLayout:
+        """Resolve showtime → screen → seat layout."""
+        # Get showtime to find screen
+        showtime = db.get(Showtime, showtime_id)
+        if not showtime:
+            raise NotFoundError("Showtime not found")
+        
+        # Get screen and layout
+        screen = db.get(Screen, showtime.screen_id)
+        if not screen:
+            raise NotFoundError("Screen not found")
+        
+        layout = db.get(SeatLayout, screen.seat_layout_id)
+        if not layout:
+            raise NotFoundError("Seat layout not found")
+
+        return layout
+
+    @staticmethod
+    def _validate_seat_code(layout: SeatLayout, seat_code: str) -> None:
+        """Check that a seat code exists in the layout (O(1) on the compiled index)."""
+        compiled = layout_index_cache.get(layout)
+        if seat_code in compiled:
+            return
+
+        # Unknown seat: work out the most helpful error
+        try:
+            # Parse seat code (e.g., "A-5" -> row "A", seat "5")
+            row_part, seat_num = seat_code.split('-')
+            int(seat_num)
+        except (ValueError, AttributeError):
+            raise ValidationError(
+                f"Invalid seat code format: {seat_code}",
+                {"expected_format": "ROW-NUMBER (e.g., A-5)"}
+            )
+
+        # Check if row exists
+        if not compiled.has_row(row_part):
+            raise ValidationError(
+                f"Invalid row: {row_part}",
+                {"available_rows": list(compiled.rows)}
+            )
+
+        raise ValidationError(
+            f"Seat {seat_code} does not exist in row {row_part}",
+            {"available_seats": list(compiled.row_seats(row_part))}
+        )
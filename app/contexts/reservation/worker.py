@@ -0,0 +1,41 @@
+# app/contexts/reservation/worker.py
+
+"""
+Reservation Expiration Worker
+"""
+
+import asyncio
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.shared.services.expiration_scheduler import ExpirationScheduler
+
+from .repository import ReservationRepository
+from .service import ReservationService
+
+reservation_service = ReservationService()
+
+reservation_expiration_scheduler = ExpirationScheduler(
+    name="reservations",
+    load_upcoming=ReservationRepository().list_upcoming_expiries,
+    expire_batch=reservation_service.expire_reservations_batch,
+    batch_size=settings.EXPIRATION_BATCH_SIZE,
+    lookahead=settings.EXPIRATION_LOOKAHEAD,
+    reload_interval=settings.EXPIRATION_RELOAD_SECONDS,
+    retry_interval=settings.EXPIRATION_RETRY_SECONDS,
+)
+
+
+async def run_expiration_sweep() -> int:
+    """
+    Perform one sweep of the expiration process.
+    Returns the number of reservations that were expired.
+    """
+    def sweep() -> int:
+        db = SessionLocal()
+        try:
+            return reservation_service.sweep_expired_reservations(db)
+        finally:
+            db.close()
+
+    return await asyncio.to_thread(sweep)
@@ -1,9 +1,11 @@
 # app/contexts/screen/handlers.py
 
 """
-ScreenContext subscribes to no inbound domain events in the current DDD plan.
+ScreenContext only listens to its own layout events, to keep the
+compiled layout cache (and the seat grids built on it) in step with the
+database in every worker.
 
-It only emits:
+It emits:
 - screen.created
 - screen.updated
 - screen.deleted
@@ -12,10 +14,25 @@ It only emits:
 - screen.layout_deleted
 """
 
+import logging
 
-def register_handlers() -> None:
-    """
-    Kept for consistency with other contexts.
-    No subscriptions to register yet.
-    """
-    return None
+from app.core.broadcast import broadcast
+from app.core.event_bus import event_bus
+
+from .layout_index import LAYOUT_CHANGES_CHANNEL
+
+logger = logging.getLogger(__name__)
+
+
+async def on_layout_changed(payload: dict):
+    """Drop the compiled layout everywhere; it is rebuilt on next use."""
+    layout_id = payload.get("layout_id")
+    if not layout_id:
+        return
+
+    await broadcast.publish(LAYOUT_CHANGES_CHANNEL, {"layout_id": layout_id})
+    logger.info(f"🧹 Compiled layout {layout_id} invalidated")
+
+
+event_bus.subscribe("screen.layout_updated", on_layout_changed, group="screen")
+event_bus.subscribe("screen.layout_deleted", on_layout_changed, group="screen")
@@ -0,0 +1,178 @@
+# app/contexts/screen/layout_index.py
+
+"""
+Compiled seat layouts.
+
+SeatLayout.grid is free-form JSON ({"A": ["A-1", "A-2", "AISLE", ...], ...}).
+Walking it on every booking or grid read is wasteful, so each layout is
+compiled once into flat lookup structures and cached by layout id. The
+cache is invalidated in every worker by the screen.layout_updated /
+screen.layout_deleted handler (through app.core.broadcast), and entries
+expire after LAYOUT_INDEX_TTL_SECONDS as a safety net.
+"""
+
+import hashlib
+import itertools
+import json
+import logging
+import time
+from bisect import bisect_right
+from typing import Dict, List, Optional, Tuple
+
+from app.core.broadcast import broadcast
+from app.core.config import settings
+
+from .models import SeatLayout
+
+logger = logging.getLogger(__name__)
+
+AISLE = "AISLE"
+ROW_LETTERS = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+# {"layout_id": ...}: a layout was edited or deleted
+LAYOUT_CHANGES_CHANNEL = "seat_layout_changes"
+
+_versions = itertools.count(1)
+
+
+class CompiledSeatLayout:
+    """
+    Read-only view of one SeatLayout.
+
+    - seat_codes: every seat in display order (aisles removed)
+    - index: seat_code -> position in seat_codes
+    - rows / row_offsets: row names and the position of each row's first
+      seat; row_offsets has one extra entry (total_seats) as an end marker
+    - aisle_masks: row -> bitmask of the grid slots that are aisles
+    - seat_types: seat_code -> type, from the optional grid["seat_types"]
+    - fingerprint: hash of the rows and seat types, equal in every process
+      (used in ETags)
+    """
+
+    __slots__ = (
+        "layout_id",
+        "version",
+        "fingerprint",
+        "seat_codes",
+        "index",
+        "rows",
+        "row_offsets",
+        "aisle_masks",
+        "seat_types",
+        "total_seats",
+        "compiled_at",
+    )
+
+    def __init__(
+        self,
+        layout_id: int,
+        rows: List[Tuple[str, List[str]]],
+        seat_types: Optional[Dict[str, str]] = None,
+    ):
+        self.layout_id = layout_id
+        self.version = next(_versions)
+        encoded = json.dumps([rows, seat_types], sort_keys=True, separators=(",", ":"))
+        self.fingerprint = hashlib.blake2b(encoded.encode(), digest_size=8).hexdigest()
+
+        seat_codes: List[str] = []
+        row_names: List[str] = []
+        row_offsets: List[int] = []
+        aisle_masks: Dict[str, int] = {}
+
+        for row_name, slots in rows:
+            row_names.append(row_name)
+            row_offsets.append(len(seat_codes))
+            mask = 0
+            for slot, seat_code in enumerate(slots):
+                if seat_code == AISLE:
+                    mask |= 1 << slot
+                else:
+                    seat_codes.append(seat_code)
+            aisle_masks[row_name] = mask
+
+        self.seat_codes: Tuple[str, ...] = tuple(seat_codes)
+        self.index: Dict[str, int] = {code: i for i, code in enumerate(seat_codes)}
+        self.rows: Tuple[str, ...] = tuple(row_names)
+        self.row_offsets: Tuple[int, ...] = tuple(row_offsets) + (len(seat_codes),)
+        self.aisle_masks = aisle_masks
+        self.seat_types: Dict[str, str] = seat_types or {}
+        self.total_seats = len(seat_codes)
+        self.compiled_at = time.monotonic()
+
+    @classmethod
+    def from_layout(cls, layout: SeatLayout) -> "CompiledSeatLayout":
+        grid = layout.grid or {}
+        rows = [
+            (row_name, slots)
+            for row_name, slots in grid.items()
+            if isinstance(slots, list)
+        ]
+        seat_types = grid.get("seat_types") if isinstance(grid.get("seat_types"), dict) else None
+
+        if not rows:
+            # No grid: rows x seats_per_row, rows lettered A, B, C...
+            rows = [
+                (row, [f"{row}-{seat_num}" for seat_num in range(1, layout.seats_per_row + 1)])
+                for row in ROW_LETTERS[:layout.rows]
+            ]
+
+        return cls(layout.id, rows, seat_types)
+
+    def __contains__(self, seat_code: str) -> bool:
+        return seat_code in self.index
+
+    def has_row(self, row_name: str) -> bool:
+        return row_name in self.aisle_masks
+
+    def row_of(self, position: int) -> str:
+        """Row name of the seat at a position."""
+        return self.rows[bisect_right(self.row_offsets, position) - 1]
+
+    def row_seats(self, row_name: str) -> Tuple[str, ...]:
+        i = self.rows.index(row_name)
+        return self.seat_codes[self.row_offsets[i]:self.row_offsets[i + 1]]
+
+    def seat_type(self, seat_code: str, default: str = "standard") -> str:
+        return self.seat_types.get(seat_code, default)
+
+
+class LayoutIndexCache:
+    """Compiled layouts keyed by layout id."""
+
+    def __init__(self, ttl_seconds: float = 300.0):
+        self.ttl_seconds = ttl_seconds
+        self._layouts: Dict[int, CompiledSeatLayout] = {}
+
+    def get(self, layout: SeatLayout) -> CompiledSeatLayout:
+        """Return the compiled form of a layout, compiling it if needed."""
+        compiled = self._layouts.get(layout.id)
+        if compiled is not None and time.monotonic() - compiled.compiled_at <= self.ttl_seconds:
+            return compiled
+
+        compiled = CompiledSeatLayout.from_layout(layout)
+        self._layouts[layout.id] = compiled
+        logger.debug(f"Compiled seat layout {layout.id} ({compiled.total_seats} seats)")
+        return compiled
+
+    def peek(self, layout_id: int) -> Optional[CompiledSeatLayout]:
+        """Cached compiled layout, or None if missing or expired."""
+        compiled = self._layouts.get(layout_id)
+        if compiled is not None and time.monotonic() - compiled.compiled_at <= self.ttl_seconds:
+            return compiled
+        return None
+
+    def invalidate(self, layout_id: Optional[int] = None) -> None:
+        if layout_id is None:
+            self._layouts.clear()
+        else:
+            self._layouts.pop(layout_id, None)
+
+
+layout_index_cache = LayoutIndexCache(ttl_seconds=settings.LAYOUT_INDEX_TTL_SECONDS)
+
+
+def _on_layout_changed(message: dict) -> None:
+    layout_index_cache.invalidate(message["layout_id"])
+
+
+broadcast.subscribe(LAYOUT_CHANGES_CHANNEL, _on_layout_changed, on_resync=layout_index_cache.invalidate)
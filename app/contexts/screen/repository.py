@@ -1,4 +1,5 @@
 # app/contexts/screen/repository.py
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from sqlalchemy import select, func
 from .models import Screen, SeatLayout
@@ -81,4 +82,28 @@ class SeatLayoutRepository:
     def delete(self, db: Session, layout: SeatLayout):
         """Delete a layout."""
         db.delete(layout)
-        db.commit()
\ No newline at end of file
+        db.commit()
+
+
+class AsyncScreenRepository:
+    """Async repository for Screen aggregate."""
+
+    async def get_by_id(self, db: AsyncSession, screen_id: int):
+        """Get screen by ID."""
+        return await db.get(Screen, screen_id)
+
+    async def list_all(self, db: AsyncSession):
+        """List all screens."""
+        return (await db.scalars(select(Screen))).all()
+
+
+class AsyncSeatLayoutRepository:
+    """Async repository for SeatLayout aggregate."""
+
+    async def get_by_id(self, db: AsyncSession, layout_id: int):
+        """Get layout by ID."""
+        return await db.get(SeatLayout, layout_id)
+
+    async def list_all(self, db: AsyncSession):
+        """List all layouts."""
+        return (await db.scalars(select(SeatLayout))).all()
@@ -1,8 +1,9 @@
 # app/contexts/screen/router.py
 from fastapi import APIRouter, Depends, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.core.database import get_db
+from app.core.database import get_db, get_async_db
 from app.contexts.auth.dependencies import get_current_user
 from .schemas import (
     ScreenCreate,
@@ -43,16 +44,16 @@ async def screen_create(
     "/screens",
     response_model=list[ScreenRead],
 )
-def list_screens_route(db: Session = Depends(get_db)):
-    return screen_service.list_screens(db)
+async def list_screens_route(db: AsyncSession = Depends(get_async_db)):
+    return await screen_service.list_screens_async(db)
 
 
 @router.get(
     "/screens/{screen_id}",
     response_model=ScreenRead,
 )
-def get_screen_route(screen_id: int, db: Session = Depends(get_db)):
-    return screen_service.get_screen(db, screen_id)
+async def get_screen_route(screen_id: int, db: AsyncSession = Depends(get_async_db)):
+    return await screen_service.get_screen_async(db, screen_id)
 
 
 @router.put(
@@ -102,16 +103,16 @@ async def layout_create(
     "/layouts",
     response_model=list[SeatLayoutRead],
 )
-def list_layouts_route(db: Session = Depends(get_db)):
-    return screen_service.list_layouts(db)
+async def list_layouts_route(db: AsyncSession = Depends(get_async_db)):
+    return await screen_service.list_layouts_async(db)
 
 
 @router.get(
     "/layouts/{layout_id}",
     response_model=SeatLayoutRead,
 )
-def get_layout_route(layout_id: int, db: Session = Depends(get_db)):
-    return screen_service.get_layout(db, layout_id)
+async def get_layout_route(layout_id: int, db: AsyncSession = Depends(get_async_db)):
+    return await screen_service.get_layout_async(db, layout_id)
 
 
 @router.put(
@@ -1,4 +1,5 @@
 # app/contexts/screen/service.py
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from sqlalchemy import select
 
@@ -20,7 +21,12 @@ from .events import (
     layout_updated_event,
     layout_deleted_event,
 )
-from .repository import ScreenRepository, SeatLayoutRepository
+from .repository import (
+    ScreenRepository,
+    SeatLayoutRepository,
+    AsyncScreenRepository,
+    AsyncSeatLayoutRepository,
+)
 
 
 class ScreenService:
@@ -29,6 +35,8 @@ class ScreenService:
     def __init__(self):
         self.screen_repo = ScreenRepository()
         self.layout_repo = SeatLayoutRepository()
+        self.async_screen_repo = AsyncScreenRepository()
+        self.async_layout_repo = AsyncSeatLayoutRepository()
     
     # =====================================================================
     # SCREEN OPERATIONS
@@ -170,6 +178,17 @@ class ScreenService:
             raise NotFoundError("Screen not found", context={"screen_id": screen_id})
         return screen
 
+    async def list_screens_async(self, db: AsyncSession):
+        """List all screens without blocking the event loop."""
+        return await self.async_screen_repo.list_all(db)
+
+    async def get_screen_async(self, db: AsyncSession, screen_id: int):
+        """Get screen by ID without blocking the event loop."""
+        screen = await self.async_screen_repo.get_by_id(db, screen_id)
+        if not screen:
+            raise NotFoundError("Screen not found", context={"screen_id": screen_id})
+        return screen
+
     # =====================================================================
     # LAYOUT OPERATIONS
     # =====================================================================
@@ -292,4 +311,15 @@ class ScreenService:
         layout = self.layout_repo.get_by_id(db, layout_id)
         if not layout:
             raise NotFoundError("Layout not found", context={"layout_id": layout_id})
-        return layout
\ No newline at end of file
+        return layout
+
+    async def list_layouts_async(self, db: AsyncSession):
+        """List all layouts without blocking the event loop."""
+        return await self.async_layout_repo.list_all(db)
+
+    async def get_layout_async(self, db: AsyncSession, layout_id: int):
+        """Get layout by ID without blocking the event loop."""
+        layout = await self.async_layout_repo.get_by_id(db, layout_id)
+        if not layout:
+            raise NotFoundError("Layout not found", context={"layout_id": layout_id})
+        return layout
@@ -18,6 +18,23 @@ def seat_locked_event(showtime_id: int, seat_code: str, user_id: int, expires_at
     }
 
 
+def seat_batch_locked_event(
+    showtime_id: int,
+    seat_codes: list[str],
+    user_id: int,
+    expires_at: datetime,
+) -> dict:
+    return {
+        "type": "seat.batch_locked",
+        "payload": {
+            "showtime_id": showtime_id,
+            "seat_codes": seat_codes,
+            "user_id": user_id,
+            "expires_at": expires_at,
+        },
+    }
+
+
 def seat_unlocked_event(showtime_id: int, seat_code: str) -> dict:
     return {
         "type": "seat.unlocked",
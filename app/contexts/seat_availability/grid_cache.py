@@ -0,0 +1,169 @@
+# app/contexts/seat_availability/grid_cache.py
+
+"""
+In-memory seat availability grids.
+
+Each cached showtime points at its compiled seat layout and packs seat
+status into 2 bits per seat (4 seats per byte), in layout order, so the
+seat map can be served without touching the database.
+
+Events are handled by a single process, so changes reach the other
+workers through app.core.broadcast: seat status changes via the seat map
+fan-out (stream.SeatMapFanout), layout edits via the screen context's
+layout channel. When a worker may have missed messages (its listener
+reconnected) its grids are dropped. SEAT_GRID_CACHE_TTL_SECONDS remains
+as a safety net.
+"""
+
+import logging
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional
+
+from app.core.broadcast import broadcast
+from app.core.config import settings
+from app.contexts.screen.layout_index import LAYOUT_CHANGES_CHANNEL, CompiledSeatLayout
+
+from .models import StatusEnum
+
+logger = logging.getLogger(__name__)
+
+# 2-bit codes; AVAILABLE must be 0 so a fresh bytearray means "all free"
+STATUS_TO_CODE = {
+    StatusEnum.AVAILABLE: 0,
+    StatusEnum.LOCKED: 1,
+    StatusEnum.RESERVED: 2,
+}
+CODE_TO_STATUS = {code: status.value for status, code in STATUS_TO_CODE.items()}
+
+
+class SeatBitmap:
+    """Seat statuses of one showtime, 2 bits per seat."""
+
+    __slots__ = ("layout", "bits", "loaded_at", "_rendered")
+
+    def __init__(self, layout: CompiledSeatLayout):
+        self.layout = layout
+        self.bits = bytearray((layout.total_seats + 3) // 4)
+        self.loaded_at = time.monotonic()
+        self._rendered: Optional[List[dict]] = None
+
+    def get(self, position: int) -> int:
+        return (self.bits[position >> 2] >> ((position & 3) << 1)) & 0b11
+
+    def set(self, position: int, code: int) -> None:
+        shift = (position & 3) << 1
+        byte = position >> 2
+        self.bits[byte] = (self.bits[byte] & ~(0b11 << shift)) | (code << shift)
+        self._rendered = None
+
+    def set_status(self, seat_code: str, status: StatusEnum) -> bool:
+        """Update one seat. Returns False if the seat is not in the layout."""
+        position = self.layout.index.get(seat_code)
+        if position is None:
+            return False
+        self.set(position, STATUS_TO_CODE[status])
+        return True
+
+    def to_grid(self) -> List[dict]:
+        """Render the grid in the shape returned by the API (reused until a seat changes)."""
+        if self._rendered is None:
+            self._rendered = [
+                {"seat_code": code, "status": CODE_TO_STATUS[self.get(i)]}
+                for i, code in enumerate(self.layout.seat_codes)
+            ]
+        return self._rendered
+
+
+class SeatGridCache:
+    """LRU of SeatBitmaps keyed by showtime id."""
+
+    def __init__(self, ttl_seconds: float = 30.0, max_showtimes: int = 1000):
+        self.ttl_seconds = ttl_seconds
+        self.max_showtimes = max_showtimes
+        self._grids: "OrderedDict[int, SeatBitmap]" = OrderedDict()
+        # Bumped on every change, so a load that raced an event is discarded
+        self._generations: Dict[int, int] = {}
+
+    def get(self, showtime_id: int) -> Optional[SeatBitmap]:
+        grid = self._grids.get(showtime_id)
+        if grid is None:
+            return None
+        if time.monotonic() - grid.loaded_at > self.ttl_seconds:
+            del self._grids[showtime_id]
+            return None
+        self._grids.move_to_end(showtime_id)
+        return grid
+
+    def generation(self, showtime_id: int) -> int:
+        """Take before reading from the database; pass to put()."""
+        return self._generations.get(showtime_id, 0)
+
+    def put(
+        self,
+        showtime_id: int,
+        layout: CompiledSeatLayout,
+        seat_locks: Iterable,
+        generation: int,
+    ) -> SeatBitmap:
+        """Build a bitmap from a compiled layout and its SeatLock rows."""
+        grid = SeatBitmap(layout)
+        for lock in seat_locks:
+            grid.set_status(lock.seat_code, lock.status)
+
+        if self.generation(showtime_id) != generation:
+            # A seat changed while we were reading; the snapshot may be stale
+            return grid
+
+        self._grids[showtime_id] = grid
+        self._grids.move_to_end(showtime_id)
+        while len(self._grids) > self.max_showtimes:
+            self._grids.popitem(last=False)
+        return grid
+
+    def apply(self, showtime_id: int, seat_codes: Iterable[str], status: StatusEnum) -> None:
+        """Apply a seat status change to a cached grid (no-op if not cached)."""
+        self._generations[showtime_id] = self.generation(showtime_id) + 1
+
+        grid = self._grids.get(showtime_id)
+        if grid is None:
+            return
+        for seat_code in seat_codes:
+            # Seats outside the layout are ignored, as in the database read
+            grid.set_status(seat_code, status)
+
+    def invalidate_layout(self, layout_id: int) -> None:
+        """Drop every grid built on a layout that changed."""
+        stale = [
+            showtime_id
+            for showtime_id, grid in self._grids.items()
+            if grid.layout.layout_id == layout_id
+        ]
+        for showtime_id in stale:
+            del self._grids[showtime_id]
+
+    def invalidate(self, showtime_id: Optional[int] = None) -> None:
+        if showtime_id is None:
+            self._grids.clear()
+            logger.info("🧹 Seat grid cache cleared")
+        else:
+            self._grids.pop(showtime_id, None)
+
+    def stats(self) -> dict:
+        return {
+            "showtimes": len(self._grids),
+            "bytes": sum(len(grid.bits) for grid in self._grids.values()),
+        }
+
+
+seat_grid_cache = SeatGridCache(
+    ttl_seconds=settings.SEAT_GRID_CACHE_TTL_SECONDS,
+    max_showtimes=settings.SEAT_GRID_CACHE_MAX_SHOWTIMES,
+)
+
+
+def _on_layout_changed(message: dict) -> None:
+    seat_grid_cache.invalidate_layout(message["layout_id"])
+
+
+broadcast.subscribe(LAYOUT_CHANGES_CHANNEL, _on_layout_changed, on_resync=seat_grid_cache.invalidate)
@@ -1,115 +1,78 @@
 # app/contexts/seat_availability/handlers.py
 
-from app.core.database import SessionLocal
+from datetime import datetime
+
+from app.core.unit_of_work import event_session
 from app.core.event_bus import event_bus
 
+from .models import StatusEnum
 from .service import SeatAvailabilityService
+from .stream import seat_map_fanout
+from .worker import seat_expiration_scheduler
 
 seat_service = SeatAvailabilityService()
 
 
-async def on_reservation_created(payload: dict):
-    """Lock seat when reservation is created"""
+async def on_order_completed(payload: dict):
+    """Mark seat as RESERVED when order is completed (payment succeeded)"""
     showtime_id = payload.get("showtime_id")
     seat_code = payload.get("seat_code")
-    user_id = payload.get("user_id")
-    
-    if not all([showtime_id, seat_code, user_id]):
+    if not showtime_id or not seat_code:
         return
-    
-    db = SessionLocal()
-    try:
-        await seat_service.lock_seat(db, showtime_id, seat_code, user_id)
-    finally:
-        db.close()
 
+    with event_session() as db:
+        await seat_service.mark_reserved(db, showtime_id=showtime_id, seat_code=seat_code)
 
-async def on_order_completed(payload: dict):
-    """Mark seat as RESERVED when order is completed (payment succeeded)"""
-    # Need to get seat info from order
-    from app.contexts.order.repository import OrderRepository
-    from app.contexts.reservation.repository import ReservationRepository
-    
-    order_id = payload.get("order_id")
-    if not order_id:
-        return
-    
-    db = SessionLocal()
-    try:
-        # Get order
-        order_repo = OrderRepository()
-        order = order_repo.get_by_id(db, order_id)
-        if not order:
-            return
-        
-        # Get reservation to find seat info
-        reservation_repo = ReservationRepository()
-        reservation = reservation_repo.get_by_id(db, order.reservation_id)
-        if not reservation:
-            return
-        
-        # Mark seat as reserved
-        await seat_service.mark_reserved(
-            db,
-            showtime_id=reservation.showtime_id,
-            seat_code=reservation.seat_code
-        )
-    finally:
-        db.close()
-
-
-async def on_reservation_cancelled(payload: dict):
-    """Unlock seat when reservation is cancelled"""
-    # This should get showtime/seat from the event payload
-    # For now, we'll need to look up the reservation
-    reservation_id = payload.get("reservation_id")
-    if not reservation_id:
-        return
-    
-    from app.contexts.reservation.repository import ReservationRepository
-    
-    db = SessionLocal()
-    try:
-        reservation_repo = ReservationRepository()
-        reservation = reservation_repo.get_by_id(db, reservation_id)
-        if not reservation:
-            return
-        
-        await seat_service.unlock_seat(
-            db,
-            showtime_id=reservation.showtime_id,
-            seat_code=reservation.seat_code
-        )
-    finally:
-        db.close()
-
-
-async def on_reservation_expired(payload: dict):
-    """Unlock seat when reservation expires"""
-    reservation_id = payload.get("reservation_id")
-    if not reservation_id:
+
+async def on_reservation_ended(payload: dict):
+    """Unlock seat when a reservation is cancelled or expires"""
+    showtime_id = payload.get("showtime_id")
+    seat_code = payload.get("seat_code")
+    if not showtime_id or not seat_code:
         return
-    
-    from app.contexts.reservation.repository import ReservationRepository
-    
-    db = SessionLocal()
-    try:
-        reservation_repo = ReservationRepository()
-        reservation = reservation_repo.get_by_id(db, reservation_id)
-        if not reservation:
-            return
-        
-        await seat_service.unlock_seat(
-            db,
-            showtime_id=reservation.showtime_id,
-            seat_code=reservation.seat_code
-        )
-    finally:
-        db.close()
+
+    with event_session() as db:
+        await seat_service.unlock_seat(db, showtime_id=showtime_id, seat_code=seat_code)
+
+
+# ===== Seat grid cache and live seat map =====
+
+async def _seat_status_changed(showtime_id: int, seat_codes: list, status: StatusEnum) -> None:
+    await seat_map_fanout.publish(showtime_id, seat_codes, status)
+
+
+def _schedule_expiry(payload: dict) -> None:
+    if payload.get("expires_at"):
+        seat_expiration_scheduler.schedule(datetime.fromisoformat(payload["expires_at"]))
+
+
+async def on_seat_locked(payload: dict):
+    await _seat_status_changed(payload["showtime_id"], [payload["seat_code"]], StatusEnum.LOCKED)
+    _schedule_expiry(payload)
+
+
+async def on_seat_batch_locked(payload: dict):
+    await _seat_status_changed(payload["showtime_id"], payload["seat_codes"], StatusEnum.LOCKED)
+    _schedule_expiry(payload)
+
+
+async def on_seat_released(payload: dict):
+    """seat.unlocked / seat.expired"""
+    await _seat_status_changed(payload["showtime_id"], [payload["seat_code"]], StatusEnum.AVAILABLE)
+
+
+async def on_seat_reserved(payload: dict):
+    await _seat_status_changed(payload["showtime_id"], [payload["seat_code"]], StatusEnum.RESERVED)
 
 
 # Subscribe to events
-event_bus.subscribe("reservation.created", on_reservation_created)
-event_bus.subscribe("order.completed", on_order_completed)
-event_bus.subscribe("reservation.cancelled", on_reservation_cancelled)
-event_bus.subscribe("reservation.expired", on_reservation_expired)
\ No newline at end of file
+event_bus.subscribe("order.completed", on_order_completed, group="seat_availability", blocking=True)
+event_bus.subscribe("reservation.cancelled", on_reservation_ended, group="seat_availability", after=["order"], blocking=True)
+event_bus.subscribe("reservation.expired", on_reservation_ended, group="seat_availability", after=["order"], blocking=True)
+
+# Cache / live stream updates stay on the event loop (they touch loop-bound state)
+event_bus.subscribe("seat.locked", on_seat_locked, group="seat_availability")
+event_bus.subscribe("seat.batch_locked", on_seat_batch_locked, group="seat_availability")
+event_bus.subscribe("seat.unlocked", on_seat_released, group="seat_availability")
+event_bus.subscribe("seat.expired", on_seat_released, group="seat_availability")
+event_bus.subscribe("seat.reserved", on_seat_reserved, group="seat_availability")
@@ -1,7 +1,11 @@
 # app/contexts/seat_availability/repository.py
 from datetime import datetime
+from typing import Optional
+
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from sqlalchemy import select, and_
+from sqlalchemy import select, update, and_, or_
 
 from .models import SeatLock, StatusEnum
 
@@ -39,6 +43,129 @@ class SeatLockRepository:
             .all()
         )
 
+    def list_upcoming_expiries(self, db: Session, limit: int) -> list[datetime]:
+        """Next lock deadlines in ascending order (served by idx_seatlock_lock_expires)."""
+        stmt = (
+            select(SeatLock.lock_expires_at)
+            .where(
+                SeatLock.status == StatusEnum.LOCKED,
+                SeatLock.lock_expires_at.is_not(None),
+            )
+            .order_by(SeatLock.lock_expires_at)
+            .limit(limit)
+        )
+        return db.scalars(stmt).all()
+
+    def expire_batch(self, db: Session, now: datetime, limit: int):
+        """
+        Release up to `limit` expired locks in one statement (no commit).
+
+        Rows are claimed with SKIP LOCKED so concurrent sweepers never
+        expire the same lock twice. Returns (showtime_id, seat_code) rows.
+        """
+        is_due = and_(
+            SeatLock.status == StatusEnum.LOCKED,
+            SeatLock.lock_expires_at <= now,
+        )
+        due_ids = (
+            select(SeatLock.id)
+            .where(is_due)
+            .order_by(SeatLock.lock_expires_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        stmt = (
+            update(SeatLock)
+            .where(SeatLock.id.in_(due_ids.scalar_subquery()), is_due)
+            .values(
+                status=StatusEnum.AVAILABLE,
+                locked_by_user_id=None,
+                lock_expires_at=None,
+            )
+            .returning(SeatLock.showtime_id, SeatLock.seat_code)
+            .execution_options(synchronize_session=False)
+        )
+        return db.execute(stmt).all()
+
+    def try_acquire_lock(
+        self,
+        db: Session,
+        showtime_id: int,
+        seat_code: str,
+        user_id: int,
+        expires_at: datetime,
+        now: datetime,
+    ) -> Optional[SeatLock]:
+        """
+        Lock a seat in a single statement (no commit).
+
+        Inserts the row if the seat was never touched, otherwise takes it
+        over only if it is AVAILABLE, already locked by the same user, or
+        its lock has expired. Returns the locked row, or None if another
+        user holds the seat or it is reserved.
+        """
+        locks = self.try_acquire_locks(
+            db, showtime_id, [seat_code], user_id, expires_at, now
+        )
+        return locks[0] if locks else None
+
+    def try_acquire_locks(
+        self,
+        db: Session,
+        showtime_id: int,
+        seat_codes: list[str],
+        user_id: int,
+        expires_at: datetime,
+        now: datetime,
+    ) -> list[SeatLock]:
+        """
+        Multi-row variant of try_acquire_lock (no commit).
+
+        Returns only the seats that were acquired; the caller decides what
+        to do when that is fewer than requested. seat_codes must be unique.
+        """
+        stmt = insert(SeatLock).values([
+            {
+                "showtime_id": showtime_id,
+                "seat_code": seat_code,
+                "status": StatusEnum.LOCKED,
+                "locked_by_user_id": user_id,
+                "lock_expires_at": expires_at,
+            }
+            for seat_code in seat_codes
+        ])
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_showtime_seat",
+            set_={
+                "status": stmt.excluded.status,
+                "locked_by_user_id": stmt.excluded.locked_by_user_id,
+                "lock_expires_at": stmt.excluded.lock_expires_at,
+            },
+            where=or_(
+                SeatLock.status == StatusEnum.AVAILABLE,
+                and_(
+                    SeatLock.status == StatusEnum.LOCKED,
+                    or_(
+                        SeatLock.locked_by_user_id == user_id,
+                        SeatLock.lock_expires_at < now,
+                    ),
+                ),
+            ),
+        ).returning(SeatLock)
+
+        return db.scalars(
+            stmt,
+            execution_options={"populate_existing": True},
+        ).all()
+
+    def list_by_codes(self, db: Session, showtime_id: int, seat_codes: list[str]):
+        """Get the seat locks for several seats at a showtime."""
+        stmt = select(SeatLock).where(
+            SeatLock.showtime_id == showtime_id,
+            SeatLock.seat_code.in_(seat_codes),
+        )
+        return db.scalars(stmt).all()
+
     def create(self, db: Session, seat_lock: SeatLock):
         """Create a new seat lock."""
         db.add(seat_lock)
@@ -56,4 +183,32 @@ class SeatLockRepository:
     def delete(self, db: Session, seat_lock: SeatLock):
         """Delete a seat lock."""
         db.delete(seat_lock)
-        db.commit()
\ No newline at end of file
+        db.commit()
+
+
+class AsyncSeatLockRepository:
+    """Async repository for SeatLock aggregate."""
+
+    async def get_by_id(self, db: AsyncSession, seat_lock_id: int):
+        """Get seat lock by ID."""
+        return await db.get(SeatLock, seat_lock_id)
+
+    async def get_by_showtime_and_code(self, db: AsyncSession, showtime_id: int, seat_code: str):
+        """Get seat lock for a specific seat at a showtime."""
+        stmt = select(SeatLock).where(
+            SeatLock.showtime_id == showtime_id,
+            SeatLock.seat_code == seat_code,
+        )
+        return (await db.scalars(stmt)).first()
+
+    async def list_for_showtime(self, db: AsyncSession, showtime_id: int):
+        """List all seat locks for a showtime."""
+        stmt = select(SeatLock).where(SeatLock.showtime_id == showtime_id)
+        return (await db.scalars(stmt)).all()
+
+    async def save(self, db: AsyncSession, seat_lock: SeatLock):
+        """Create or update a seat lock."""
+        db.add(seat_lock)
+        await db.commit()
+        await db.refresh(seat_lock)
+        return seat_lock
@@ -1,14 +1,23 @@
 # app/contexts/seat_availability/router.py
-from fastapi import APIRouter, Depends
+import asyncio
+import time
+
+from fastapi import APIRouter, Depends, Request
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.core.database import get_db
+from app.core.config import settings
+from app.core.database import get_db, get_async_db, AsyncSessionLocal
 from app.contexts.auth.dependencies import get_current_user
 
 from .service import SeatAvailabilityService
+from .stream import RESYNC, format_sse, seat_map_broadcaster
 from .schemas import (
     SeatLockCreate,
     SeatLockResponse,
+    SeatBatchLockCreate,
+    SeatBatchLockResponse,
     SeatAvailabilityGridResponse,
 )
 
@@ -36,6 +45,22 @@ async def lock_seat_route(
     )
 
 
+@router.post("/lock/batch", response_model=SeatBatchLockResponse)
+async def lock_seats_route(
+    payload: SeatBatchLockCreate,
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_user),
+):
+    """Lock a group of seats for the authenticated user (all or nothing)."""
+    seats = await seat_service.lock_seats(
+        db=db,
+        showtime_id=payload.showtime_id,
+        seat_codes=payload.seat_codes,
+        user_id=current_user.id,
+    )
+    return {"showtime_id": payload.showtime_id, "seats": seats}
+
+
 @router.post("/unlock", response_model=SeatLockResponse)
 async def unlock_seat_route(
     payload: SeatLockCreate,
@@ -50,10 +75,76 @@ async def unlock_seat_route(
 
 
 @router.get("/grid/{showtime_id}", response_model=SeatAvailabilityGridResponse)
-def grid_route(
+async def grid_route(
     showtime_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Return seat availability grid for a showtime."""
-    seats = seat_service.get_availability_grid(db, showtime_id=showtime_id)
-    return {"showtime_id": showtime_id, "seats": seats}
\ No newline at end of file
+    seats = await seat_service.get_availability_grid_async(db, showtime_id=showtime_id)
+    return {"showtime_id": showtime_id, "seats": seats}
+
+
+@router.get("/stream/{showtime_id}")
+async def stream_route(
+    showtime_id: int,
+    request: Request,
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Live seat map (Server-Sent Events).
+
+    Sends a "snapshot" event with the full grid, then "delta" events
+    listing only the seats that changed, grouped by their new status.
+    Both carry a "seq": deltas with a seq at or below the last snapshot's
+    are already included in it.
+    """
+    # Subscribe before reading, so no change falls between snapshot and deltas
+    subscriber = seat_map_broadcaster.subscribe(showtime_id)
+    try:
+        # Fail fast (404) before the stream starts
+        seq = seat_map_broadcaster.seq(showtime_id)
+        seats = await seat_service.get_availability_grid_async(db, showtime_id=showtime_id)
+    except BaseException:
+        seat_map_broadcaster.unsubscribe(subscriber)
+        raise
+    await db.close()
+
+    async def snapshot() -> str:
+        seq = seat_map_broadcaster.seq(showtime_id)
+        async with AsyncSessionLocal() as snapshot_db:
+            grid = await seat_service.get_availability_grid_async(snapshot_db, showtime_id)
+        return format_sse("snapshot", {"showtime_id": showtime_id, "seq": seq, "seats": grid})
+
+    async def events():
+        try:
+            yield format_sse("snapshot", {"showtime_id": showtime_id, "seq": seq, "seats": seats})
+            last_snapshot = time.monotonic()
+
+            while not await request.is_disconnected():
+                # Safety net for changes lost in transit (e.g. listener reconnects)
+                if time.monotonic() - last_snapshot > settings.SEAT_STREAM_RESYNC_SECONDS:
+                    yield await snapshot()
+                    last_snapshot = time.monotonic()
+
+                try:
+                    message = await asyncio.wait_for(
+                        subscriber.queue.get(),
+                        timeout=settings.SEAT_STREAM_HEARTBEAT_SECONDS,
+                    )
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+
+                if message is RESYNC:
+                    yield await snapshot()
+                    last_snapshot = time.monotonic()
+                else:
+                    yield message
+        finally:
+            seat_map_broadcaster.unsubscribe(subscriber)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -2,7 +2,9 @@
 
 from typing import List
 from datetime import datetime
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+
+from app.core.config import settings
 
 from enum import Enum as PyEnum
 
@@ -29,6 +31,16 @@ class SeatLockResponse(SeatLockBase):
     lock_expires_at: datetime | None = None
 
 
+class SeatBatchLockCreate(BaseModel):
+    showtime_id: int
+    seat_codes: List[str] = Field(min_length=1, max_length=settings.SEAT_BATCH_MAX_SEATS)
+
+
+class SeatBatchLockResponse(BaseModel):
+    showtime_id: int
+    seats: List[SeatLockResponse]
+
+
 class SeatAvailabilityGridItem(BaseModel):
     seat_code: str
     status: SeatStatus
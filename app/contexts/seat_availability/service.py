@@ -1,16 +1,22 @@
 # app/contexts/seat_availability/service.py
 from datetime import timedelta
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from app.core.config import settings
 from app.core.utils import utcnow
-from app.core.errors import NotFoundError, ValidationError
-from app.shared.services.event_publisher import publish_event_async
+from app.core.errors import NotFoundError, ValidationError, ConflictError
+from app.shared.services.event_publisher import stage_event
+from app.contexts.screen.layout_index import layout_index_cache
 
+from .events import seat_batch_locked_event
+from .grid_cache import seat_grid_cache
 from .models import SeatLock, StatusEnum
-from .repository import SeatLockRepository
+from .repository import SeatLockRepository, AsyncSeatLockRepository
 
 
 LOCK_DURATION = timedelta(minutes=10)
+EXPIRE_BATCH_SIZE = settings.EXPIRATION_BATCH_SIZE
 
 
 class SeatAvailabilityService:
@@ -18,6 +24,7 @@ class SeatAvailabilityService:
     
     def __init__(self):
         self.repo = SeatLockRepository()
+        self.async_repo = AsyncSeatLockRepository()
 
     async def lock_seat(
         self, 
@@ -26,44 +33,44 @@ class SeatAvailabilityService:
         seat_code: str, 
         user_id: int
     ):
-        """Lock a seat for a user."""
-        seat = self.repo.get_by_showtime_and_code(db, showtime_id, seat_code)
-        
-        # CREATE SEAT ON-DEMAND IF IT DOESN'T EXIST
-        if not seat:
-            seat = SeatLock(
-                showtime_id=showtime_id,
-                seat_code=seat_code,
-                status=StatusEnum.AVAILABLE,
-                locked_by_user_id=None,
-                lock_expires_at=None,
-            )
-            db.add(seat)
-            db.flush()  # Get the ID without committing
+        """
+        Lock a seat for a user.
 
-        # Cannot lock reserved seats
-        if seat.status == StatusEnum.RESERVED:
-            raise ValidationError(
-                "Seat is already reserved", 
-                {"seat_code": seat_code}
-            )
+        Acquisition is one conditional upsert, so concurrent attempts on the
+        same seat either win or fail deterministically.
+        """
+        now = utcnow()
+        seat = self.repo.try_acquire_lock(
+            db,
+            showtime_id=showtime_id,
+            seat_code=seat_code,
+            user_id=user_id,
+            expires_at=now + LOCK_DURATION,
+            now=now,
+        )
 
-        # If locked by someone else → cannot re-lock
-        if seat.status == StatusEnum.LOCKED and seat.locked_by_user_id != user_id:
+        if seat is None:
+            # Lost the race: read the winner only to explain the failure
+            current = self.repo.get_by_showtime_and_code(db, showtime_id, seat_code)
+
+            # Cannot lock reserved seats
+            if current is not None and current.status == StatusEnum.RESERVED:
+                raise ValidationError(
+                    "Seat is already reserved", 
+                    {"seat_code": seat_code}
+                )
+
+            # Locked by someone else → cannot re-lock
             raise ValidationError(
                 "Seat locked by another user",
-                {"locked_by": seat.locked_by_user_id, "attempt_user": user_id},
+                {
+                    "locked_by": current.locked_by_user_id if current else None,
+                    "attempt_user": user_id,
+                },
             )
 
-        # Transition to LOCKED
-        seat.status = StatusEnum.LOCKED
-        seat.locked_by_user_id = user_id
-        seat.lock_expires_at = utcnow() + LOCK_DURATION
-
-        db.commit()
-        db.refresh(seat)
-
-        await publish_event_async(
+        stage_event(
+            db,
             "seat.locked",
             {
                 "showtime_id": showtime_id,
@@ -73,8 +80,75 @@ class SeatAvailabilityService:
             },
         )
 
+        db.commit()
+
         return seat
 
+    def acquire_locks(
+        self,
+        db: Session,
+        showtime_id: int,
+        seat_codes: list[str],
+        user_id: int,
+    ) -> list[SeatLock]:
+        """
+        Lock several seats in the caller's transaction (no commit).
+
+        All-or-nothing: if any seat cannot be taken the transaction is
+        rolled back and a ConflictError lists the unavailable seats.
+        """
+        if len(set(seat_codes)) != len(seat_codes):
+            raise ValidationError(
+                "Duplicate seat codes in request",
+                {"seat_codes": seat_codes},
+            )
+
+        # Lock rows in a stable order so overlapping batches cannot deadlock
+        seat_codes = sorted(seat_codes)
+
+        now = utcnow()
+        seats = self.repo.try_acquire_locks(
+            db,
+            showtime_id=showtime_id,
+            seat_codes=seat_codes,
+            user_id=user_id,
+            expires_at=now + LOCK_DURATION,
+            now=now,
+        )
+
+        if len(seats) < len(seat_codes):
+            db.rollback()
+            acquired = {seat.seat_code for seat in seats}
+            unavailable = [code for code in seat_codes if code not in acquired]
+            raise ConflictError(
+                "Some seats are not available",
+                {"showtime_id": showtime_id, "unavailable": unavailable},
+            )
+
+        return seats
+
+    async def lock_seats(
+        self,
+        db: Session,
+        showtime_id: int,
+        seat_codes: list[str],
+        user_id: int,
+    ) -> list[SeatLock]:
+        """Lock a group of seats atomically and emit one aggregated event."""
+        seats = self.acquire_locks(db, showtime_id, seat_codes, user_id)
+
+        event = seat_batch_locked_event(
+            showtime_id=showtime_id,
+            seat_codes=[seat.seat_code for seat in seats],
+            user_id=user_id,
+            expires_at=seats[0].lock_expires_at.isoformat(),
+        )
+        stage_event(db, event["type"], event["payload"])
+
+        db.commit()
+
+        return seats
+
     async def unlock_seat(
         self, 
         db: Session, 
@@ -91,10 +165,8 @@ class SeatAvailabilityService:
         seat.locked_by_user_id = None
         seat.lock_expires_at = None
 
-        db.commit()
-        db.refresh(seat)
-
-        await publish_event_async(
+        stage_event(
+            db,
             "seat.unlocked",
             {
                 "showtime_id": showtime_id,
@@ -102,6 +174,9 @@ class SeatAvailabilityService:
             },
         )
 
+        db.commit()
+        db.refresh(seat)
+
         return seat
 
     async def mark_reserved(
@@ -115,6 +190,10 @@ class SeatAvailabilityService:
         if not seat:
             raise NotFoundError("Seat not found", {"seat_code": seat_code})
 
+        if seat.status == StatusEnum.RESERVED:
+            # Idempotent: a redelivered event is a no-op
+            return seat
+
         # Must be LOCKED before becoming RESERVED
         if seat.status != StatusEnum.LOCKED:
             raise ValidationError(
@@ -126,10 +205,8 @@ class SeatAvailabilityService:
         seat.locked_by_user_id = None
         seat.lock_expires_at = None
 
-        db.commit()
-        db.refresh(seat)
-
-        await publish_event_async(
+        stage_event(
+            db,
             "seat.reserved",
             {
                 "showtime_id": showtime_id,
@@ -137,24 +214,31 @@ class SeatAvailabilityService:
             },
         )
 
+        db.commit()
+        db.refresh(seat)
+
         return seat
 
-    async def expire_seats(self, db: Session) -> int:
+    def expire_seats(self, db: Session) -> int:
         """Background task: expire all locked seats past their expiration time."""
-        now = utcnow()
-
-        expired_seats = self.repo.get_expired(db, now)
+        total = 0
+        while True:
+            expired = self.expire_seats_batch(db, utcnow(), EXPIRE_BATCH_SIZE)
+            total += expired
+            if expired < EXPIRE_BATCH_SIZE:
+                return total
 
-        for seat in expired_seats:
-            seat.status = StatusEnum.AVAILABLE
-            seat.locked_by_user_id = None
-            seat.lock_expires_at = None
+    def expire_seats_batch(self, db: Session, now, limit: int) -> int:
+        """Release up to `limit` expired locks with one UPDATE and one commit."""
+        expired_seats = self.repo.expire_batch(db, now, limit)
 
-            await publish_event_async(
+        for showtime_id, seat_code in expired_seats:
+            stage_event(
+                db,
                 "seat.expired",
                 {
-                    "showtime_id": seat.showtime_id,
-                    "seat_code": seat.seat_code,
+                    "showtime_id": showtime_id,
+                    "seat_code": seat_code,
                 },
             )
 
@@ -165,6 +249,11 @@ class SeatAvailabilityService:
         """Get seat availability grid for a showtime - returns ALL seats from layout"""
         from app.contexts.showtime.models import Showtime
         from app.contexts.screen.models import Screen, SeatLayout
+
+        cached = seat_grid_cache.get(showtime_id)
+        if cached is not None:
+            return cached.to_grid()
+        generation = seat_grid_cache.generation(showtime_id)
         
         # Get showtime to find screen
         showtime = db.get(Showtime, showtime_id)
@@ -182,50 +271,35 @@ class SeatAvailabilityService:
         
         # Get all existing seat locks for this showtime
         seat_locks = self.repo.list_for_showtime(db, showtime_id)
-        seat_lock_map = {lock.seat_code: lock for lock in seat_locks}
-        
-        # Generate full grid from layout
-        all_seats = []
-        
-        if layout.grid:
-            # Use the grid to get all seats
-            for row_name, row_seats in layout.grid.items():
-                for seat_code in row_seats:
-                    # Skip aisles
-                    if seat_code == "AISLE":
-                        continue
-                    
-                    # Check if this seat has a lock
-                    if seat_code in seat_lock_map:
-                        lock = seat_lock_map[seat_code]
-                        all_seats.append({
-                            "seat_code": seat_code,
-                            "status": lock.status.value,
-                        })
-                    else:
-                        # Seat exists in layout but not locked/reserved
-                        all_seats.append({
-                            "seat_code": seat_code,
-                            "status": "available",
-                        })
-        else:
-            # Fallback: generate from rows x seats_per_row
-            row_letters = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
-            for row_idx in range(layout.rows):
-                row = row_letters[row_idx]
-                for seat_num in range(1, layout.seats_per_row + 1):
-                    seat_code = f"{row}-{seat_num}"
-                    
-                    if seat_code in seat_lock_map:
-                        lock = seat_lock_map[seat_code]
-                        all_seats.append({
-                            "seat_code": seat_code,
-                            "status": lock.status.value,
-                        })
-                    else:
-                        all_seats.append({
-                            "seat_code": seat_code,
-                            "status": "available",
-                        })
-        
-        return all_seats
\ No newline at end of file
+        grid = seat_grid_cache.put(
+            showtime_id, layout_index_cache.get(layout), seat_locks, generation
+        )
+        return grid.to_grid()
+
+    async def get_availability_grid_async(self, db: AsyncSession, showtime_id: int):
+        """Same as get_availability_grid, without blocking the event loop."""
+        from app.contexts.showtime.models import Showtime
+        from app.contexts.screen.models import Screen, SeatLayout
+
+        cached = seat_grid_cache.get(showtime_id)
+        if cached is not None:
+            return cached.to_grid()
+        generation = seat_grid_cache.generation(showtime_id)
+
+        showtime = await db.get(Showtime, showtime_id)
+        if not showtime:
+            raise NotFoundError("Showtime not found")
+
+        screen = await db.get(Screen, showtime.screen_id)
+        if not screen:
+            raise NotFoundError("Screen not found")
+
+        layout = await db.get(SeatLayout, screen.seat_layout_id)
+        if not layout:
+            raise NotFoundError("Layout not found")
+
+        seat_locks = await self.async_repo.list_for_showtime(db, showtime_id)
+        grid = seat_grid_cache.put(
+            showtime_id, layout_index_cache.get(layout), seat_locks, generation
+        )
+        return grid.to_grid()
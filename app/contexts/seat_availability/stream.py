@@ -0,0 +1,202 @@
+# app/contexts/seat_availability/stream.py
+
+"""
+Live seat map fan-out for the SSE endpoint.
+
+Each showtime with at least one listener has a channel. Seat events are
+merged into the channel's pending changes and flushed once per coalescing
+window: a burst of N changes becomes one delta, encoded once and shared
+by every subscriber. A subscriber that falls behind (queue full) is told
+to resync and gets a fresh snapshot instead of the backlog.
+
+Deltas are numbered per showtime ("seq"), and snapshots carry the seq
+they are current as of, so clients drop deltas already in the snapshot.
+
+A seat event is handled in one process only (whichever relayed it), but
+SSE clients are spread over every worker. The handler sends the change
+through app.core.broadcast, and every process applies it to its own grid
+cache and broadcaster (SeatMapFanout).
+"""
+
+import asyncio
+import json
+import logging
+from typing import Dict, Iterable, Optional, Set
+
+from app.core.broadcast import Broadcast, broadcast
+from app.core.config import settings
+
+from .grid_cache import SeatGridCache, seat_grid_cache
+from .models import StatusEnum
+
+logger = logging.getLogger(__name__)
+
+RESYNC = object()  # Queue marker: send a full snapshot
+
+SEAT_CHANGES_CHANNEL = "seat_map_changes"
+
+
+def format_sse(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, separators=(',', ':'))}\n\n"
+
+
+class SeatMapSubscriber:
+    """One connected client."""
+
+    def __init__(self, showtime_id: int, queue_size: int):
+        self.showtime_id = showtime_id
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+
+    def offer(self, message) -> None:
+        try:
+            self.queue.put_nowait(message)
+        except asyncio.QueueFull:
+            # Too slow: drop the backlog and resync from a snapshot
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(RESYNC)
+
+
+class _ShowtimeChannel:
+    __slots__ = ("subscribers", "pending", "flush_handle", "seq")
+
+    def __init__(self):
+        self.subscribers: Set[SeatMapSubscriber] = set()
+        self.pending: Dict[str, str] = {}
+        self.flush_handle: Optional[asyncio.TimerHandle] = None
+        self.seq = 0
+
+
+class SeatMapBroadcaster:
+    """Per-showtime subscriber fan-out with burst coalescing."""
+
+    def __init__(self, coalesce_seconds: float = 0.1, queue_size: int = 100):
+        self.coalesce_seconds = coalesce_seconds
+        self.queue_size = queue_size
+        self._channels: Dict[int, _ShowtimeChannel] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def bind(self, loop: asyncio.AbstractEventLoop) -> None:
+        """The application loop: subscriber queues and flush timers live on it."""
+        self._loop = loop
+
+    def subscribe(self, showtime_id: int) -> SeatMapSubscriber:
+        if self._loop is None:
+            self._loop = asyncio.get_running_loop()
+        subscriber = SeatMapSubscriber(showtime_id, self.queue_size)
+        self._channels.setdefault(showtime_id, _ShowtimeChannel()).subscribers.add(subscriber)
+        return subscriber
+
+    def seq(self, showtime_id: int) -> int:
+        """Number of the last delta sent for a showtime (take it before reading a snapshot)."""
+        channel = self._channels.get(showtime_id)
+        return channel.seq if channel is not None else 0
+
+    def unsubscribe(self, subscriber: SeatMapSubscriber) -> None:
+        channel = self._channels.get(subscriber.showtime_id)
+        if channel is None:
+            return
+        channel.subscribers.discard(subscriber)
+        if not channel.subscribers:
+            if channel.flush_handle is not None:
+                channel.flush_handle.cancel()
+            del self._channels[subscriber.showtime_id]
+
+    def publish(self, showtime_id: int, seat_codes: Iterable[str], status: str) -> None:
+        """Record seat changes; nothing happens if nobody is listening. Safe from any thread."""
+        if self._loop is None:
+            return  # Nobody has ever subscribed
+
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is not self._loop:
+            self._loop.call_soon_threadsafe(self._record, showtime_id, list(seat_codes), status)
+        else:
+            self._record(showtime_id, seat_codes, status)
+
+    def _record(self, showtime_id: int, seat_codes: Iterable[str], status: str) -> None:
+        channel = self._channels.get(showtime_id)
+        if channel is None:
+            return
+
+        for seat_code in seat_codes:
+            channel.pending[seat_code] = status  # Last write wins
+
+        if channel.flush_handle is None:
+            channel.flush_handle = self._loop.call_later(
+                self.coalesce_seconds, self._flush, showtime_id
+            )
+
+    def resync_all(self) -> None:
+        """Send every subscriber a fresh snapshot (changes may have been missed)."""
+        for channel in self._channels.values():
+            for subscriber in channel.subscribers:
+                subscriber.offer(RESYNC)
+
+    def _flush(self, showtime_id: int) -> None:
+        channel = self._channels.get(showtime_id)
+        if channel is None:
+            return
+        channel.flush_handle = None
+        if not channel.pending:
+            return
+
+        # Group seats by status: {"locked": ["A-1", "A-2"], "available": [...]}
+        changes: Dict[str, list] = {}
+        for seat_code, status in channel.pending.items():
+            changes.setdefault(status, []).append(seat_code)
+        channel.pending = {}
+        channel.seq += 1
+
+        message = format_sse("delta", {"seq": channel.seq, "changes": changes})
+        for subscriber in channel.subscribers:
+            subscriber.offer(message)
+
+    def stats(self) -> dict:
+        return {
+            "showtimes": len(self._channels),
+            "subscribers": sum(len(c.subscribers) for c in self._channels.values()),
+        }
+
+
+class SeatMapFanout:
+    """
+    Applies seat changes in every worker: first to the grid cache, then to
+    the live seat map. In that order, a snapshot stamped with a seq always
+    includes the deltas that seq counts (snapshots read the grid cache).
+    """
+
+    def __init__(self, broadcaster: SeatMapBroadcaster, grid_cache: SeatGridCache, bus: Broadcast):
+        self.broadcaster = broadcaster
+        self.grid_cache = grid_cache
+        self.bus = bus
+        bus.subscribe(SEAT_CHANGES_CHANNEL, self._apply, on_resync=self._resync)
+
+    async def publish(self, showtime_id: int, seat_codes: Iterable[str], status: StatusEnum) -> None:
+        await self.bus.publish(
+            SEAT_CHANGES_CHANNEL,
+            {"showtime_id": showtime_id, "seat_codes": list(seat_codes), "status": status.value},
+        )
+
+    def _apply(self, change: dict) -> None:
+        status = StatusEnum(change["status"])
+        self.grid_cache.apply(change["showtime_id"], change["seat_codes"], status)
+        self.broadcaster.publish(change["showtime_id"], change["seat_codes"], status.value)
+
+    def _resync(self) -> None:
+        """Changes may have been missed: reload grids and resend snapshots."""
+        self.grid_cache.invalidate()
+        self.broadcaster.resync_all()
+
+    def start(self) -> None:
+        self.broadcaster.bind(asyncio.get_running_loop())
+
+
+seat_map_broadcaster = SeatMapBroadcaster(
+    coalesce_seconds=settings.SEAT_STREAM_COALESCE_SECONDS,
+    queue_size=settings.SEAT_STREAM_QUEUE_SIZE,
+)
+
+seat_map_fanout = SeatMapFanout(seat_map_broadcaster, seat_grid_cache, broadcast)
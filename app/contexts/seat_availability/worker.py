@@ -4,14 +4,26 @@
 SeatAvailability Expiration Worker
 """
 
-from datetime import datetime, timezone
+import asyncio
+
+from app.core.config import settings
 from app.core.database import SessionLocal
+from app.shared.services.expiration_scheduler import ExpirationScheduler
+
+from .repository import SeatLockRepository
 from .service import SeatAvailabilityService
 
+seat_service = SeatAvailabilityService()
 
-def utcnow():
-    """Return timezone-aware UTC datetime."""
-    return datetime.now(timezone.utc)
+seat_expiration_scheduler = ExpirationScheduler(
+    name="seat locks",
+    load_upcoming=SeatLockRepository().list_upcoming_expiries,
+    expire_batch=seat_service.expire_seats_batch,
+    batch_size=settings.EXPIRATION_BATCH_SIZE,
+    lookahead=settings.EXPIRATION_LOOKAHEAD,
+    reload_interval=settings.EXPIRATION_RELOAD_SECONDS,
+    retry_interval=settings.EXPIRATION_RETRY_SECONDS,
+)
 
 
 async def run_expiration_sweep() -> int:
@@ -19,11 +31,11 @@ async def run_expiration_sweep() -> int:
     Perform one sweep of the expiration process.
     Returns the number of seat locks that were expired/unlocked.
     """
-    seat_service = SeatAvailabilityService()
-    
-    db = SessionLocal()
-    try:
-        expired_count = await seat_service.expire_seats(db)
-        return expired_count
-    finally:
-        db.close()
\ No newline at end of file
+    def sweep() -> int:
+        db = SessionLocal()
+        try:
+            return seat_service.expire_seats(db)
+        finally:
+            db.close()
+
+    return await asyncio.to_thread(sweep)
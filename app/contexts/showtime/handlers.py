@@ -13,7 +13,7 @@ from datetime import datetime, timezone
 from sqlalchemy import select
 
 from app.core.event_bus import event_bus
-from app.core.database import SessionLocal
+from app.core.unit_of_work import event_session
 from .models import Showtime
 
 
@@ -29,8 +29,7 @@ async def on_screen_deleted(payload: dict):
     if screen_id is None:
         return
 
-    db = SessionLocal()
-    try:
+    with event_session() as db:
         now = _utcnow()
         showtimes = db.scalars(
             select(Showtime).where(
@@ -44,11 +43,9 @@ async def on_screen_deleted(payload: dict):
             st.is_active = False
 
         db.commit()
-    finally:
-        db.close()
 
 
-event_bus.subscribe("screen.deleted", on_screen_deleted)
+event_bus.subscribe("screen.deleted", on_screen_deleted, blocking=True)
 
 
 # -----------------------------------------------------------
@@ -59,8 +56,7 @@ async def on_movie_deactivated(payload: dict):
     if movie_id is None:
         return
 
-    db = SessionLocal()
-    try:
+    with event_session() as db:
         now = _utcnow()
         showtimes = db.scalars(
             select(Showtime).where(
@@ -74,11 +70,9 @@ async def on_movie_deactivated(payload: dict):
             st.is_active = False
 
         db.commit()
-    finally:
-        db.close()
 
 
-event_bus.subscribe("movie.deactivated", on_movie_deactivated)
+event_bus.subscribe("movie.deactivated", on_movie_deactivated, blocking=True)
 
 
 # -----------------------------------------------------------
@@ -89,8 +83,7 @@ async def on_admin_force_cancel_showtime(payload: dict):
     if showtime_id is None:
         return
 
-    db = SessionLocal()
-    try:
+    with event_session() as db:
         st = db.get(Showtime, showtime_id)
         if not st:
             return
@@ -98,8 +91,6 @@ async def on_admin_force_cancel_showtime(payload: dict):
         if st.is_active:
             st.is_active = False
             db.commit()
-    finally:
-        db.close()
 
 
-event_bus.subscribe("admin.force_cancel_showtime", on_admin_force_cancel_showtime)
+event_bus.subscribe("admin.force_cancel_showtime", on_admin_force_cancel_showtime, blocking=True)
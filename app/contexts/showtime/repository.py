@@ -1,4 +1,5 @@
 # app/contexts/showtime/repository.py
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from sqlalchemy import select
 from .models import Showtime
@@ -58,4 +59,35 @@ class ShowtimeRepository:
     def delete(self, db: Session, showtime: Showtime):
         """Delete a showtime."""
         db.delete(showtime)
-        db.commit()
\ No newline at end of file
+        db.commit()
+
+
+class AsyncShowtimeRepository:
+    """Async repository for Showtime aggregate."""
+
+    async def get_by_id(self, db: AsyncSession, showtime_id: int):
+        """Get showtime by ID."""
+        return await db.get(Showtime, showtime_id)
+
+    async def list_all(self, db: AsyncSession):
+        """List all showtimes."""
+        return (await db.scalars(select(Showtime))).all()
+
+    async def list_for_movie(self, db: AsyncSession, movie_id: int):
+        """List all showtimes for a specific movie."""
+        return (await db.scalars(
+            select(Showtime).where(Showtime.movie_id == movie_id)
+        )).all()
+
+    async def list_for_screen(self, db: AsyncSession, screen_id: int):
+        """List all showtimes for a specific screen."""
+        return (await db.scalars(
+            select(Showtime).where(Showtime.screen_id == screen_id)
+        )).all()
+
+    async def save(self, db: AsyncSession, showtime: Showtime):
+        """Create or update a showtime."""
+        db.add(showtime)
+        await db.commit()
+        await db.refresh(showtime)
+        return showtime
@@ -1,8 +1,9 @@
 # app/contexts/showtime/router.py
 from fastapi import APIRouter, Depends, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.core.database import get_db
+from app.core.database import get_db, get_async_db
 from app.contexts.auth.dependencies import get_current_user
 from .service import ShowtimeService
 from .schemas import ShowtimeCreate, ShowtimeUpdate, ShowtimeRead
@@ -26,23 +27,23 @@ async def create_showtime_route(
 
 
 @router.get("/", response_model=list[ShowtimeRead])
-def list_showtimes_route(db: Session = Depends(get_db)):
-    return showtime_service.list_showtimes(db)
+async def list_showtimes_route(db: AsyncSession = Depends(get_async_db)):
+    return await showtime_service.list_showtimes_async(db)
 
 
 @router.get("/{showtime_id}", response_model=ShowtimeRead)
-def get_showtime_route(showtime_id: int, db: Session = Depends(get_db)):
-    return showtime_service.get_showtime(db, showtime_id)
+async def get_showtime_route(showtime_id: int, db: AsyncSession = Depends(get_async_db)):
+    return await showtime_service.get_showtime_async(db, showtime_id)
 
 
 @router.get("/movie/{movie_id}", response_model=list[ShowtimeRead])
-def list_showtimes_for_movie_route(movie_id: int, db: Session = Depends(get_db)):
-    return showtime_service.list_showtimes_for_movie(db, movie_id)
+async def list_showtimes_for_movie_route(movie_id: int, db: AsyncSession = Depends(get_async_db)):
+    return await showtime_service.list_showtimes_for_movie_async(db, movie_id)
 
 
 @router.get("/screen/{screen_id}", response_model=list[ShowtimeRead])
-def list_showtimes_for_screen_route(screen_id: int, db: Session = Depends(get_db)):
-    return showtime_service.list_showtimes_for_screen(db, screen_id)
+async def list_showtimes_for_screen_route(screen_id: int, db: AsyncSession = Depends(get_async_db)):
+    return await showtime_service.list_showtimes_for_screen_async(db, screen_id)
 
 
 @router.put("/{showtime_id}", response_model=ShowtimeRead)
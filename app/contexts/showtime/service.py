@@ -1,4 +1,5 @@
 # app/contexts/showtime/service.py
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.core.errors import ValidationError, NotFoundError, ConflictError
@@ -15,7 +16,7 @@ from .events import (
 
 from app.contexts.movie.models import Movie
 from app.contexts.screen.models import Screen
-from .repository import ShowtimeRepository
+from .repository import ShowtimeRepository, AsyncShowtimeRepository
 
 
 class ShowtimeService:
@@ -23,6 +24,7 @@ class ShowtimeService:
     
     def __init__(self):
         self.repo = ShowtimeRepository()
+        self.async_repo = AsyncShowtimeRepository()
 
     # =====================================================================
     # CREATE
@@ -112,6 +114,28 @@ class ShowtimeService:
         """List showtimes for a screen (read operation, stays sync)."""
         return self.repo.list_for_screen(db, screen_id)
 
+    async def get_showtime_async(self, db: AsyncSession, showtime_id: int) -> Showtime:
+        """Get showtime by ID without blocking the event loop."""
+        showtime = await self.async_repo.get_by_id(db, showtime_id)
+        if not showtime:
+            raise NotFoundError(
+                "Showtime not found",
+                context={"showtime_id": showtime_id}
+            )
+        return showtime
+
+    async def list_showtimes_async(self, db: AsyncSession):
+        """List all showtimes without blocking the event loop."""
+        return await self.async_repo.list_all(db)
+
+    async def list_showtimes_for_movie_async(self, db: AsyncSession, movie_id: int):
+        """List showtimes for a movie without blocking the event loop."""
+        return await self.async_repo.list_for_movie(db, movie_id)
+
+    async def list_showtimes_for_screen_async(self, db: AsyncSession, screen_id: int):
+        """List showtimes for a screen without blocking the event loop."""
+        return await self.async_repo.list_for_screen(db, screen_id)
+
     # =====================================================================
     # UPDATE
     # =====================================================================
@@ -231,4 +255,5 @@ class ShowtimeService:
         event = showtime_cancelled_event(showtime_id, reason=reason, user_id=user_id)
         await publish_event_async(event["type"], event["payload"])
         
-        return showtime
\ No newline at end of file
+        return showtime
+
@@ -1,5 +1,5 @@
 from sqlalchemy.orm import Session
-from app.core.database import SessionLocal
+from app.core.unit_of_work import event_session
 from app.core.event_bus import event_bus
 
 from .service import UserProfileService
@@ -8,8 +8,7 @@ profile_service = UserProfileService()
 
 
 async def on_user_registered(payload: dict):
-    db = SessionLocal()
-    try:
+    with event_session() as db:
         user_id = payload.get("user_id")
         email = payload.get("email")
 
@@ -21,13 +20,10 @@ async def on_user_registered(payload: dict):
             user_id=user_id,
             email=email,
         )
-    finally:
-        db.close()
 
 
 async def on_admin_force_delete(payload: dict):
-    db = SessionLocal()
-    try:
+    with event_session() as db:
         user_id = payload.get("user_id")
 
         if not user_id:
@@ -37,9 +33,7 @@ async def on_admin_force_delete(payload: dict):
             db,
             user_id=user_id,
         )
-    finally:
-        db.close()
 
 
-event_bus.subscribe("auth.user_registered", on_user_registered)
-event_bus.subscribe("admin.user_force_delete", on_admin_force_delete)
\ No newline at end of file
+event_bus.subscribe("auth.user_registered", on_user_registered, blocking=True)
+event_bus.subscribe("admin.user_force_delete", on_admin_force_delete, blocking=True)
\ No newline at end of file
@@ -1,3 +1,4 @@
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from sqlalchemy import select
 from .models import UserProfile
@@ -38,4 +39,17 @@ class UserProfileRepository:
 
     def get_by_email(self, db: Session, email: str):
         stmt = select(UserProfile).where(UserProfile.email == email)
-        return db.scalar(stmt)
\ No newline at end of file
+        return db.scalar(stmt)
+
+
+class AsyncUserProfileRepository:
+
+    async def get_by_id(self, db: AsyncSession, profile_id: int):
+        return await db.get(UserProfile, profile_id)
+
+    async def get_by_user_id(self, db: AsyncSession, user_id: int):
+        stmt = select(UserProfile).where(UserProfile.user_id == user_id)
+        return (await db.scalars(stmt)).first()
+
+    async def list_all(self, db: AsyncSession):
+        return (await db.scalars(select(UserProfile))).all()
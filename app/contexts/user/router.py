@@ -1,7 +1,8 @@
 from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.core.database import get_db
+from app.core.database import get_db, get_async_db
 from app.contexts.auth.dependencies import get_current_user
 from .schemas import UserProfileResponse, UserProfileUpdate
 from .service import UserProfileService
@@ -15,12 +16,12 @@ router = APIRouter(
 
 
 @router.get("/me", response_model=UserProfileResponse)
-def get_my_profile(
-    db: Session = Depends(get_db),
+async def get_my_profile(
+    db: AsyncSession = Depends(get_async_db),
     current_user = Depends(get_current_user),
 ):
     """Get authenticated user's profile"""
-    return service.get_profile(db, current_user.id)
+    return await service.get_profile_async(db, current_user.id)
 
 
 @router.patch("/me", response_model=UserProfileResponse)
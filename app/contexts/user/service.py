@@ -1,10 +1,11 @@
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.core.errors import ValidationError, NotFoundError, ConflictError
 from app.shared.services.event_publisher import publish_event_async  # Changed!
 
 from .schemas import UserProfileUpdate
-from .repository import UserProfileRepository
+from .repository import UserProfileRepository, AsyncUserProfileRepository
 from .models import UserProfile, UserTypeEnum
 from .events import (
     profile_created_event,
@@ -17,6 +18,7 @@ class UserProfileService:
     
     def __init__(self):
         self.repo = UserProfileRepository()
+        self.async_repo = AsyncUserProfileRepository()
     
     async def create_profile(self, db: Session, user_id: int, email: str, name: str = None):  # Made async
         """
@@ -50,6 +52,14 @@ class UserProfileService:
             raise NotFoundError("Profile not found")
         
         return profile
+
+
+    async def get_profile_async(self, db: AsyncSession, user_id: int):
+        profile = await self.async_repo.get_by_user_id(db, user_id)
+        if profile is None:
+            raise NotFoundError("Profile not found")
+
+        return profile
     
 
     async def update_profile(self, db: Session, user_id: int, data: UserProfileUpdate):  # Made async
@@ -93,4 +103,5 @@ class UserProfileService:
         event = user_type_changed(user_id, new_type.value)
         await publish_event_async(event["type"], event["payload"])  # Changed!
 
-        return updated_profile
\ No newline at end of file
+        return updated_profile
+
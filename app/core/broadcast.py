@@ -0,0 +1,182 @@
+# app/core/broadcast.py
+
+"""
+Cross-worker broadcast over Postgres LISTEN/NOTIFY.
+
+Domain events are handled by one process, but in-process state (seat
+grids, the live seat map, auth caches) exists in every worker. Code that
+changes such state calls broadcast.publish(channel, message): the message
+is applied in this process at once and sent with NOTIFY, and every other
+process applies it when its LISTEN connection receives it.
+
+NOTIFY is fire-and-forget: messages sent while a listener is
+(re)connecting are lost, so a subscriber also registers on_resync, run
+whenever it may have missed messages (after every connect, and when a
+message was too large to send). It usually drops the cached state.
+
+With BROADCAST_MODE = "local" (development, or a single worker) messages
+are only applied in this process.
+"""
+
+import asyncio
+import json
+import logging
+import uuid
+from collections import defaultdict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import text
+
+from app.core.config import settings
+from app.core.database import async_engine
+
+logger = logging.getLogger(__name__)
+
+BROADCAST_LOCAL = "local"
+BROADCAST_POSTGRES = "postgres"
+
+# NOTIFY payloads must stay under 8000 bytes
+MAX_PAYLOAD_BYTES = 7900
+
+MessageHandler = Callable[[Dict[str, Any]], None]
+ResyncHandler = Callable[[], None]
+
+
+class Broadcast:
+    """One LISTEN connection per process, shared by every channel."""
+
+    def __init__(self, mode: str = BROADCAST_POSTGRES, reconnect_seconds: float = 5.0):
+        if mode not in (BROADCAST_LOCAL, BROADCAST_POSTGRES):
+            raise ValueError(f"Unknown broadcast mode: {mode}")
+
+        self.mode = mode
+        self.reconnect_seconds = reconnect_seconds
+        # Tags our own messages, which the listener receives too
+        self.origin = uuid.uuid4().hex
+        self.listening = False
+
+        self._subscribers: Dict[str, List[Tuple[MessageHandler, Optional[ResyncHandler]]]] = defaultdict(list)
+        self._task: Optional[asyncio.Task] = None
+        self._stop: Optional[asyncio.Event] = None
+
+    @property
+    def synced(self) -> bool:
+        """False while messages from other workers could be missed (not listening)."""
+        return self.mode == BROADCAST_LOCAL or self.listening
+
+    def subscribe(
+        self,
+        channel: str,
+        on_message: MessageHandler,
+        on_resync: Optional[ResyncHandler] = None,
+    ) -> None:
+        """Register a handler (called on the event loop) for one channel."""
+        self._subscribers[channel].append((on_message, on_resync))
+
+    async def publish(self, channel: str, message: Dict[str, Any]) -> None:
+        """Apply a message here and send it to every other worker."""
+        self._deliver(channel, message)
+        if self.mode == BROADCAST_LOCAL:
+            return
+
+        envelope = json.dumps({"origin": self.origin, "message": message}, separators=(",", ":"))
+        if len(envelope.encode()) > MAX_PAYLOAD_BYTES:
+            # Too large for NOTIFY: the other workers resync instead
+            envelope = json.dumps({"origin": self.origin, "resync": True})
+
+        try:
+            async with async_engine.connect() as conn:
+                await conn.execute(
+                    text("SELECT pg_notify(:channel, :payload)"),
+                    {"channel": channel, "payload": envelope},
+                )
+                await conn.commit()
+        except Exception as e:
+            logger.warning(f"⚠️  Broadcast on {channel} reached this worker only: {e}")
+
+    def _deliver(self, channel: str, message: Dict[str, Any]) -> None:
+        for on_message, _ in self._subscribers.get(channel, ()):
+            try:
+                on_message(message)
+            except Exception as e:
+                logger.exception(f"❌ Broadcast handler failed on {channel}: {e}")
+
+    def _resync(self, channel: Optional[str] = None) -> None:
+        channels = [channel] if channel is not None else list(self._subscribers)
+        for name in channels:
+            for _, on_resync in self._subscribers.get(name, ()):
+                if on_resync is None:
+                    continue
+                try:
+                    on_resync()
+                except Exception as e:
+                    logger.exception(f"❌ Broadcast resync failed on {name}: {e}")
+
+    def _on_notify(self, connection, pid, channel: str, payload: str) -> None:
+        try:
+            envelope = json.loads(payload)
+        except ValueError as e:
+            logger.warning(f"⚠️  Ignoring malformed broadcast on {channel}: {e}")
+            return
+
+        if envelope.get("origin") == self.origin:
+            return  # Already applied when it was published
+        if envelope.get("resync"):
+            self._resync(channel)
+        else:
+            self._deliver(channel, envelope.get("message") or {})
+
+    async def run_forever(self) -> None:
+        """Hold the LISTEN connection; reconnect (and resync) when it drops."""
+        while not self._stop.is_set():
+            try:
+                async with async_engine.connect() as conn:
+                    listener = (await conn.get_raw_connection()).driver_connection
+                    lost = asyncio.Event()
+                    listener.add_termination_listener(lambda _: lost.set())
+                    for channel in self._subscribers:
+                        await listener.add_listener(channel, self._on_notify)
+                    self.listening = True
+                    logger.info(f"📡 Listening for broadcasts on {', '.join(self._subscribers)}")
+
+                    # Anything sent while we were not listening is gone
+                    self._resync()
+
+                    stop = asyncio.ensure_future(self._stop.wait())
+                    dropped = asyncio.ensure_future(lost.wait())
+                    await asyncio.wait({stop, dropped}, return_when=asyncio.FIRST_COMPLETED)
+                    stop.cancel()
+                    dropped.cancel()
+                    self.listening = False
+
+                    if not lost.is_set():
+                        for channel in self._subscribers:
+                            await listener.remove_listener(channel, self._on_notify)
+            except Exception as e:
+                self.listening = False
+                logger.exception(f"❌ Broadcast listener failed: {e}")
+
+            if not self._stop.is_set():
+                try:
+                    await asyncio.wait_for(self._stop.wait(), timeout=self.reconnect_seconds)
+                except asyncio.TimeoutError:
+                    pass
+
+    def start(self) -> None:
+        if self.mode != BROADCAST_POSTGRES or self._task is not None or not self._subscribers:
+            return
+        self._stop = asyncio.Event()
+        self._task = asyncio.create_task(self.run_forever())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._stop.set()
+        await self._task
+        self._task = None
+
+
+broadcast = Broadcast(
+    mode=settings.BROADCAST_MODE,
+    reconnect_seconds=settings.BROADCAST_RECONNECT_SECONDS,
+)
@@ -17,6 +17,8 @@ class Settings(BaseSettings):
     PROJECT_NAME: str = "Cinema Booking System"
     DEBUG: bool = True
     ALLOWED_ORIGINS: List[str] = ["*"]
+    REQUEST_LOG_SAMPLE_RATE: float = 1.0  # Fraction of normal requests logged
+    REQUEST_SLOW_THRESHOLD_SECONDS: float = 1.0  # Slower requests are always logged
 
     # -----------------------------
     # Authentication / JWT
@@ -25,6 +27,16 @@ class Settings(BaseSettings):
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
     JWT_ALGORITHM: str = "HS256"
+    AUTH_TOKEN_CACHE_SIZE: int = 10000
+    AUTH_TOKEN_CACHE_TTL_SECONDS: float = 300.0
+    AUTH_USER_CACHE_SIZE: int = 10000
+    AUTH_USER_CACHE_TTL_SECONDS: float = 30.0
+    AUTH_BCRYPT_ROUNDS: int = 12
+    AUTH_HASH_WORKERS: int = 4
+    AUTH_HASH_MAX_PENDING: int = 64
+    AUTH_REVOCATION_BLOOM_CAPACITY: int = 100000
+    AUTH_REVOCATION_BLOOM_ERROR_RATE: float = 0.001
+    AUTH_REVOCATION_RELOAD_SECONDS: float = 60.0
 
     # -----------------------------
     # Email / NotificationContext
@@ -33,12 +45,71 @@ class Settings(BaseSettings):
     SMTP_USER: str
     SMTP_PASSWORD: str
     SMTP_PORT: int = 587
+    SMTP_SECURITY: str = "starttls"  # "starttls" (587), "ssl" (implicit TLS, 465) or "none"
+    SMTP_POOL_SIZE: int = 4
+    SMTP_TIMEOUT_SECONDS: float = 10.0
+    NOTIFICATION_TRANSPORT: str = "console"  # "smtp", "console" or "memory"
+    NOTIFICATION_FROM_EMAIL: str = "no-reply@cinema.local"
+    NOTIFICATION_WORKERS: int = 4
+    NOTIFICATION_QUEUE_SIZE: int = 10000
+    NOTIFICATION_BATCH_SIZE: int = 50
+    NOTIFICATION_MAX_ATTEMPTS: int = 5
+    NOTIFICATION_TEMPLATE_CHECK_SECONDS: float = 2.0
 
     # -----------------------------
     # Internal Event Bus
     # -----------------------------
-    EVENT_BACKEND: str = "memory"
+    EVENT_BACKEND: str = "memory"  # "memory" (inline) or "queue" (worker tasks)
     CHANNEL_NAME: str = "domain_events"
+    EVENT_DISPATCH_MODE: str = "sequential"  # "sequential" or "concurrent"
+    EVENT_HANDLER_TIMEOUT_SECONDS: Optional[float] = 30.0
+    EVENT_WORKERS_PER_TYPE: int = 2
+    EVENT_QUEUE_MAXSIZE: int = 1000
+    EVENT_DRAIN_TIMEOUT_SECONDS: float = 30.0
+
+    # -----------------------------
+    # Transactional Outbox
+    # -----------------------------
+    OUTBOX_BATCH_SIZE: int = 100
+    OUTBOX_POLL_INTERVAL_SECONDS: float = 1.0
+    OUTBOX_MAX_ATTEMPTS: int = 5
+    OUTBOX_DEDUPE_RETENTION_HOURS: int = 72  # How long consumers remember delivered event ids
+    OUTBOX_DISPATCH_CONCURRENCY: int = 20  # Events delivered at the same time (per relay)
+    OUTBOX_LEASE_SECONDS: float = 300.0  # A claimed event is redelivered if not recorded by then
+
+    # -----------------------------
+    # Cross-worker Broadcast
+    # -----------------------------
+    BROADCAST_MODE: str = "postgres"  # "postgres" (LISTEN/NOTIFY to every worker) or "local" (single worker)
+    BROADCAST_RECONNECT_SECONDS: float = 5.0
+
+    # -----------------------------
+    # Seat Map Caches
+    # -----------------------------
+    SEAT_GRID_CACHE_TTL_SECONDS: float = 30.0
+    SEAT_GRID_CACHE_MAX_SHOWTIMES: int = 1000
+    LAYOUT_INDEX_TTL_SECONDS: float = 300.0
+    SEAT_STREAM_COALESCE_SECONDS: float = 0.1
+    SEAT_STREAM_QUEUE_SIZE: int = 100
+    SEAT_STREAM_HEARTBEAT_SECONDS: float = 15.0
+    SEAT_STREAM_RESYNC_SECONDS: float = 30.0
+
+    # -----------------------------
+    # Pricing
+    # -----------------------------
+    PRICING_PIPELINE_TTL_SECONDS: float = 60.0
+
+    # -----------------------------
+    # Audit
+    # -----------------------------
+    AUDIT_WRITE_MODE: str = "buffered"  # "buffered" or "direct"
+    AUDIT_BUFFER_CAPACITY: int = 10000
+    AUDIT_BATCH_SIZE: int = 500
+    AUDIT_FLUSH_INTERVAL_SECONDS: float = 1.0
+    AUDIT_RETENTION_MONTHS: int = 12
+    AUDIT_PARTITION_PREMAKE_MONTHS: int = 3
+    AUDIT_ARCHIVE_DIR: str = "archive/audit"
+    AUDIT_RETENTION_INTERVAL_SECONDS: float = 21600.0
 
     # -----------------------------
     # Payment Provider
@@ -55,6 +126,11 @@ class Settings(BaseSettings):
     # Policies
     # -----------------------------
     RESERVATION_TIMEOUT_MINUTES: int = 15
+    EXPIRATION_BATCH_SIZE: int = 500
+    EXPIRATION_LOOKAHEAD: int = 1000
+    EXPIRATION_RELOAD_SECONDS: float = 60.0
+    EXPIRATION_RETRY_SECONDS: float = 5.0  # Wait after a failed expiry before trying again
+    SEAT_BATCH_MAX_SEATS: int = 10
     PAYMENT_TIMEOUT_MINUTES: int = 10
 
     class Config:
@@ -1,5 +1,7 @@
 # app/core/database.py
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
 from app.core.config import settings
@@ -27,6 +29,36 @@ SessionLocal = sessionmaker(
     future=True,
 )
 
+# -----------------------------
+# Async engine / session factory
+# -----------------------------
+def _async_database_url() -> str:
+    """ASYNC_DATABASE_URL if set, otherwise DATABASE_URL on the asyncpg driver."""
+    if settings.ASYNC_DATABASE_URL:
+        return settings.ASYNC_DATABASE_URL
+
+    url = make_url(settings.DATABASE_URL)
+    if url.get_backend_name() == "postgresql":
+        url = url.set(drivername="postgresql+asyncpg")
+    return url.render_as_string(hide_password=False)
+
+
+async_engine = create_async_engine(
+    _async_database_url(),
+    pool_pre_ping=True,
+    pool_size=10,
+    max_overflow=20,
+    echo=settings.DEBUG,
+)
+
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
+
 # -----------------------------
 # Dependency for FastAPI routes
 # -----------------------------
@@ -38,6 +70,12 @@ def get_db():
         db.close()
 
 
+async def get_async_db():
+    """Async session for routes that must not block the event loop."""
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
 # Import all models so SQLAlchemy knows about them
 from app.contexts.auth.models import UserCredential
 from app.contexts.user.models import UserProfile  
@@ -50,4 +88,5 @@ from app.contexts.order.models import Order
 from app.contexts.pricing.models import PriceModifier  
 from app.contexts.payment.models import PaymentAttempt  
 from app.contexts.refund.models import RefundRequest
-from app.contexts.audit.models import AuditLogEntry
\ No newline at end of file
+from app.contexts.audit.models import AuditLogEntry
+from app.shared.outbox.models import OutboxEvent, ProcessedEvent
\ No newline at end of file
@@ -2,47 +2,474 @@
 
 import asyncio
 import logging
+import threading
+import time
 from collections import defaultdict
-from typing import Callable, Dict, Any, List, Awaitable
+from contextvars import ContextVar
+from dataclasses import dataclass, asdict
+from typing import Callable, Collection, Dict, Any, List, Awaitable, Iterable, Optional, Tuple
+
+from app.core.config import settings
+from app.core import unit_of_work
 
 logger = logging.getLogger(__name__)
 
 EventHandler = Callable[[Dict[str, Any]], Awaitable[None]]
 
+DISPATCH_SEQUENTIAL = "sequential"
+DISPATCH_CONCURRENT = "concurrent"
+
+BACKEND_MEMORY = "memory"
+BACKEND_QUEUE = "queue"
+
+# Set in a blocking handler's worker thread: the loop events it publishes go back to
+_app_loop: ContextVar[Optional[asyncio.AbstractEventLoop]] = ContextVar("event_bus_app_loop", default=None)
+
+_worker_thread = threading.local()
+
+
+@dataclass(frozen=True)
+class Subscription:
+    """
+    A handler registered for one event type.
+
+    - group: handlers sharing a group run one after another (in subscription
+      order); different groups run concurrently in "concurrent" mode.
+    - after: groups (or handler keys) that must finish before this one starts.
+    - timeout: per-handler timeout in seconds (falls back to the bus default).
+    - blocking: the handler does synchronous database work; it runs in a
+      worker thread so it neither stalls the event loop nor outlives its
+      timeout unnoticed.
+    """
+    handler: EventHandler
+    group: Optional[str] = None
+    after: Tuple[str, ...] = ()
+    timeout: Optional[float] = None
+    blocking: bool = False
+
+    @property
+    def key(self) -> str:
+        """Module-qualified handler name, usable as an implicit group."""
+        return f"{self.handler.__module__}.{self.handler.__qualname__}"
+
+    @property
+    def chain(self) -> str:
+        return self.group or self.key
+
+
+@dataclass(frozen=True)
+class _DispatchPlan:
+    """Handlers of one event type grouped into ordered chains."""
+    chains: Dict[str, List[Subscription]]
+    dependencies: Dict[str, Tuple[str, ...]]
+
 
 class EventBus:
     """
     Lightweight asynchronous in-memory event bus for domain events.
+
+    In "sequential" mode every handler is awaited in subscription order.
+    In "concurrent" mode independent chains run at the same time, so a
+    publish takes as long as the slowest chain instead of the sum of all
+    handlers.
+
+    Handlers of one dispatch share a database session through
+    app.core.unit_of_work (one per chain in concurrent mode). Handlers
+    subscribed with blocking=True do their synchronous database work in a
+    worker thread, so concurrent chains actually overlap.
     """
 
-    def __init__(self) -> None:
-        self.subscribers: Dict[str, List[EventHandler]] = defaultdict(list)
+    def __init__(
+        self,
+        dispatch_mode: str = DISPATCH_SEQUENTIAL,
+        default_timeout: Optional[float] = None,
+    ) -> None:
+        if dispatch_mode not in (DISPATCH_SEQUENTIAL, DISPATCH_CONCURRENT):
+            raise ValueError(f"Unknown event dispatch mode: {dispatch_mode}")
+
+        self.dispatch_mode = dispatch_mode
+        self.default_timeout = default_timeout
+        self.subscribers: Dict[str, List[Subscription]] = defaultdict(list)
+        self._plans: Dict[str, _DispatchPlan] = {}
 
-    def subscribe(self, event_type: str, handler: EventHandler) -> None:
-        self.subscribers[event_type].append(handler)
+    def subscribe(
+        self,
+        event_type: str,
+        handler: EventHandler,
+        *,
+        group: Optional[str] = None,
+        after: Iterable[str] = (),
+        timeout: Optional[float] = None,
+        blocking: bool = False,
+    ) -> None:
+        subscription = Subscription(
+            handler=handler,
+            group=group,
+            after=tuple(after),
+            timeout=timeout,
+            blocking=blocking,
+        )
+        self.subscribers[event_type].append(subscription)
+        self._plans.pop(event_type, None)
         logger.info(f"✓ Subscribed handler {handler.__name__} to event {event_type}")
 
     async def publish(self, event_type: str, payload: Dict[str, Any]) -> None:
-        handlers = self.subscribers.get(event_type, [])
-        
-        logger.info(f"📨 Event bus publishing {event_type} to {len(handlers)} handlers")
-        
-        if not handlers:
-            logger.warning(f"⚠️  No handlers registered for event: {event_type}")
+        """Deliver an event. The in-memory backend runs handlers inline."""
+        if await self._forward_to_app_loop(event_type, payload):
             return
+        await self.dispatch(event_type, payload)
+
+    async def _forward_to_app_loop(self, event_type: str, payload: Dict[str, Any]) -> bool:
+        """
+        Events published from a blocking handler's thread are delivered on
+        the application loop, where the loop-bound handlers (caches, live
+        streams, schedulers) live. Returns False when already there.
+        """
+        app_loop = _app_loop.get()
+        if app_loop is None or app_loop is asyncio.get_running_loop():
+            return False
+        future = asyncio.run_coroutine_threadsafe(self.publish(event_type, payload), app_loop)
+        await asyncio.wrap_future(future)
+        return True
+
+    async def dispatch(
+        self,
+        event_type: str,
+        payload: Dict[str, Any],
+        handlers: Optional[Collection[str]] = None,
+    ) -> Dict[str, str]:
+        """
+        Run the handlers subscribed to event_type in the current task.
+
+        Handler failures are logged, not raised; they are returned as
+        {handler key: error} so a caller that can redeliver (the outbox
+        relay) knows which ones to retry. `handlers` restricts delivery to
+        those handler keys; such partial redeliveries run sequentially.
+        """
+        subscriptions = self.subscribers.get(event_type, [])
+        if handlers is not None:
+            subscriptions = [s for s in subscriptions if s.key in handlers]
+
+        logger.info(f"📨 Event bus publishing {event_type} to {len(subscriptions)} handlers")
+
+        if not subscriptions:
+            if handlers is None:
+                logger.warning(f"⚠️  No handlers registered for event: {event_type}")
+            return {}
+
+        if self.dispatch_mode == DISPATCH_CONCURRENT and handlers is None and len(subscriptions) > 1:
+            plan = self._get_plan(event_type)
+            if plan is not None:
+                return await self._dispatch_concurrent(plan, event_type, payload)
 
         # Wait for all handlers to complete (changed from create_task)
-        for handler in handlers:
-            logger.debug(f"Invoking handler: {handler.__name__} for {event_type}")
-            await self._safe_invoke(handler, event_type, payload)
+        failures: Dict[str, str] = {}
+        with unit_of_work.unit_of_work_scope():
+            for subscription in subscriptions:
+                logger.debug(f"Invoking handler: {subscription.handler.__name__} for {event_type}")
+                error = await self._safe_invoke(subscription, event_type, payload)
+                if error is not None:
+                    failures[subscription.key] = error
+        return failures
+
+    async def drain(self, timeout: Optional[float] = None) -> None:
+        """Wait for in-flight events. Nothing is buffered in memory mode."""
+        return None
+
+    def metrics(self) -> Dict[str, Any]:
+        return {"backend": BACKEND_MEMORY, "dispatch_mode": self.dispatch_mode}
+
+    # -------------------------------------------------------
+    # Concurrent dispatch
+    # -------------------------------------------------------
+
+    def _get_plan(self, event_type: str) -> Optional[_DispatchPlan]:
+        """Build (and cache) the chain layout for an event type."""
+        if event_type in self._plans:
+            return self._plans[event_type]
+
+        chains: Dict[str, List[Subscription]] = {}
+        dependencies: Dict[str, set] = {}
+
+        for subscription in self.subscribers[event_type]:
+            chains.setdefault(subscription.chain, []).append(subscription)
+            dependencies.setdefault(subscription.chain, set()).update(subscription.after)
+
+        resolved: Dict[str, Tuple[str, ...]] = {}
+        for chain, deps in dependencies.items():
+            unknown = deps - chains.keys()
+            if unknown:
+                logger.warning(
+                    f"⚠️  Ignoring unknown dependencies {sorted(unknown)} "
+                    f"for {chain} on event {event_type}"
+                )
+            resolved[chain] = tuple(d for d in deps if d in chains and d != chain)
+
+        if self._has_cycle(resolved):
+            logger.error(
+                f"❌ Dependency cycle between handlers of {event_type}; "
+                f"falling back to sequential dispatch"
+            )
+            plan = None
+        else:
+            plan = _DispatchPlan(chains=chains, dependencies=resolved)
+
+        self._plans[event_type] = plan
+        return plan
+
+    @staticmethod
+    def _has_cycle(dependencies: Dict[str, Tuple[str, ...]]) -> bool:
+        visiting, visited = set(), set()
+
+        def visit(node: str) -> bool:
+            if node in visited:
+                return False
+            if node in visiting:
+                return True
+            visiting.add(node)
+            if any(visit(dep) for dep in dependencies.get(node, ())):
+                return True
+            visiting.discard(node)
+            visited.add(node)
+            return False
+
+        return any(visit(node) for node in dependencies)
+
+    async def _dispatch_concurrent(
+        self,
+        plan: _DispatchPlan,
+        event_type: str,
+        payload: Dict[str, Any],
+    ) -> Dict[str, str]:
+        loop = asyncio.get_running_loop()
+        finished = {chain: loop.create_future() for chain in plan.chains}
+        failures: Dict[str, str] = {}
+
+        async def run_chain(chain: str) -> None:
+            try:
+                for dependency in plan.dependencies[chain]:
+                    await finished[dependency]
+                # Chains interleave, so each gets its own session
+                with unit_of_work.unit_of_work_scope(new=True):
+                    for subscription in plan.chains[chain]:
+                        logger.debug(f"Invoking handler: {subscription.handler.__name__} for {event_type}")
+                        error = await self._safe_invoke(subscription, event_type, payload)
+                        if error is not None:
+                            failures[subscription.key] = error
+            finally:
+                finished[chain].set_result(None)
+
+        await asyncio.gather(*(run_chain(chain) for chain in plan.chains))
+        return failures
+
+    # -------------------------------------------------------
+    # Invocation
+    # -------------------------------------------------------
 
-    async def _safe_invoke(self, handler: EventHandler, event_type: str, payload: Dict[str, Any]) -> None:
+    async def _safe_invoke(self, subscription: Subscription, event_type: str, payload: Dict[str, Any]) -> Optional[str]:
+        """Run one handler; returns its error (None on success)."""
+        handler = subscription.handler
+        timeout = subscription.timeout if subscription.timeout is not None else self.default_timeout
         try:
             logger.debug(f"Executing handler {handler.__name__}")
-            await handler(payload)
+            if subscription.blocking:
+                await self._invoke_blocking(handler, payload, timeout)
+            elif timeout:
+                await asyncio.wait_for(handler(payload), timeout=timeout)
+            else:
+                await handler(payload)
             logger.info(f"✓ Handler {handler.__name__} completed successfully")
+            return None
+        except asyncio.TimeoutError:
+            logger.error(f"⏱️  Event handler timed out after {timeout}s: {event_type} -> {handler.__name__}")
+            return f"timed out after {timeout}s"
         except Exception as e:
             logger.exception(f"❌ Event handler failed: {event_type} -> {handler.__name__}: {e}")
+            return f"{type(e).__name__}: {e}"
+
+    @staticmethod
+    async def _invoke_blocking(handler: EventHandler, payload: Dict[str, Any], timeout: Optional[float]) -> None:
+        """Run a blocking handler in a worker thread."""
+        call = asyncio.ensure_future(
+            asyncio.to_thread(_run_blocking_handler, handler, payload, asyncio.get_running_loop())
+        )
+        if not timeout:
+            await call
+            return
+
+        try:
+            await asyncio.wait_for(asyncio.shield(call), timeout=timeout)
+        except asyncio.TimeoutError:
+            # A thread cannot be interrupted: it keeps its session and the
+            # rest of the dispatch continues on a new one
+            uow = unit_of_work.current_unit_of_work()
+            if uow is not None:
+                uow.release()
+            call.add_done_callback(_log_overrun_result)
+            raise
+
+
+def _run_blocking_handler(handler: EventHandler, payload: Dict[str, Any], app_loop: asyncio.AbstractEventLoop) -> None:
+    """
+    Worker-thread body for blocking handlers. The handler coroutine runs on
+    the thread's own loop (its awaits are synchronous service calls).
+    """
+    loop = getattr(_worker_thread, "loop", None)
+    if loop is None:
+        loop = _worker_thread.loop = asyncio.new_event_loop()
+    _app_loop.set(app_loop)  # This thread runs in a copy of the dispatch's context
+    loop.run_until_complete(handler(payload))
+
+
+def _log_overrun_result(call: asyncio.Future) -> None:
+    if call.cancelled():
+        return
+    if call.exception() is not None:
+        logger.error(f"❌ Timed-out event handler failed after all: {call.exception()}")
+
+
+@dataclass
+class QueueMetrics:
+    """Per-event-type counters exposed for backpressure monitoring."""
+    enqueued: int = 0
+    processed: int = 0
+    blocked_puts: int = 0
+    blocked_seconds: float = 0.0
+    max_depth: int = 0
+
+
+class QueueEventBus(EventBus):
+    """
+    Queue-backed event bus.
+
+    publish() only enqueues; a pool of worker tasks per event type runs
+    the handlers, so the publisher no longer waits for them. Queues are
+    bounded: when one is full, publish() waits for room (backpressure)
+    and the wait is recorded in metrics().
+    """
+
+    def __init__(
+        self,
+        dispatch_mode: str = DISPATCH_SEQUENTIAL,
+        default_timeout: Optional[float] = None,
+        workers_per_type: int = 2,
+        queue_maxsize: int = 1000,
+    ) -> None:
+        super().__init__(dispatch_mode=dispatch_mode, default_timeout=default_timeout)
+        self.workers_per_type = workers_per_type
+        self.queue_maxsize = queue_maxsize
+
+        self._queues: Dict[str, asyncio.Queue] = {}
+        self._workers: Dict[str, List[asyncio.Task]] = {}
+        self._metrics: Dict[str, QueueMetrics] = defaultdict(QueueMetrics)
+        self._accepting = True
+
+    async def publish(self, event_type: str, payload: Dict[str, Any]) -> None:
+        if await self._forward_to_app_loop(event_type, payload):
+            return
+
+        if not self.subscribers.get(event_type):
+            logger.warning(f"⚠️  No handlers registered for event: {event_type}")
+            return
+
+        if not self._accepting:
+            # Shutting down: events raised by handlers still get delivered
+            await self.dispatch(event_type, payload)
+            return
+
+        queue = self._get_queue(event_type)
+        metrics = self._metrics[event_type]
+
+        if queue.full():
+            metrics.blocked_puts += 1
+            started = time.monotonic()
+            logger.warning(f"⚠️  Event queue for {event_type} is full ({queue.maxsize}); applying backpressure")
+            await queue.put(payload)
+            metrics.blocked_seconds += time.monotonic() - started
+        else:
+            queue.put_nowait(payload)
+
+        metrics.enqueued += 1
+        metrics.max_depth = max(metrics.max_depth, queue.qsize())
+        logger.debug(f"Queued {event_type} (depth={queue.qsize()})")
+
+    def _get_queue(self, event_type: str) -> asyncio.Queue:
+        queue = self._queues.get(event_type)
+        if queue is None:
+            queue = asyncio.Queue(maxsize=self.queue_maxsize)
+            self._queues[event_type] = queue
+            self._workers[event_type] = [
+                asyncio.create_task(self._worker(event_type, queue))
+                for _ in range(self.workers_per_type)
+            ]
+            logger.info(f"✓ Started {self.workers_per_type} workers for event {event_type}")
+        return queue
+
+    async def _worker(self, event_type: str, queue: asyncio.Queue) -> None:
+        # Started lazily, possibly from inside a handler: don't inherit its session
+        unit_of_work.detach()
+        while True:
+            payload = await queue.get()
+            try:
+                await self.dispatch(event_type, payload)
+            except Exception as e:
+                logger.exception(f"❌ Event worker failed: {event_type}: {e}")
+            finally:
+                self._metrics[event_type].processed += 1
+                queue.task_done()
+
+    async def drain(self, timeout: Optional[float] = None) -> None:
+        """Stop accepting new work, finish queued events, then stop the workers."""
+        self._accepting = False
+        logger.info(f"⏳ Draining {sum(q.qsize() for q in self._queues.values())} queued events")
+
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(*(queue.join() for queue in self._queues.values())),
+                timeout=timeout,
+            )
+        except asyncio.TimeoutError:
+            logger.error(f"❌ Event queues not drained within {timeout}s; dropping remaining events")
+
+        workers = [task for tasks in self._workers.values() for task in tasks]
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+        self._queues.clear()
+        self._workers.clear()
+        logger.info("✓ Event queues drained")
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            "backend": BACKEND_QUEUE,
+            "dispatch_mode": self.dispatch_mode,
+            "workers_per_type": self.workers_per_type,
+            "queue_maxsize": self.queue_maxsize,
+            "queues": {
+                event_type: {
+                    **asdict(self._metrics[event_type]),
+                    "depth": queue.qsize(),
+                }
+                for event_type, queue in self._queues.items()
+            },
+        }
+
+
+def _build_event_bus() -> EventBus:
+    if settings.EVENT_BACKEND == BACKEND_MEMORY:
+        return EventBus(
+            dispatch_mode=settings.EVENT_DISPATCH_MODE,
+            default_timeout=settings.EVENT_HANDLER_TIMEOUT_SECONDS,
+        )
+    if settings.EVENT_BACKEND == BACKEND_QUEUE:
+        return QueueEventBus(
+            dispatch_mode=settings.EVENT_DISPATCH_MODE,
+            default_timeout=settings.EVENT_HANDLER_TIMEOUT_SECONDS,
+            workers_per_type=settings.EVENT_WORKERS_PER_TYPE,
+            queue_maxsize=settings.EVENT_QUEUE_MAXSIZE,
+        )
+    raise ValueError(f"Unknown EVENT_BACKEND: {settings.EVENT_BACKEND}")
 
 
-event_bus = EventBus()
\ No newline at end of file
+event_bus = _build_event_bus()
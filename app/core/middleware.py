@@ -1,129 +1,116 @@
 """
 Request logging middleware for Cinema Booking System.
 Tracks all HTTP requests with timing, request IDs, and comprehensive logging.
+
+Written as a plain ASGI middleware: BaseHTTPMiddleware wraps every
+request in an extra task and re-streams the response body, which costs
+more than the logging itself at high request rates.
 """
 
 import time
+import random
 import logging
-from typing import Callable
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
 
-from app.core.logging_config import set_request_id, get_request_id
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.logging_config import set_request_id
 
 logger = logging.getLogger(__name__)
 
 
-class RequestLoggingMiddleware(BaseHTTPMiddleware):
+class RequestLoggingMiddleware:
     """
-    Middleware that logs all HTTP requests with:
-    - Unique request ID for tracing
+    Middleware that logs each HTTP request once, when it completes, with:
+    - Unique request ID for tracing (also returned as X-Request-ID)
     - Request timing (duration)
     - Request method, path, client info
     - Response status code
     - Exception details on failures
+
+    Requests slower than `slow_threshold_seconds` are always logged as
+    warnings (this replaces PerformanceLoggingMiddleware). Other requests
+    are logged for a `sample_rate` fraction of traffic (1.0 = all).
     """
-    
-    def __init__(self, app: ASGIApp):
-        super().__init__(app)
-    
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        slow_threshold_seconds: float = 1.0,
+        sample_rate: float = 1.0,
+    ):
+        self.app = app
+        self.slow_threshold = slow_threshold_seconds
+        self.sample_rate = sample_rate
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         # Generate unique request ID
         request_id = set_request_id()
-        
-        # Start timing
-        start_time = time.time()
-        
-        # Extract request info
-        method = request.method
-        path = request.url.path
-        client_host = request.client.host if request.client else "unknown"
-        
-        # Log incoming request
-        logger.info(
-            f"→ {method} {path}",
-            extra={
-                'request_id': request_id,
-                'method': method,
-                'path': path,
-                'client': client_host,
-                'query_params': dict(request.query_params),
-            }
-        )
-        
-        # Process request
+        request_id_header = (b"x-request-id", request_id.encode("latin-1"))
+        status_code = 500
+
+        async def send_with_request_id(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                # Add request ID to response headers (useful for debugging)
+                message["headers"] = [*message.get("headers", ()), request_id_header]
+            await send(message)
+
+        start_time = time.perf_counter()
         try:
-            response = await call_next(request)
-            
-            # Calculate duration
-            duration = time.time() - start_time
-            
-            # Log successful response
-            logger.info(
-                f"← {method} {path} → {response.status_code} ({duration:.3f}s)",
-                extra={
-                    'request_id': request_id,
-                    'method': method,
-                    'path': path,
-                    'status_code': response.status_code,
-                    'duration': duration,
-                }
-            )
-            
-            # Add request ID to response headers (useful for debugging)
-            response.headers['X-Request-ID'] = request_id
-            
-            return response
-            
+            await self.app(scope, receive, send_with_request_id)
         except Exception as e:
-            duration = time.time() - start_time
-            
+            duration = time.perf_counter() - start_time
+
             # Log failed request with full exception details
             logger.error(
-                f"✗ {method} {path} → FAILED ({duration:.3f}s)",
+                f"✗ {scope['method']} {scope['path']} → FAILED ({duration:.3f}s)",
                 extra={
-                    'request_id': request_id,
-                    'method': method,
-                    'path': path,
-                    'duration': duration,
+                    **self._request_fields(scope, request_id, duration),
                     'error': str(e),
                     'error_type': type(e).__name__,
                 },
                 exc_info=True  # This adds the full stack trace
             )
-            
+
             # Re-raise the exception so FastAPI can handle it
             raise
 
+        duration = time.perf_counter() - start_time
 
-class PerformanceLoggingMiddleware(BaseHTTPMiddleware):
-    """
-    Optional: Logs slow requests (>1 second).
-    Only enable this if you want to track performance issues.
-    """
-    
-    def __init__(self, app: ASGIApp, threshold_seconds: float = 1.0):
-        super().__init__(app)
-        self.threshold = threshold_seconds
-    
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        start_time = time.time()
-        response = await call_next(request)
-        duration = time.time() - start_time
-        
-        # Only log if request took longer than threshold
-        if duration > self.threshold:
-            request_id = get_request_id()
+        if duration > self.slow_threshold:
             logger.warning(
-                f"SLOW REQUEST: {request.method} {request.url.path} ({duration:.3f}s)",
+                f"SLOW REQUEST: {scope['method']} {scope['path']} → {status_code} ({duration:.3f}s)",
                 extra={
-                    'request_id': request_id,
-                    'method': request.method,
-                    'path': request.url.path,
-                    'duration': duration,
-                    'threshold': self.threshold,
+                    **self._request_fields(scope, request_id, duration),
+                    'status_code': status_code,
+                    'threshold': self.slow_threshold,
                 }
             )
-        
-        return response
\ No newline at end of file
+        elif logger.isEnabledFor(logging.INFO) and (
+            self.sample_rate >= 1.0 or random.random() < self.sample_rate
+        ):
+            logger.info(
+                f"{scope['method']} {scope['path']} → {status_code} ({duration:.3f}s)",
+                extra={
+                    **self._request_fields(scope, request_id, duration),
+                    'status_code': status_code,
+                }
+            )
+
+    @staticmethod
+    def _request_fields(scope: Scope, request_id: str, duration: float) -> dict:
+        """Log fields, only built for requests that are actually logged."""
+        client = scope.get("client")
+        return {
+            'request_id': request_id,
+            'method': scope["method"],
+            'path': scope["path"],
+            'client': client[0] if client else "unknown",
+            'query_string': scope.get("query_string", b"").decode("latin-1"),
+            'duration': duration,
+        }
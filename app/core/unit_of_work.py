@@ -0,0 +1,141 @@
+# app/core/unit_of_work.py
+
+"""
+Session shared by the handlers of one event dispatch.
+
+Handlers used to open their own SessionLocal(), so one event checked out
+a pooled connection per handler and re-read the same rows. The event bus
+now opens a unit of work around each dispatch (per chain in concurrent
+mode, where handlers interleave), and handlers get its session through
+event_session(). Events published inline from a handler join the
+current unit of work, so a whole event chain shares one identity map.
+
+The session is created on first use, with expire_on_commit=False so rows
+loaded by one handler stay usable by the next after a commit. When a
+handler's block ends, its work is settled the way db.close() used to:
+anything left uncommitted is rolled back (so a failing handler cannot
+leak state into the next one), otherwise the read transaction is ended.
+"""
+
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.database import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+
+class EventUnitOfWork:
+    """Lazily opened session for one dispatch."""
+
+    def __init__(self):
+        self._session: Optional[Session] = None
+        self._flushed = False  # Flushed but not yet committed
+        self.closed = False
+
+    @property
+    def session(self) -> Session:
+        if self._session is None:
+            self._session = SessionLocal(expire_on_commit=False)
+            event.listen(self._session, "after_flush", self._on_flush)
+            event.listen(self._session, "after_commit", self._on_end)
+            event.listen(self._session, "after_rollback", self._on_end)
+        return self._session
+
+    def _on_flush(self, session, flush_context) -> None:
+        if session is self._session:
+            self._flushed = True
+
+    def _on_end(self, session) -> None:
+        if session is self._session:
+            self._flushed = False
+
+    def release(self) -> None:
+        """
+        Leave the current session to a handler still running past its
+        timeout (it closes it when done); the next handler gets a new one.
+        """
+        self._session = None
+        self._flushed = False
+
+    def settle(self, db: Session) -> None:
+        """End the current handler's transaction (called when it releases the session)."""
+        if db is not self._session:
+            db.close()  # Released while its handler overran; nobody else uses it
+            return
+        if not db.in_transaction():
+            return
+        try:
+            if self._flushed or db.new or db.dirty or db.deleted or not db.is_active:
+                db.rollback()
+            else:
+                db.commit()  # Read-only: releases the connection, keeps loaded rows
+        except Exception:
+            logger.exception("❌ Failed to settle event session")
+            db.rollback()
+
+    def close(self) -> None:
+        self.closed = True
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+
+_current: ContextVar[Optional[EventUnitOfWork]] = ContextVar("event_unit_of_work", default=None)
+
+
+def current_unit_of_work() -> Optional[EventUnitOfWork]:
+    uow = _current.get()
+    return uow if uow is not None and not uow.closed else None
+
+
+@contextmanager
+def unit_of_work_scope(new: bool = False) -> Iterator[EventUnitOfWork]:
+    """
+    Open a unit of work for a dispatch. Joins the active one (an event
+    published from inside a handler) unless `new` is set.
+    """
+    uow = None if new else current_unit_of_work()
+    if uow is not None:
+        yield uow
+        return
+
+    uow = EventUnitOfWork()
+    token = _current.set(uow)
+    try:
+        yield uow
+    finally:
+        _current.reset(token)
+        uow.close()
+
+
+def detach() -> None:
+    """Forget the inherited unit of work (for long-lived tasks such as queue workers)."""
+    _current.set(None)
+
+
+@contextmanager
+def event_session() -> Iterator[Session]:
+    """
+    Session for an event handler: the dispatch's shared session, or a
+    private one when called outside a dispatch.
+    """
+    uow = current_unit_of_work()
+    if uow is None:
+        db = SessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+        return
+
+    db = uow.session
+    try:
+        yield db
+    finally:
+        uow.settle(db)
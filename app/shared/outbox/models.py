@@ -0,0 +1,98 @@
+# app/shared/outbox/models.py
+
+from enum import Enum as PyEnum
+from datetime import datetime, timezone
+
+from sqlalchemy import (
+    Column,
+    Integer,
+    String,
+    DateTime,
+    JSON,
+    Index,
+    PrimaryKeyConstraint,
+    Enum as SAEnum,
+)
+
+from app.core.base import Base
+
+
+class OutboxStatus(str, PyEnum):
+    PENDING = "pending"
+    DISPATCHED = "dispatched"
+    FAILED = "failed"
+
+
+class OutboxEvent(Base):
+    """
+    A domain event written in the same transaction as the aggregate change.
+    The relay delivers it to the EventBus after the transaction commits.
+    """
+    __tablename__ = "outbox_events"
+
+    __table_args__ = (
+        Index("idx_outbox_status_available", "status", "available_at", "id"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+
+    event_type = Column(String, nullable=False)
+
+    payload = Column(JSON, nullable=False)
+
+    # Delivered to handlers as payload["event_id"] so consumers can dedupe
+    idempotency_key = Column(String(128), unique=True, nullable=False)
+
+    status = Column(
+        SAEnum(OutboxStatus, name="outbox_status"),
+        nullable=False,
+        default=OutboxStatus.PENDING,
+    )
+
+    attempts = Column(Integer, nullable=False, default=0)
+
+    # Handler keys still to deliver to after a partial failure (NULL: all)
+    pending_handlers = Column(JSON, nullable=True)
+
+    last_error = Column(String, nullable=True)
+
+    created_at = Column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(timezone.utc)
+    )
+
+    available_at = Column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(timezone.utc)
+    )
+
+    dispatched_at = Column(DateTime(timezone=True), nullable=True)
+
+
+class ProcessedEvent(Base):
+    """
+    Inbox of event deliveries a consumer has already acted on.
+
+    Outbox delivery is at-least-once, so consumers whose effects are not
+    idempotent (audit rows, emails) record each event here in the same
+    transaction as their effect, and skip events already recorded.
+    """
+    __tablename__ = "processed_events"
+
+    __table_args__ = (
+        PrimaryKeyConstraint("consumer", "event_key"),
+        Index("idx_processed_events_processed_at", "processed_at"),
+    )
+
+    consumer = Column(String(64), nullable=False)
+
+    # The event's event_id, plus a suffix when one event has several effects
+    event_key = Column(String(192), nullable=False)
+
+    processed_at = Column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(timezone.utc)
+    )
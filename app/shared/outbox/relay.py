@@ -0,0 +1,296 @@
+# app/shared/outbox/relay.py
+
+"""
+Outbox relay.
+
+Claims committed outbox rows in batches and delivers them to the
+EventBus. Claiming only leases the rows: they are pushed OUTBOX_LEASE_SECONDS
+into the future and the claim commits at once, so no row lock is held
+while handlers run and other relays skip leased rows.
+
+Claimed events are dispatched concurrently, at most
+OUTBOX_DISPATCH_CONCURRENCY at a time. Events about the same aggregate
+(same reservation, order or showtime, see ORDERING_KEYS) keep their
+outbox order. A slow handler therefore only delays its own aggregate, and
+the relay keeps claiming while up to OUTBOX_BATCH_SIZE events are in flight.
+
+The relay sees which handlers failed: the event stays pending and only
+those handlers get it again, with backoff, up to OUTBOX_MAX_ATTEMPTS.
+
+Delivery is at-least-once: a crash before an event's outcome is recorded,
+a lease that runs out, or a handler that timed out but finished anyway
+re-delivers it. Every payload carries its idempotency key as "event_id";
+consumers whose effects are not idempotent record it in processed_events.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Any, Dict, List, Optional, Set
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.event_bus import event_bus
+from app.core.utils import utcnow
+
+from .models import OutboxEvent, OutboxStatus
+from .repository import OutboxRepository, ProcessedEventRepository
+
+logger = logging.getLogger(__name__)
+
+# Payload fields naming the aggregate an event is about, most specific first
+ORDERING_KEYS = ("reservation_id", "order_id", "showtime_id")
+
+
+@dataclass(frozen=True)
+class ClaimedEvent:
+    """Plain copy of a leased outbox row (no session attached)."""
+    id: int
+    event_type: str
+    payload: Dict[str, Any]
+    idempotency_key: str
+    pending_handlers: Optional[List[str]]
+
+    @property
+    def lane(self) -> Optional[str]:
+        for key in ORDERING_KEYS:
+            value = self.payload.get(key)
+            if value is not None:
+                return f"{key}:{value}"
+        return None
+
+
+class OutboxRelay:
+    """Background task that moves outbox rows onto the event bus."""
+
+    def __init__(
+        self,
+        batch_size: int = 100,
+        poll_interval: float = 1.0,
+        max_attempts: int = 5,
+        dedupe_retention_hours: int = 72,
+        concurrency: int = 20,
+        lease_seconds: float = 300.0,
+    ):
+        self.repo = OutboxRepository()
+        self.processed_repo = ProcessedEventRepository()
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self.dedupe_retention_hours = dedupe_retention_hours
+        self.concurrency = concurrency
+        self.lease_seconds = lease_seconds
+
+        self._next_prune = 0.0
+
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._in_flight: Set[asyncio.Task] = set()
+        # Last delivery started per ordering lane
+        self._lanes: Dict[str, asyncio.Task] = {}
+        self._window_full = False
+
+        self._task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._running = False
+
+    def _claim(self, limit: int) -> List[ClaimedEvent]:
+        """Worker thread: lease the next batch and commit, releasing the row locks."""
+        db = SessionLocal()
+        try:
+            now = utcnow()
+            batch = self.repo.claim_batch(db, now, limit)
+            claimed = []
+            for entry in batch:
+                entry.available_at = now + timedelta(seconds=self.lease_seconds)
+                claimed.append(ClaimedEvent(
+                    id=entry.id,
+                    event_type=entry.event_type,
+                    payload=dict(entry.payload),
+                    idempotency_key=entry.idempotency_key,
+                    pending_handlers=entry.pending_handlers,
+                ))
+            db.commit()
+            return claimed
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    def _record(self, claimed: ClaimedEvent, failures: Dict[str, str]) -> None:
+        """Worker thread: store the outcome of one delivery."""
+        db = SessionLocal()
+        try:
+            entry = db.get(OutboxEvent, claimed.id)
+            if entry is None or entry.status != OutboxStatus.PENDING:
+                return
+
+            if not failures:
+                entry.status = OutboxStatus.DISPATCHED
+                entry.dispatched_at = utcnow()
+                entry.pending_handlers = None
+            else:
+                # Only the handlers that failed get the event again
+                entry.pending_handlers = sorted(failures)
+                entry.attempts += 1
+                entry.last_error = "; ".join(f"{key}: {error}" for key, error in failures.items())[:500]
+                if entry.attempts >= self.max_attempts:
+                    entry.status = OutboxStatus.FAILED
+                    logger.error(f"❌ Outbox event {entry.id} ({entry.event_type}) failed permanently: {entry.last_error}")
+                else:
+                    # Exponential backoff before the next attempt
+                    entry.available_at = utcnow() + timedelta(seconds=2 ** entry.attempts)
+                    logger.warning(f"⚠️  Outbox event {entry.id} ({entry.event_type}) will be retried: {entry.last_error}")
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    async def _deliver(self, claimed: ClaimedEvent, previous: Optional[asyncio.Task]) -> None:
+        if previous is not None:
+            await asyncio.wait({previous})  # Same aggregate: keep outbox order
+
+        async with self._slots:
+            failures = await event_bus.dispatch(
+                claimed.event_type,
+                {**claimed.payload, "event_id": claimed.idempotency_key},
+                handlers=claimed.pending_handlers,
+            )
+        try:
+            await asyncio.to_thread(self._record, claimed, failures)
+        except Exception as e:
+            # The lease runs out and the event is delivered again
+            logger.exception(f"❌ Recording outbox event {claimed.id} failed: {e}")
+
+    def _delivered(self, task: asyncio.Task, lane: Optional[str]) -> None:
+        self._in_flight.discard(task)
+        if lane is not None and self._lanes.get(lane) is task:
+            del self._lanes[lane]
+        # The window was full: claim more once half of it is free
+        if self._window_full and len(self._in_flight) <= self.batch_size // 2:
+            self._window_full = False
+            if self._wakeup is not None:
+                self._wakeup.set()
+
+    async def run_once(self) -> int:
+        """
+        Claim what fits in the in-flight window and start delivering it.
+        Returns the number of events claimed; deliveries finish in the
+        background (see wait_idle()).
+        """
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.concurrency)
+
+        room = self.batch_size - len(self._in_flight)
+        if room <= 0:
+            self._window_full = True
+            return 0
+
+        batch = await asyncio.to_thread(self._claim, room)
+        self._window_full = len(batch) >= room
+        for claimed in batch:
+            lane = claimed.lane
+            task = asyncio.create_task(self._deliver(claimed, self._lanes.get(lane) if lane else None))
+            self._in_flight.add(task)
+            if lane is not None:
+                self._lanes[lane] = task
+            task.add_done_callback(lambda done, lane=lane: self._delivered(done, lane))
+        return len(batch)
+
+    async def wait_idle(self) -> None:
+        """Wait until every claimed event has been delivered and recorded."""
+        while self._in_flight:
+            await asyncio.wait(set(self._in_flight))
+
+    def prune_processed(self) -> int:
+        """Forget consumer deliveries older than OUTBOX_DEDUPE_RETENTION_HOURS."""
+        db = SessionLocal()
+        try:
+            cutoff = utcnow() - timedelta(hours=self.dedupe_retention_hours)
+            deleted = self.processed_repo.delete_before(db, cutoff)
+            db.commit()
+            return deleted
+        finally:
+            db.close()
+
+    async def run_forever(self) -> None:
+        """Drain continuously; sleep until notified or the poll interval elapses."""
+        while self._running:
+            self._wakeup.clear()
+            try:
+                await self.run_once()
+            except Exception as e:
+                logger.exception(f"❌ Outbox relay batch failed: {e}")
+
+            if time.monotonic() >= self._next_prune:
+                self._next_prune = time.monotonic() + 3600
+                try:
+                    await asyncio.to_thread(self.prune_processed)
+                except Exception as e:
+                    logger.exception(f"❌ Pruning processed events failed: {e}")
+
+            # Claimed less than there was room for: caught up. Otherwise the
+            # window is full and a finished delivery wakes us.
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+
+    def start(self) -> None:
+        if self._task is not None:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        self._running = True
+        self._task = asyncio.create_task(self.run_forever())
+        logger.info("📤 Outbox relay started")
+
+    async def stop(self) -> None:
+        """Stop polling and deliver whatever is already committed."""
+        if self._task is None:
+            return
+        self._running = False
+        self._wakeup.set()
+        await self._task
+        self._task = None
+
+        # Finish what is in flight, then deliver whatever is already committed
+        await self.wait_idle()
+        while await self.run_once():
+            await self.wait_idle()
+        self._loop = None
+        logger.info("📤 Outbox relay stopped")
+
+    def notify(self) -> None:
+        """Wake the relay early (safe to call from any thread)."""
+        if self._loop is None or self._wakeup is None:
+            return
+        try:
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+        except RuntimeError:
+            pass  # Loop already closed
+
+
+outbox_relay = OutboxRelay(
+    batch_size=settings.OUTBOX_BATCH_SIZE,
+    poll_interval=settings.OUTBOX_POLL_INTERVAL_SECONDS,
+    max_attempts=settings.OUTBOX_MAX_ATTEMPTS,
+    dedupe_retention_hours=settings.OUTBOX_DEDUPE_RETENTION_HOURS,
+    concurrency=settings.OUTBOX_DISPATCH_CONCURRENCY,
+    lease_seconds=settings.OUTBOX_LEASE_SECONDS,
+)
+
+
+@event.listens_for(Session, "after_commit")
+def _wake_relay_after_commit(session: Session) -> None:
+    """Deliver freshly staged events without waiting for the next poll."""
+    if session.info.pop("outbox_staged", False):
+        outbox_relay.notify()
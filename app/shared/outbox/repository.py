@@ -0,0 +1,82 @@
+# app/shared/outbox/repository.py
+from datetime import datetime
+from typing import Iterable, List, Set
+
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from sqlalchemy import delete, select, func
+
+from .models import OutboxEvent, OutboxStatus, ProcessedEvent
+
+
+class OutboxRepository:
+    """Repository for outbox events."""
+
+    def add(self, db: Session, entry: OutboxEvent) -> OutboxEvent:
+        """Stage an event in the current transaction (does NOT commit)."""
+        db.add(entry)
+        return entry
+
+    def claim_batch(self, db: Session, now: datetime, limit: int) -> List[OutboxEvent]:
+        """
+        Lock the next batch of deliverable events.
+        SKIP LOCKED lets several relays drain the table without blocking each other.
+        """
+        stmt = (
+            select(OutboxEvent)
+            .where(
+                OutboxEvent.status == OutboxStatus.PENDING,
+                OutboxEvent.available_at <= now,
+            )
+            .order_by(OutboxEvent.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        return db.scalars(stmt).all()
+
+    def count_pending(self, db: Session) -> int:
+        """Number of events waiting for delivery."""
+        return db.scalar(
+            select(func.count())
+            .select_from(OutboxEvent)
+            .where(OutboxEvent.status == OutboxStatus.PENDING)
+        )
+
+
+def _claim_stmt(consumer: str, event_keys: Iterable[str]):
+    return (
+        insert(ProcessedEvent)
+        .values([{"consumer": consumer, "event_key": key} for key in event_keys])
+        .on_conflict_do_nothing()
+        .returning(ProcessedEvent.event_key)
+    )
+
+
+class ProcessedEventRepository:
+    """Repository for the consumer inbox (processed_events)."""
+
+    def claim(self, db: Session, consumer: str, event_keys: Iterable[str]) -> Set[str]:
+        """
+        Record deliveries in the current transaction (does NOT commit).
+        Returns the keys not seen before; the caller acts on those only.
+        """
+        event_keys = list(dict.fromkeys(event_keys))
+        if not event_keys:
+            return set()
+        return set(db.scalars(_claim_stmt(consumer, event_keys)).all())
+
+    def delete_before(self, db: Session, cutoff: datetime) -> int:
+        """Forget deliveries older than the redelivery window (does NOT commit)."""
+        result = db.execute(delete(ProcessedEvent).where(ProcessedEvent.processed_at < cutoff))
+        return result.rowcount
+
+
+class AsyncProcessedEventRepository:
+    """Async variant of ProcessedEventRepository."""
+
+    async def claim(self, db: AsyncSession, consumer: str, event_keys: Iterable[str]) -> Set[str]:
+        event_keys = list(dict.fromkeys(event_keys))
+        if not event_keys:
+            return set()
+        return set((await db.scalars(_claim_stmt(consumer, event_keys))).all())
@@ -2,24 +2,60 @@
 
 import asyncio
 import logging
-from typing import Any, Dict
+from typing import Any, Dict, Optional
+
+from sqlalchemy.orm import Session
 
 from app.core.event_bus import event_bus
+from app.core.utils import generate_uuid_str
+from app.shared.outbox.models import OutboxEvent
+from app.shared.outbox.repository import OutboxRepository
+from app.shared.services.event_schemas import validate_payload
 
 logger = logging.getLogger(__name__)
 
+outbox_repo = OutboxRepository()
+
 
 def publish_event(event_type: str, payload: Dict[str, Any]) -> None:
     """
     Synchronous domain event publisher for use in sync code.
     """
+    payload = validate_payload(event_type, payload)
     logger.info(f"📢 Publishing event: {event_type} with payload: {payload}")
-    asyncio.run(event_bus.publish(event_type, payload))
+    # Runs on a throwaway loop, so always dispatch inline (never via queues)
+    asyncio.run(event_bus.dispatch(event_type, payload))
 
 
 async def publish_event_async(event_type: str, payload: Dict[str, Any]) -> None:
     """
     Async domain event publisher for use in async handlers.
     """
+    payload = validate_payload(event_type, payload)
     logger.info(f"📢 Publishing event: {event_type} with payload: {payload}")
-    await event_bus.publish(event_type, payload)
\ No newline at end of file
+    await event_bus.publish(event_type, payload)
+
+
+def stage_event(
+    db: Session,
+    event_type: str,
+    payload: Dict[str, Any],
+    idempotency_key: Optional[str] = None,
+) -> OutboxEvent:
+    """
+    Transactional domain event publisher.
+
+    Writes the event to the outbox in the caller's transaction; it is only
+    delivered (by the outbox relay) once the caller commits. Pass a
+    deterministic idempotency_key to make retries of the same command safe.
+    """
+    payload = validate_payload(event_type, payload)
+    logger.info(f"📥 Staging event: {event_type} with payload: {payload}")
+    entry = OutboxEvent(
+        event_type=event_type,
+        payload=payload,
+        idempotency_key=idempotency_key or generate_uuid_str(),
+    )
+    outbox_repo.add(db, entry)
+    db.info["outbox_staged"] = True
+    return entry
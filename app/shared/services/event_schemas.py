@@ -0,0 +1,141 @@
+# app/shared/services/event_schemas.py
+
+"""
+Versioned payload schemas for reservation.*, order.* and payment.* events.
+
+Payloads are validated once, when they are published or staged, and
+stamped with their schema_version. Version 2 payloads are denormalized:
+they carry the showtime / seat / user fields consumers need, so handlers
+do not have to look the reservation or order up again.
+
+Event types without a schema are passed through unchanged.
+"""
+
+from typing import ClassVar, Dict, List, Optional, Type
+
+from pydantic import BaseModel
+
+from app.core.errors import ValidationError
+
+
+class EventPayload(BaseModel):
+    VERSION: ClassVar[int] = 1
+
+    # Set by validate_payload; accepted so already-stamped payloads re-validate
+    schema_version: Optional[int] = None
+
+    model_config = {"extra": "forbid"}
+
+
+# ----- reservation.* -----
+
+class ReservationCreatedPayload(EventPayload):
+    reservation_id: int
+    user_id: int
+    showtime_id: int
+    seat_code: str
+    expires_at: Optional[str] = None
+    order_id: int
+
+
+class ReservationBatchItem(BaseModel):
+    reservation_id: int
+    seat_code: str
+    order_id: int
+
+
+class ReservationBatchCreatedPayload(EventPayload):
+    user_id: int
+    showtime_id: int
+    reservations: List[ReservationBatchItem]
+    expires_at: Optional[str] = None
+
+
+class ReservationEndedPayload(EventPayload):
+    """reservation.cancelled / reservation.expired"""
+    VERSION: ClassVar[int] = 2
+
+    reservation_id: int
+    user_id: int
+    showtime_id: int
+    seat_code: str
+
+
+# ----- order.* -----
+
+class OrderCreatedPayload(EventPayload):
+    order_id: int
+    reservation_id: int
+    user_id: int
+    showtime_id: int
+    seat_code: str
+    final_amount: float
+
+
+class OrderStatusPayload(EventPayload):
+    """order.completed / order.cancelled / order.expired"""
+    VERSION: ClassVar[int] = 2
+
+    order_id: int
+    reservation_id: int
+    user_id: int
+    showtime_id: int
+    seat_code: str
+    final_amount: Optional[float] = None
+
+
+# ----- payment.* -----
+
+class PaymentPendingPayload(EventPayload):
+    payment_attempt_id: int
+    order_id: int
+    amount_attempted: float
+    final_amount: float
+    user_id: int
+
+
+class PaymentSucceededPayload(EventPayload):
+    payment_attempt_id: int
+    order_id: int
+    final_amount: float
+    user_id: int
+
+
+class PaymentFailedPayload(EventPayload):
+    payment_attempt_id: int
+    order_id: int
+    failure_reason: str
+    user_id: int
+
+
+EVENT_SCHEMAS: Dict[str, Type[EventPayload]] = {
+    "reservation.created": ReservationCreatedPayload,
+    "reservation.batch_created": ReservationBatchCreatedPayload,
+    "reservation.cancelled": ReservationEndedPayload,
+    "reservation.expired": ReservationEndedPayload,
+    "order.created": OrderCreatedPayload,
+    "order.completed": OrderStatusPayload,
+    "order.cancelled": OrderStatusPayload,
+    "order.expired": OrderStatusPayload,
+    "payment.pending": PaymentPendingPayload,
+    "payment.succeeded": PaymentSucceededPayload,
+    "payment.failed": PaymentFailedPayload,
+}
+
+
+def validate_payload(event_type: str, payload: Dict) -> Dict:
+    """Validate a payload against its schema and stamp schema_version."""
+    schema = EVENT_SCHEMAS.get(event_type)
+    if schema is None:
+        return payload
+
+    try:
+        data = schema.model_validate(payload).model_dump(mode="json")
+    except Exception as e:
+        raise ValidationError(
+            f"Invalid payload for event {event_type}",
+            {"event_type": event_type, "errors": str(e)},
+        )
+
+    data["schema_version"] = schema.VERSION
+    return data
@@ -0,0 +1,173 @@
+# app/shared/services/expiration_scheduler.py
+
+"""
+Deadline-driven expiration scheduler.
+
+Keeps upcoming expiry deadlines in a min-heap and sleeps until the
+earliest one, instead of scanning the table on a fixed interval. Only the
+next `lookahead` deadlines are loaded (straight off the expiry index);
+the rest are picked up by later loads. New deadlines can be pushed with
+schedule() as they are created.
+
+The actual expiry is delegated to `expire_batch`, which must expire at
+most `limit` due rows in one statement and one commit, and return how
+many it handled. Both callbacks are synchronous and run in a worker
+thread, so the event loop never waits on the database. Due deadlines
+leave the heap only once their batch succeeded; after a failure the
+scheduler retries after `retry_interval`. Several processes can run a
+scheduler for the same table as long as expire_batch claims rows with
+SKIP LOCKED.
+"""
+
+import asyncio
+import heapq
+import logging
+import time
+from datetime import datetime
+from typing import Callable, List, Optional
+
+from sqlalchemy.orm import Session
+
+from app.core.database import SessionLocal
+from app.core.utils import utcnow
+
+logger = logging.getLogger(__name__)
+
+UpcomingLoader = Callable[[Session, int], List[datetime]]
+BatchExpirer = Callable[[Session, datetime, int], int]
+
+
+class ExpirationScheduler:
+    """Background task that expires rows exactly when they become due."""
+
+    def __init__(
+        self,
+        name: str,
+        load_upcoming: UpcomingLoader,
+        expire_batch: BatchExpirer,
+        batch_size: int = 500,
+        lookahead: int = 1000,
+        reload_interval: float = 60.0,
+        retry_interval: float = 5.0,
+    ):
+        self.name = name
+        self.load_upcoming = load_upcoming
+        self.expire_batch = expire_batch
+        self.batch_size = batch_size
+        self.lookahead = lookahead
+        self.reload_interval = reload_interval
+        self.retry_interval = retry_interval
+
+        self._heap: List[float] = []
+        # Latest deadline loaded when the lookahead was full; None = all loaded
+        self._horizon: Optional[float] = None
+        self._loaded_at: Optional[float] = None
+
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._running = False
+
+    def schedule(self, deadline: datetime) -> None:
+        """Register a new deadline (e.g. from a seat.locked event)."""
+        ts = deadline.timestamp()
+        if self._horizon is not None and ts > self._horizon:
+            return  # Beyond what is loaded; a later load will find it
+
+        earliest = self._heap[0] if self._heap else None
+        heapq.heappush(self._heap, ts)
+        if self._wakeup is not None and (earliest is None or ts < earliest):
+            self._wakeup.set()
+
+    def _fetch_upcoming(self) -> List[datetime]:
+        """Worker thread: read the next `lookahead` deadlines."""
+        db = SessionLocal()
+        try:
+            return self.load_upcoming(db, self.lookahead)
+        finally:
+            db.close()
+
+    def _expire_one_batch(self) -> int:
+        """Worker thread: expire one batch of due rows."""
+        db = SessionLocal()
+        try:
+            return self.expire_batch(db, utcnow(), self.batch_size)
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    async def _load(self) -> None:
+        """Reload the next `lookahead` deadlines from the database."""
+        deadlines = await asyncio.to_thread(self._fetch_upcoming)
+
+        # The heap is only touched on the loop (schedule() runs there too)
+        self._heap = [deadline.timestamp() for deadline in deadlines]
+        heapq.heapify(self._heap)
+        # load_upcoming returns deadlines in ascending order
+        self._horizon = deadlines[-1].timestamp() if len(deadlines) >= self.lookahead else None
+        self._loaded_at = time.monotonic()
+
+    async def _expire_due(self) -> int:
+        """Expire everything that is due, one batch (and commit) at a time."""
+        total = 0
+        while True:
+            handled = await asyncio.to_thread(self._expire_one_batch)
+            total += handled
+            if handled < self.batch_size:
+                break
+
+        if total:
+            logger.info(f"⏰ Expired {total} {self.name}")
+        return total
+
+    async def run_forever(self) -> None:
+        while self._running:
+            failed = False
+            try:
+                if self._loaded_at is None:
+                    await self._load()
+                elif not self._heap and self._horizon is not None:
+                    await self._load()  # Worked through a partial load: fetch more
+                elif time.monotonic() - self._loaded_at > self.reload_interval:
+                    await self._load()  # Pick up deadlines created by other processes
+
+                now = time.time()
+                if self._heap and self._heap[0] <= now:
+                    await self._expire_due()
+                    # Only now are those deadlines handled; if it raised they stay due
+                    while self._heap and self._heap[0] <= now:
+                        heapq.heappop(self._heap)
+                    continue
+            except Exception as e:
+                failed = True
+                logger.exception(f"❌ {self.name} expiration failed: {e}")
+
+            timeout = self.reload_interval
+            if failed:
+                timeout = self.retry_interval
+            elif self._heap:
+                timeout = min(timeout, max(self._heap[0] - time.time(), 0.0))
+
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    def start(self) -> None:
+        if self._task is not None:
+            return
+        self._wakeup = asyncio.Event()
+        self._running = True
+        self._task = asyncio.create_task(self.run_forever())
+        logger.info(f"⏰ {self.name} expiration scheduler started")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._running = False
+        self._wakeup.set()
+        await self._task
+        self._task = None
+        logger.info(f"⏰ {self.name} expiration scheduler stopped")
@@ -2,7 +2,10 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 import logging
 
+from app.core.broadcast import broadcast
 from app.core.config import settings
+from app.core.database import async_engine
+from app.core.event_bus import event_bus
 from app.core.logging_config import setup_logging
 from app.core.middleware import RequestLoggingMiddleware
 
@@ -22,6 +25,7 @@ from app.contexts.admin.router import router as admin_router
 # Only import handlers that actually register events
 from app.contexts.auth import handlers as auth_handlers
 from app.contexts.user import handlers as user_handlers
+from app.contexts.screen import handlers as screen_handlers
 from app.contexts.showtime import handlers as showtime_handlers
 from app.contexts.seat_availability import handlers as seat_availability_handlers
 from app.contexts.reservation import handlers as reservation_handlers
@@ -32,6 +36,19 @@ from app.contexts.refund import handlers as refund_handlers
 from app.contexts.notification import handlers as notification_handlers
 from app.contexts.audit import handlers as audit_handlers
 
+from app.contexts.audit.buffer import audit_buffer
+from app.contexts.audit.retention import audit_retention
+from app.contexts.notification.dispatcher import notification_dispatcher
+from app.contexts.notification.template_registry import template_registry
+from app.contexts.auth.hashing import password_hasher
+from app.contexts.auth.revocation import session_revocations
+
+from app.contexts.seat_availability.stream import seat_map_fanout
+from app.contexts.seat_availability.worker import seat_expiration_scheduler
+from app.contexts.reservation.worker import reservation_expiration_scheduler
+
+from app.shared.outbox.relay import outbox_relay
+
 # Set up logging FIRST (before creating app)
 setup_logging(log_level='DEBUG')
 logger = logging.getLogger(__name__)
@@ -44,7 +61,11 @@ app = FastAPI(
 )
 
 # Add middleware (ORDER MATTERS - RequestLogging should be first)
-app.add_middleware(RequestLoggingMiddleware)
+app.add_middleware(
+    RequestLoggingMiddleware,
+    slow_threshold_seconds=settings.REQUEST_SLOW_THRESHOLD_SECONDS,
+    sample_rate=settings.REQUEST_LOG_SAMPLE_RATE,
+)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.ALLOWED_ORIGINS,
@@ -80,6 +101,19 @@ async def startup_event():
             logger.info(f"  {methods:10} {route.path}")
     
     logger.info("All event handlers registered")
+
+    # Deliver committed domain events from the outbox
+    outbox_relay.start()
+    session_revocations.start()
+    audit_buffer.start()
+    audit_retention.start()
+    template_registry.load()
+    notification_dispatcher.start()
+    seat_expiration_scheduler.start()
+    seat_map_fanout.start()
+    broadcast.start()
+    reservation_expiration_scheduler.start()
+
     logger.info("System ready to accept requests")
 
 
@@ -88,6 +122,23 @@ async def shutdown_event():
     """Log shutdown"""
     logger.info("Cinema Booking System shutting down...")
 
+    await session_revocations.stop()
+    await audit_retention.stop()
+    await seat_expiration_scheduler.stop()
+    await broadcast.stop()
+    await reservation_expiration_scheduler.stop()
+    await outbox_relay.stop()
+
+    # Let queued event handlers finish before the process exits
+    await event_bus.drain(timeout=settings.EVENT_DRAIN_TIMEOUT_SECONDS)
+
+    # Send queued emails, then write audit entries still waiting in the buffer
+    await notification_dispatcher.stop()
+    await audit_buffer.stop()
+
+    password_hasher.shutdown()
+    await async_engine.dispose()
+
 
 @app.get("/")
 def root():
@@ -106,5 +157,9 @@ def health_check():
     return {
         "status": "healthy",
         "service": settings.PROJECT_NAME,
-        "timestamp": "2024-12-27T12:00:00Z"
+        "timestamp": "2024-12-27T12:00:00Z",
+        "event_bus": event_bus.metrics(),
+        "audit_buffer": audit_buffer.metrics(),
+        "notifications": notification_dispatcher.metrics(),
+        "password_hasher": password_hasher.metrics(),
     }
\ No newline at end of file
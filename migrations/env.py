@@ -26,6 +26,7 @@ import app.contexts.refund.models
 import app.contexts.audit.models
 import app.contexts.auth.models
 import app.contexts.user.models
+import app.shared.outbox.models
 
 # target metadata for Alembic
 target_metadata = Base.metadata
@@ -0,0 +1,34 @@
+"""add reservation expiry index
+
+Revision ID: 3b8e61f0a7c2
+Revises: e42b14c97e09
+Create Date: 2026-10-17 14:03:27.906114
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b8e61f0a7c2'
+down_revision: Union[str, Sequence[str], None] = 'e42b14c97e09'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'idx_reservation_active_expires',
+        'reservations',
+        ['expires_at'],
+        unique=False,
+        postgresql_where=sa.text("status = 'ACTIVE'"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_reservation_active_expires', table_name='reservations')
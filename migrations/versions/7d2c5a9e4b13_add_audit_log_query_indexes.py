@@ -0,0 +1,39 @@
+"""add audit log query indexes
+
+Revision ID: 7d2c5a9e4b13
+Revises: 3b8e61f0a7c2
+Create Date: 2026-10-17 16:21:48.530917
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7d2c5a9e4b13'
+down_revision: Union[str, Sequence[str], None] = '3b8e61f0a7c2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_audit_logs_created_at_id', 'audit_logs', ['created_at', 'id'], unique=False)
+    op.create_index('ix_audit_logs_actor_created', 'audit_logs', ['actor_id', 'created_at', 'id'], unique=False)
+    op.create_index('ix_audit_logs_action_created', 'audit_logs', ['action', 'created_at', 'id'], unique=False)
+    op.create_index(
+        'ix_audit_logs_target_created',
+        'audit_logs',
+        ['target_type', 'target_id', 'created_at', 'id'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_audit_logs_target_created', table_name='audit_logs')
+    op.drop_index('ix_audit_logs_action_created', table_name='audit_logs')
+    op.drop_index('ix_audit_logs_actor_created', table_name='audit_logs')
+    op.drop_index('ix_audit_logs_created_at_id', table_name='audit_logs')
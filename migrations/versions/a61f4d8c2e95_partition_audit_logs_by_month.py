@@ -0,0 +1,122 @@
+"""partition audit_logs by month
+
+Revision ID: a61f4d8c2e95
+Revises: 7d2c5a9e4b13
+Create Date: 2026-10-17 17:48:05.214663
+
+"""
+from datetime import date, datetime, timezone
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a61f4d8c2e95'
+down_revision: Union[str, Sequence[str], None] = '7d2c5a9e4b13'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Months created ahead of today (app.contexts.audit.retention keeps this topped up)
+PREMAKE_MONTHS = 3
+
+COLUMNS = "id, actor_id, actor_type, action, target_id, target_type, payload, request_id, created_at"
+
+INDEXES = [
+    ('ix_audit_logs_id', ['id']),
+    ('ix_audit_logs_created_at_id', ['created_at', 'id']),
+    ('ix_audit_logs_actor_created', ['actor_id', 'created_at', 'id']),
+    ('ix_audit_logs_action_created', ['action', 'created_at', 'id']),
+    ('ix_audit_logs_target_created', ['target_type', 'target_id', 'created_at', 'id']),
+]
+
+
+def _add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _drop_indexes(table: str) -> None:
+    for name, _ in INDEXES:
+        op.drop_index(name, table_name=table)
+
+
+def _create_indexes() -> None:
+    for name, columns in INDEXES:
+        op.create_index(name, 'audit_logs', columns, unique=False)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    conn = op.get_bind()
+
+    op.rename_table('audit_logs', 'audit_logs_unpartitioned')
+    op.execute("ALTER TABLE audit_logs_unpartitioned RENAME CONSTRAINT audit_logs_pkey TO audit_logs_unpartitioned_pkey")
+    _drop_indexes('audit_logs_unpartitioned')
+
+    # The partition key has to be part of the primary key
+    op.execute("""
+        CREATE TABLE audit_logs (
+            id INTEGER NOT NULL DEFAULT nextval('audit_logs_id_seq'),
+            actor_id INTEGER NOT NULL,
+            actor_type VARCHAR NOT NULL,
+            action VARCHAR NOT NULL,
+            target_id INTEGER NOT NULL,
+            target_type VARCHAR NOT NULL,
+            payload JSON NOT NULL,
+            request_id INTEGER,
+            created_at TIMESTAMP WITH TIME ZONE NOT NULL,
+            CONSTRAINT audit_logs_pkey PRIMARY KEY (id, created_at)
+        ) PARTITION BY RANGE (created_at)
+    """)
+    op.execute("ALTER SEQUENCE audit_logs_id_seq OWNED BY audit_logs.id")
+
+    # One partition per UTC month, from the oldest entry to a few months ahead
+    oldest = conn.execute(sa.text("SELECT min(created_at) FROM audit_logs_unpartitioned")).scalar()
+    today = datetime.now(timezone.utc).date()
+    month = (oldest.astimezone(timezone.utc).date() if oldest else today).replace(day=1)
+    last = _add_months(today.replace(day=1), PREMAKE_MONTHS)
+
+    while month <= last:
+        end = _add_months(month, 1)
+        op.execute(
+            f"CREATE TABLE audit_logs_p{month:%Y_%m} PARTITION OF audit_logs "
+            f"FOR VALUES FROM ('{month:%Y-%m-%d} 00:00:00+00') TO ('{end:%Y-%m-%d} 00:00:00+00')"
+        )
+        month = end
+    op.execute("CREATE TABLE audit_logs_default PARTITION OF audit_logs DEFAULT")
+
+    op.execute(f"INSERT INTO audit_logs ({COLUMNS}) SELECT {COLUMNS} FROM audit_logs_unpartitioned")
+    op.drop_table('audit_logs_unpartitioned')
+
+    # Created on the parent: every partition gets its own copy
+    _create_indexes()
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.rename_table('audit_logs', 'audit_logs_partitioned')
+    op.execute("ALTER TABLE audit_logs_partitioned RENAME CONSTRAINT audit_logs_pkey TO audit_logs_partitioned_pkey")
+    _drop_indexes('audit_logs_partitioned')
+
+    op.execute("""
+        CREATE TABLE audit_logs (
+            id INTEGER NOT NULL DEFAULT nextval('audit_logs_id_seq'),
+            actor_id INTEGER NOT NULL,
+            actor_type VARCHAR NOT NULL,
+            action VARCHAR NOT NULL,
+            target_id INTEGER NOT NULL,
+            target_type VARCHAR NOT NULL,
+            payload JSON NOT NULL,
+            request_id INTEGER,
+            created_at TIMESTAMP WITH TIME ZONE NOT NULL,
+            CONSTRAINT audit_logs_pkey PRIMARY KEY (id)
+        )
+    """)
+    op.execute("ALTER SEQUENCE audit_logs_id_seq OWNED BY audit_logs.id")
+
+    op.execute(f"INSERT INTO audit_logs ({COLUMNS}) SELECT {COLUMNS} FROM audit_logs_partitioned")
+    op.drop_table('audit_logs_partitioned')  # Drops every partition with it
+
+    _create_indexes()
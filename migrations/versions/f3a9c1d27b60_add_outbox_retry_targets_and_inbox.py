@@ -0,0 +1,38 @@
+"""add outbox retry targets and processed events inbox
+
+Revision ID: f3a9c1d27b60
+Revises: c83e0b5f71d4
+Create Date: 2026-10-17 21:05:13.402771
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3a9c1d27b60'
+down_revision: Union[str, Sequence[str], None] = 'c83e0b5f71d4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('outbox_events', sa.Column('pending_handlers', sa.JSON(), nullable=True))
+
+    op.create_table('processed_events',
+    sa.Column('consumer', sa.String(length=64), nullable=False),
+    sa.Column('event_key', sa.String(length=192), nullable=False),
+    sa.Column('processed_at', sa.DateTime(timezone=True), nullable=False),
+    sa.PrimaryKeyConstraint('consumer', 'event_key')
+    )
+    op.create_index('idx_processed_events_processed_at', 'processed_events', ['processed_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_processed_events_processed_at', table_name='processed_events')
+    op.drop_table('processed_events')
+    op.drop_column('outbox_events', 'pending_handlers')
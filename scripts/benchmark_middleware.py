@@ -0,0 +1,146 @@
+"""
+Benchmark the per-request overhead of the request logging middleware.
+
+Calls each stack directly through ASGI (no server, no sockets) with a
+trivial endpoint, so the difference between stacks is the middleware
+itself. "legacy" is the previous BaseHTTPMiddleware implementation,
+reproduced here for comparison. Log records are formatted and dropped.
+
+Usage:
+    python scripts/benchmark_middleware.py [--requests 20000] [--sample-rate 1.0]
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from app.core.logging_config import set_request_id
+from app.core.middleware import RequestLoggingMiddleware
+
+logger = logging.getLogger("app.core.middleware")
+
+
+class LegacyRequestLoggingMiddleware(BaseHTTPMiddleware):
+    """The BaseHTTPMiddleware version: two log lines per request."""
+
+    async def dispatch(self, request, call_next):
+        request_id = set_request_id()
+        start_time = time.time()
+        method = request.method
+        path = request.url.path
+        client_host = request.client.host if request.client else "unknown"
+
+        logger.info(
+            f"→ {method} {path}",
+            extra={
+                'request_id': request_id,
+                'method': method,
+                'path': path,
+                'client': client_host,
+                'query_params': dict(request.query_params),
+            }
+        )
+
+        response = await call_next(request)
+        duration = time.time() - start_time
+        logger.info(
+            f"← {method} {path} → {response.status_code} ({duration:.3f}s)",
+            extra={
+                'request_id': request_id,
+                'method': method,
+                'path': path,
+                'status_code': response.status_code,
+                'duration': duration,
+            }
+        )
+        response.headers['X-Request-ID'] = request_id
+        return response
+
+
+async def endpoint(scope, receive, send):
+    await send({"type": "http.response.start", "status": 200, "headers": [(b"content-type", b"application/json")]})
+    await send({"type": "http.response.body", "body": b'{"status":"ok"}'})
+
+
+SCOPE = {
+    "type": "http",
+    "asgi": {"version": "3.0"},
+    "http_version": "1.1",
+    "method": "GET",
+    "scheme": "http",
+    "path": "/showtimes/42/seats",
+    "raw_path": b"/showtimes/42/seats",
+    "root_path": "",
+    "query_string": b"include=pricing&format=IMAX_2D",
+    "headers": [(b"host", b"localhost"), (b"accept", b"application/json")],
+    "client": ("127.0.0.1", 50000),
+    "server": ("localhost", 8000),
+}
+
+
+async def receive():
+    return {"type": "http.request", "body": b"", "more_body": False}
+
+
+async def send(message):
+    pass
+
+
+async def run(app, requests: int) -> float:
+    """Seconds per request, best of five rounds."""
+    for _ in range(200):  # Warm-up
+        await app(dict(SCOPE), receive, send)
+
+    best = float("inf")
+    for _ in range(5):
+        started = time.perf_counter()
+        for _ in range(requests):
+            await app(dict(SCOPE), receive, send)
+        best = min(best, (time.perf_counter() - started) / requests)
+    return best
+
+
+class FormatAndDrop(logging.Handler):
+    """Pays for formatting a record like a real handler, writes nothing."""
+
+    def emit(self, record):
+        self.format(record)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=20_000)
+    parser.add_argument("--sample-rate", type=float, default=1.0)
+    args = parser.parse_args()
+
+    logger.handlers = [FormatAndDrop()]
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+    stacks = [
+        ("bare endpoint", endpoint),
+        ("legacy", LegacyRequestLoggingMiddleware(endpoint)),
+        ("asgi", RequestLoggingMiddleware(endpoint, sample_rate=args.sample_rate)),
+    ]
+
+    print(f"Requests:       {args.requests}")
+    print(f"Sample rate:    {args.sample_rate}")
+    baseline = None
+    for label, app in stacks:
+        per_request_us = asyncio.run(run(app, args.requests)) * 1_000_000
+        if baseline is None:
+            baseline = per_request_us
+        print(f"\n[{label}]")
+        print(f"Per request:    {per_request_us:.2f} µs")
+        print(f"Overhead:       {per_request_us - baseline:.2f} µs")
+
+
+if __name__ == "__main__":
+    main()
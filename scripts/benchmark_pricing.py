@@ -0,0 +1,165 @@
+"""
+Benchmark PricingService.calculate_price with the compiled pricing pipeline.
+
+Runs fully in-process: the pipeline is compiled from in-memory modifiers
+and calculate_price is handed a session that fails on any use, so every
+timed call is proven to run without a query.
+
+The pipeline memoizes matches per context, so targeted pricing is timed
+over a varied set of contexts (rows, seat types, formats, showtimes):
+"cold" prices each one once on a freshly compiled pipeline, "warm"
+cycles through them again once they are all memoized.
+
+Usage:
+    python scripts/benchmark_pricing.py [--modifiers 20] [--contexts 5000] [--iterations 200000]
+"""
+
+import argparse
+import itertools
+import os
+import sys
+import time
+import timeit
+from datetime import datetime, timedelta, timezone
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import app.core.database  # noqa: F401  (registers every mapped model)
+from app.contexts.pricing.engine import (
+    MAX_MEMOIZED_CONTEXTS,
+    CompiledPricingPipeline,
+    PricingContext,
+    pricing_engine,
+)
+from app.contexts.pricing.models import PriceModifier
+from app.contexts.pricing.service import PricingService
+
+
+class NoQuerySession:
+    """Stands in for a Session; any attribute access means a query was attempted."""
+
+    def __getattr__(self, name):
+        raise AssertionError(f"calculate_price touched the database (Session.{name})")
+
+
+TARGETS = [
+    None,
+    {"formats": ["IMAX_2D", "IMAX_3D"]},
+    {"rows": ["A", "B"], "seat_types": ["vip"]},
+    {"weekdays": [5, 6]},
+    {"time_window": {"start": "10:00", "end": "14:00"}},
+    {"screen_ids": [3], "movie_ids": [7]},
+]
+
+
+def build_modifiers(count: int) -> list:
+    """Mix of untargeted and targeted modifiers."""
+    return [
+        PriceModifier(
+            name=f"modifier-{i}",
+            modifier_type="additive" if i % 2 else "multiplicative",
+            amount=50.0 if i % 2 else 1.01,
+            is_active=True,
+            applies_to=TARGETS[i % len(TARGETS)],
+        )
+        for i in range(count)
+    ]
+
+
+def build_contexts(count: int) -> list:
+    """Distinct seat contexts spread over formats, screens, movies, showtimes, rows and seat types."""
+    first_showtime = datetime(2026, 10, 12, 9, 0, tzinfo=timezone.utc)  # Monday
+    combinations = itertools.product(
+        range(28),  # Showtimes: every 6 hours for a week
+        ["IMAX_2D", "IMAX_3D", "STANDARD_2D", "STANDARD_3D"],
+        [1, 2, 3],  # Screens
+        [5, 6, 7],  # Movies
+        "ABCDEFGHJKLM",  # Rows
+        ["standard", "vip", "accessible"],
+    )
+    return [
+        PricingContext.for_showtime(
+            format=format,
+            screen_id=screen_id,
+            movie_id=movie_id,
+            start_time=first_showtime + timedelta(hours=6 * slot),
+            row=row,
+            seat_type=seat_type,
+        )
+        for slot, format, screen_id, movie_id, row, seat_type in itertools.islice(combinations, count)
+    ]
+
+
+def time_cold(service, db, modifiers: list, contexts: list) -> float:
+    """Seconds per call on a fresh pipeline, every context priced for the first time (best of five)."""
+    best = float("inf")
+    for _ in range(5):
+        pricing_engine.install(CompiledPricingPipeline(modifiers))
+        started = time.perf_counter()
+        for ctx in contexts:
+            service.calculate_price(db, ctx)
+        best = min(best, (time.perf_counter() - started) / len(contexts))
+    return best
+
+
+def time_warm(service, db, contexts: list, iterations: int) -> float:
+    """Seconds per call cycling through contexts that are all memoized (best of five)."""
+    for ctx in contexts:
+        service.calculate_price(db, ctx)
+
+    rounds = max(iterations // len(contexts), 1)
+
+    def run():
+        for ctx in contexts:
+            service.calculate_price(db, ctx)
+
+    return min(timeit.repeat(run, number=rounds, repeat=5)) / (rounds * len(contexts))
+
+
+def report(label: str, seconds_per_call: float) -> None:
+    per_call_us = seconds_per_call * 1_000_000
+    print(f"Per order ({label}): {per_call_us:.2f} µs")
+    print(f"Orders/s ({label}):  {1_000_000 / per_call_us:,.0f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--modifiers", type=int, default=20)
+    parser.add_argument("--contexts", type=int, default=5_000)
+    parser.add_argument("--iterations", type=int, default=200_000)
+    args = parser.parse_args()
+
+    # Beyond the memo size the warm numbers would include evictions
+    modifiers = build_modifiers(args.modifiers)
+    contexts = build_contexts(min(args.contexts, MAX_MEMOIZED_CONTEXTS))
+    pricing_engine.install(CompiledPricingPipeline(modifiers))
+    pricing_engine.ttl_seconds = float("inf")
+
+    service = PricingService()
+    db = NoQuerySession()
+
+    print(f"Modifiers:      {args.modifiers}")
+    print(f"Contexts:       {len(contexts)}")
+    print(f"Iterations:     {args.iterations}")
+
+    result = service.calculate_price(db, None)
+    best = min(timeit.repeat(lambda: service.calculate_price(db, None), number=args.iterations, repeat=5))
+    print("\n[untargeted]")
+    print(f"Applied:        {len(result.modifiers_applied)}")
+    print(f"Final price:    {result.final_price:.2f}")
+    report("warm", best / args.iterations)
+
+    cold = time_cold(service, db, modifiers, contexts)
+    warm = time_warm(service, db, contexts, args.iterations)
+    applied = [len(service.calculate_price(db, ctx).modifiers_applied) for ctx in contexts]
+    prices = {round(service.calculate_price(db, ctx).final_price, 2) for ctx in contexts}
+    print("\n[targeted]")
+    print(f"Applied:        {min(applied)}-{max(applied)}")
+    print(f"Prices:         {len(prices)} distinct")
+    report("cold", cold)
+    report("warm", warm)
+    print("\nQueries:        0")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Two-worker test for the live seat map fan-out.
+
+Runs two "workers" in one process against DATABASE_URL, each with its own
+broadcast listener (LISTEN connection), seat grid cache and seat map
+broadcaster. Worker A handles a seat event; worker B must then
+
+- stream it to its client as delta seq 1, and
+- serve a resync snapshot stamped seq 1 that already shows the change
+  (snapshots read the worker's grid cache, not the database).
+
+Needs a reachable Postgres; nothing is written to any table.
+
+Usage:
+    python scripts/test_seat_stream_fanout.py
+"""
+
+import asyncio
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from app.core.broadcast import BROADCAST_POSTGRES, Broadcast
+from app.contexts.screen.layout_index import CompiledSeatLayout
+from app.contexts.seat_availability.grid_cache import SeatGridCache
+from app.contexts.seat_availability.models import StatusEnum
+from app.contexts.seat_availability.stream import RESYNC, SeatMapBroadcaster, SeatMapFanout
+
+SHOWTIME_ID = 0  # Not a real showtime: other processes on the channel ignore it
+LAYOUT = CompiledSeatLayout(0, [("A", ["A-1", "A-2", "A-3"])])
+
+
+class Worker:
+    def __init__(self, name: str):
+        self.name = name
+        self.bus = Broadcast(mode=BROADCAST_POSTGRES, reconnect_seconds=1.0)
+        self.grid_cache = SeatGridCache()
+        self.broadcaster = SeatMapBroadcaster(coalesce_seconds=0.01, queue_size=10)
+        self.fanout = SeatMapFanout(self.broadcaster, self.grid_cache, self.bus)
+
+    async def start(self) -> None:
+        self.fanout.start()
+        self.bus.start()
+        for _ in range(100):
+            if self.bus.listening:
+                return
+            await asyncio.sleep(0.05)
+        raise RuntimeError(f"worker {self.name} could not LISTEN (is Postgres reachable?)")
+
+    def load_grid(self) -> None:
+        """What a /grid or snapshot read leaves in the cache: every seat AVAILABLE."""
+        generation = self.grid_cache.generation(SHOWTIME_ID)
+        self.grid_cache.put(SHOWTIME_ID, LAYOUT, [], generation)
+
+    def snapshot(self) -> dict:
+        """The body of a resync snapshot, as stream_route builds it."""
+        seq = self.broadcaster.seq(SHOWTIME_ID)
+        grid = self.grid_cache.get(SHOWTIME_ID)
+        seats = grid.to_grid() if grid is not None else None
+        return {"seq": seq, "seats": seats}
+
+
+def check(condition: bool, message: str) -> bool:
+    print(f"{'✓' if condition else '✗'} {message}")
+    return condition
+
+
+async def next_message(subscriber) -> object:
+    """Skip the RESYNC markers sent when the listener (re)connects."""
+    while True:
+        message = await asyncio.wait_for(subscriber.queue.get(), timeout=5)
+        if message is not RESYNC:
+            return message
+
+
+async def main() -> bool:
+    worker_a, worker_b = Worker("A"), Worker("B")
+    await worker_a.start()
+    await worker_b.start()
+
+    try:
+        client = worker_b.broadcaster.subscribe(SHOWTIME_ID)
+        worker_b.load_grid()
+
+        # Worker A handles seat.locked for A-2
+        await worker_a.fanout.publish(SHOWTIME_ID, ["A-2"], StatusEnum.LOCKED)
+
+        message = await next_message(client)
+        delta = json.loads(message.split("data: ", 1)[1])
+        ok = check(delta == {"seq": 1, "changes": {StatusEnum.LOCKED.value: ["A-2"]}}, f"worker B streamed the delta: {delta}")
+
+        # The client resyncs after the delta: it keeps deltas above the snapshot's seq
+        snapshot = worker_b.snapshot()
+        ok &= check(snapshot["seq"] == 1, f"snapshot is stamped seq {snapshot['seq']}")
+        statuses = {seat["seat_code"]: seat["status"] for seat in snapshot["seats"] or []}
+        ok &= check(statuses.get("A-2") == StatusEnum.LOCKED.value, f"snapshot shows A-2 as {statuses.get('A-2')}")
+        return ok
+    finally:
+        await worker_a.bus.stop()
+        await worker_b.bus.stop()
+
+
+if __name__ == "__main__":
+    sys.exit(0 if asyncio.run(main()) else 1)